@@ -16,8 +16,10 @@ signal.signal(signal.SIGTERM, ignorer)
 if hasattr(signal, 'SIGBREAK'):
     signal.signal(signal.SIGBREAK, ignorer)
 
+log('Starting non-terminable process.')
+# Notify file is created only after stdout has been written.
 with open(sys.argv[1], 'w') as notify:
-    log('Starting non-terminable process.', notify)
+    notify.write('Starting non-terminable process.\n')
 
 
 while True:
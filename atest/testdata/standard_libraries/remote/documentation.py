@@ -1,16 +1,23 @@
 import sys
-from SimpleXMLRPCServer import SimpleXMLRPCServer
+from SimpleXMLRPCServer import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
 
 from remoteserver import announce_port
 
 
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+
 class Documentation(SimpleXMLRPCServer):
+    """Supports `system.multicall` and keeps connections open."""
 
     def __init__(self, port=8270, port_file=None):
-        SimpleXMLRPCServer.__init__(self, ('127.0.0.1', int(port)))
+        SimpleXMLRPCServer.__init__(self, ('127.0.0.1', int(port)),
+                                    KeepAliveRequestHandler)
         self.register_function(self.get_keyword_names)
         self.register_function(self.get_keyword_documentation)
         self.register_function(self.run_keyword)
+        self.register_multicall_functions()
         announce_port(self.socket, port_file)
         self.serve_forever()
 
@@ -1,4 +1,5 @@
 import inspect
+import os
 import sys
 from SimpleXMLRPCServer import SimpleXMLRPCServer
 
@@ -60,5 +61,7 @@ def announce_port(socket, port_file=None):
     sys.stdout.write('Remote server starting on port %s.\n' % port)
     sys.stdout.flush()
     if port_file:
-        with open(port_file, 'w') as f:
+        # Written atomically so that the file is never seen empty.
+        with open(port_file + '.tmp', 'w') as f:
             f.write(str(port))
+        os.rename(port_file + '.tmp', port_file)
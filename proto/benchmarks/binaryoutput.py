@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""Benchmark for reading output XML and binary output files.
+
+Usage: binaryoutput.py [tests] [keywords]
+
+Creates a keyword heavy output having the given number of tests (default
+2000) each having the given number of keywords (default 20) with nested
+keywords and messages. Saves it both as output XML and in the binary format
+and reports the sizes of the files and how long reading them takes.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, getsize, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.api import ExecutionResult
+from robot.result.executionresult import Result
+
+
+def create_result(tests, keywords):
+    result = Result()
+    suite = result.suite
+    suite.name = 'Benchmark'
+    suite.starttime = '20141001 12:00:00.000'
+    suite.endtime = '20141001 13:00:00.000'
+    millis = 0
+    for test_index in xrange(tests):
+        test = suite.tests.create(name='Test %d' % test_index,
+                                  doc='Documentation of test %d.' % test_index,
+                                  tags=['tag-%d' % (test_index % 10), 'smoke'])
+        for kw_index in xrange(keywords):
+            kw = test.keywords.create(name='Resource.Keyword %d' % kw_index,
+                                      doc='Does something useful.',
+                                      args=('${arg}', 'value %d' % kw_index))
+            for name, args in [('BuiltIn.Log', ('Message %d' % test_index,)),
+                               ('BuiltIn.Should Be Equal', ('${x}', '1'))]:
+                inner = kw.keywords.create(name=name, args=args,
+                                           doc='Keyword from BuiltIn.')
+                inner.messages.create('Message %d' % test_index, 'INFO',
+                                      timestamp=timestamp(millis))
+                set_status(inner, millis, millis + 1)
+                millis += 2
+            set_status(kw, millis - 4, millis)
+        set_status(test, millis - 4 * keywords, millis)
+    return result
+
+
+def timestamp(millis):
+    return '20141001 12:%02d:%02d.%03d' % (millis // 60000 % 60,
+                                           millis // 1000 % 60, millis % 1000)
+
+
+def set_status(item, start, end):
+    item.status = 'PASS'
+    item.starttime = timestamp(start)
+    item.endtime = timestamp(end)
+
+
+def benchmark(name, path):
+    start = time.time()
+    ExecutionResult(path)
+    print '%-8s %10.1f kB %8.2f s' % (name, getsize(path) / 1024.0,
+                                      time.time() - start)
+
+
+if __name__ == '__main__':
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    keywords = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    directory = tempfile.mkdtemp()
+    xml = join(directory, 'output.xml')
+    binary = join(directory, 'output.rbin')
+    try:
+        result = create_result(tests, keywords)
+        result.save(xml)
+        result.save(binary)
+        del result
+        benchmark('xml', xml)
+        benchmark('binary', binary)
+    finally:
+        for path in xml, binary:
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(directory)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""Benchmark for finding user keywords with embedded arguments.
+
+Usage: embedded_args.py [lookups]
+
+Creates resource files with increasing number of embedded argument keywords
+and reports how long finding keywords from them takes on average.
+"""
+
+import sys
+import timeit
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.parsing.model import UserKeyword
+from robot.running.userkeyword import UserLibrary
+
+VERBS = ['clicks', 'selects', 'opens', 'closes', 'types', 'verifies',
+         'removes', 'adds', 'sees', 'waits for']
+OBJECTS = ['button', 'link', 'page', 'dialog', 'field', 'menu', 'item',
+           'list', 'table', 'row']
+
+
+def keyword_names(count):
+    for index in range(count):
+        verb = VERBS[index % len(VERBS)]
+        obj = OBJECTS[index // len(VERBS) % len(OBJECTS)]
+        yield 'User %s ${%s} in view %d' % (verb, obj, index)
+
+
+def benchmark(count, lookups):
+    names = list(keyword_names(count))
+    library = UserLibrary([UserKeyword(None, name) for name in names])
+    used = [name.replace('${', '').replace('}', '') for name in
+            names[::max(1, count // 10)]]
+    def lookup():
+        for name in used:
+            library.get_handler(name)
+    time = timeit.timeit(lookup, number=lookups) / lookups / len(used)
+    print '%6d templates: %8.1f us per lookup' % (count, time * 1e6)
+
+
+if __name__ == '__main__':
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    for count in 10, 100, 1000, 2500, 10000:
+        benchmark(count, lookups)
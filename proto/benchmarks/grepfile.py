@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Benchmark for `Grep File` keyword of the OperatingSystem library.
+
+Usage: grepfile.py [megabytes] [pattern]
+
+Creates a log file of the given size (default 200 MB) and greps it with
+the given pattern (default `ERROR*timeout`) using `Grep File` and using
+the old approach of decoding and matching all lines. Reports elapsed times
+and the peak memory usage of the process after each run.
+"""
+
+import codecs
+import fnmatch
+import os
+import resource
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.libraries.OperatingSystem import OperatingSystem
+
+
+LEVELS = ['INFO'] * 20 + ['DEBUG'] * 10 + ['WARN'] * 3 + ['ERROR']
+
+
+def create_log(path, megabytes):
+    with open(path, 'wb') as log:
+        line = 0
+        while log.tell() < megabytes * 1024 * 1024:
+            level = LEVELS[line % len(LEVELS)]
+            log.write('2014-01-01 12:00:%02d.%03d %-5s [worker-%d] Request '
+                      '%d to h\xc3\xa4st.example.com handled in %d ms%s\n'
+                      % (line % 60, line % 1000, level, line % 8, line,
+                         line % 500, ': timeout' if line % 7 == 0 else ''))
+            line += 1
+
+
+def old_grep_file(path, pattern):
+    pattern = '*%s*' % pattern
+    with codecs.open(path, encoding='UTF-8') as f:
+        return '\n'.join(line.rstrip('\r\n') for line in f.readlines()
+                         if fnmatch.fnmatchcase(line.rstrip('\r\n'), pattern))
+
+
+def measure(name, function, *args):
+    start = time.time()
+    result = function(*args)
+    print '%-10s %8.2f s %8d matches %8.1f MB peak memory' \
+        % (name, time.time() - start, result.count('\n') + bool(result),
+           resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0)
+
+
+if __name__ == '__main__':
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pattern = sys.argv[2] if len(sys.argv) > 2 else 'ERROR*timeout'
+    path = join(tempfile.mkdtemp(), 'app.log')
+    try:
+        create_log(path, megabytes)
+        library = OperatingSystem()
+        library._info = lambda msg: None
+        library._link = lambda msg, *paths: None
+        measure('Grep File', library.grep_file, path, pattern)
+        measure('old', old_grep_file, path, pattern)
+    finally:
+        os.remove(path)
+        os.rmdir(dirname(path))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""Micro-benchmarks for `robot.utils.NormalizedDict`.
+
+Usage: normalizeddict.py [rounds]
+
+Runs workloads similar to how variables, library keywords and suite metadata
+use normalized dictionaries and reports the best time of the given number of
+rounds. Run the script in different checkouts to compare implementations.
+"""
+
+import sys
+import timeit
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.utils import NormalizedDict
+from robot.variables import Variables
+
+
+VARIABLES = ['${Variable Number %d}' % i for i in range(200)]
+KEYWORDS = ['Library Keyword Number %d' % i for i in range(200)]
+METADATA = [('Meta %d' % i, 'Value %d' % i) for i in range(10)]
+
+
+def variable_lookup():
+    variables = Variables()
+    for name in VARIABLES:
+        variables[name] = name
+    def lookup():
+        for name in VARIABLES:
+            variables[name]
+            variables.contains(name)
+    return lookup
+
+
+def keyword_lookup():
+    handlers = NormalizedDict(ignore=['_'])
+    for name in KEYWORDS:
+        handlers[name] = name
+    names = [name.lower().replace(' ', '_') for name in KEYWORDS]
+    def lookup():
+        for name in names:
+            name in handlers
+            handlers[name]
+    return lookup
+
+
+def metadata_iteration():
+    metadata = NormalizedDict(METADATA)
+    def iterate():
+        for _ in range(100):
+            for name, value in metadata.items():
+                pass
+    return iterate
+
+
+def creation():
+    def create():
+        metadata = NormalizedDict()
+        for name, value in METADATA:
+            metadata[name] = value
+        metadata.copy()
+    return create
+
+
+def benchmark(name, workload, rounds):
+    times = timeit.repeat(workload(), number=100, repeat=rounds)
+    print '%-20s %8.2f ms' % (name, min(times) * 10)
+
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for name, workload in [('variable lookup', variable_lookup),
+                           ('keyword lookup', keyword_lookup),
+                           ('metadata iteration', metadata_iteration),
+                           ('creation', creation)]:
+        benchmark(name, workload, rounds)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""Benchmark for capturing output of library keywords.
+
+Usage: outputcapture.py [keywords]
+
+Reports how many keywords per second can be run when their output is
+captured using reusable streams and when using new `StringIO` objects for
+each keyword like earlier versions did. Runs the given number (default
+100000) of keywords that write nothing and keywords that write one line.
+"""
+
+import sys
+import time
+from StringIO import StringIO
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.output import LOGGER
+from robot.running.outputcapture import JavaCapturer, OutputCapturer
+from robot.utils import decode_output
+
+LOGGER.disable_automatic_console_logger()
+
+
+class StringIOCapturer(OutputCapturer):
+    """How output was captured before reusable streams."""
+
+    def __init__(self, library_import=False):
+        self._library_import = library_import
+        self._python_out = StringIOStream(stdout=True)
+        self._python_err = StringIOStream(stdout=False)
+        self._java_out = JavaCapturer(stdout=True)
+        self._java_err = JavaCapturer(stdout=False)
+
+    def _release(self):
+        stdout = self._python_out.release() + self._java_out.release()
+        stderr = self._python_err.release() + self._java_err.release()
+        return stdout, stderr
+
+
+class StringIOStream(object):
+
+    def __init__(self, stdout=True):
+        if stdout:
+            self._original = sys.stdout
+            self._set_stream = self._set_stdout
+        else:
+            self._original = sys.stderr
+            self._set_stream = self._set_stderr
+        self._stream = StringIO()
+        self._set_stream(self._stream)
+
+    def _set_stdout(self, stream):
+        sys.stdout = stream
+
+    def _set_stderr(self, stream):
+        sys.stderr = stream
+
+    def release(self):
+        self._set_stream(self._original)
+        try:
+            return decode_output(self._stream.getvalue())
+        finally:
+            self._stream.close()
+
+
+def silent():
+    pass
+
+
+def writing():
+    print 'Hello, world!'
+
+
+def run_keywords(capturer, keyword, count):
+    for index in xrange(count):
+        with capturer():
+            keyword()
+
+
+def benchmark(name, capturer, keyword, count):
+    start = time.time()
+    run_keywords(capturer, keyword, count)
+    print '%-20s %10d keywords/s' % (name, count / (time.time() - start))
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for keyword in silent, writing:
+        for capturer in StringIOCapturer, OutputCapturer:
+            benchmark('%s, %s' % (keyword.__name__,
+                                  'StringIO' if capturer is StringIOCapturer
+                                  else 'reusable'),
+                      capturer, keyword, count)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Benchmark for running processes with the Process library.
+
+Usage: processthroughput.py [processes] [megabytes]
+
+Reports how long running the given number (default 200) of short processes
+with a timeout takes when waiting for them using a background waiter and
+when polling them every 0.1 seconds like earlier versions did. Also reports
+how long running a process writing the given amount (default 100) of
+output takes when only the end of the output is kept in memory.
+"""
+
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.libraries.Process import Process
+from robot.output import LOGGER
+
+LOGGER.disable_automatic_console_logger()
+
+
+class PollingProcess(Process):
+
+    def _process_is_stopped(self, process, timeout):
+        max_time = time.time() + timeout
+        while time.time() <= max_time:
+            if process.poll() is not None:
+                return True
+            time.sleep(0.1)
+        return False
+
+
+def run_processes(library, count):
+    for index in xrange(count):
+        result = library.run_process(sys.executable, '-c', 'print %d' % index,
+                                     timeout='1 minute')
+        assert result.stdout == str(index), result.stdout
+
+
+def run_large_output(megabytes):
+    code = 'import sys\nfor i in xrange(%d): sys.stdout.write(%r)' \
+           % (megabytes * 1024, 'x' * 1023 + '\n')
+    result = Process().run_process(sys.executable, '-c', code,
+                                   max_output_size=1024 * 1024)
+    assert len(result.stdout) == 1024 * 1024 - 1, len(result.stdout)
+
+
+def benchmark(name, function, *args):
+    start = time.time()
+    function(*args)
+    print '%-20s %8.2f s' % (name, time.time() - start)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    megabytes = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    benchmark('polling', run_processes, PollingProcess(), count)
+    benchmark('waiter', run_processes, Process(), count)
+    benchmark('%d MB output' % megabytes, run_large_output, megabytes)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+"""Benchmark for the latency of Remote library calls.
+
+Usage: remotelatency.py [calls] [keywords]
+
+Starts a local stand-in remote server having the given number of keywords
+(default 100) and reports how long getting keyword names, arguments and
+documentation, and running a keyword the given number of times (default
+1000), takes using the Remote library with pooled keep-alive connections
+and with the default `xmlrpclib` transport. The server is run both so that
+it closes connections after each request and so that it keeps them open
+and supports `system.multicall`.
+"""
+
+import sys
+import threading
+import time
+import xmlrpclib
+from os.path import abspath, dirname, join
+from SimpleXMLRPCServer import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
+from SocketServer import ThreadingMixIn
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.libraries.Remote import CONNECTIONS, Remote
+
+
+class RequestHandler(SimpleXMLRPCRequestHandler):
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class KeepAliveRequestHandler(RequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+
+class StandInServer(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+    def __init__(self, keywords, keep_alive):
+        handler = KeepAliveRequestHandler if keep_alive else RequestHandler
+        SimpleXMLRPCServer.__init__(self, ('127.0.0.1', 0), handler,
+                                    logRequests=False)
+        self.keywords = ['Keyword %d' % index for index in range(keywords)]
+        self.register_function(lambda: self.keywords, 'get_keyword_names')
+        self.register_function(lambda name: ['arg', '*args'],
+                               'get_keyword_arguments')
+        self.register_function(lambda name: 'Documentation of %s.' % name,
+                               'get_keyword_documentation')
+        self.register_function(self.run_keyword)
+        if keep_alive:
+            self.register_multicall_functions()
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    @property
+    def uri(self):
+        return 'http://127.0.0.1:%d' % self.server_address[1]
+
+    def run_keyword(self, name, args, kwargs=None):
+        return {'status': 'PASS', 'return': ' '.join(args)}
+
+
+def measure(function):
+    start = time.time()
+    function()
+    return '%.3f s' % (time.time() - start)
+
+
+def remote_library(uri, calls, pooled=True):
+    library = Remote(uri)
+    if not pooled:
+        # How the library worked before pooled keep-alive connections and
+        # getting metadata using `system.multicall`.
+        library._client._server = xmlrpclib.ServerProxy(uri, encoding='UTF-8')
+        library._client._metadata = {}
+    def get_metadata():
+        for name in library.get_keyword_names():
+            library.get_keyword_arguments(name)
+            library.get_keyword_documentation(name)
+    def run_keywords():
+        for index in xrange(calls):
+            library.run_keyword('Keyword 1', ['argument', str(index)], {})
+    return get_metadata, run_keywords
+
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    keywords = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    print '%-24s %10s %10s' % ('', 'metadata', 'keywords')
+    for keep_alive in False, True:
+        server = StandInServer(keywords, keep_alive)
+        for pooled in False, True:
+            get_metadata, run_keywords = remote_library(server.uri, calls,
+                                                        pooled)
+            print '%-24s %10s %10s' % (
+                '%s, %s' % ('pooled' if pooled else 'xmlrpclib',
+                            'keep-alive' if keep_alive else 'close'),
+                measure(get_metadata), measure(run_keywords))
+        CONNECTIONS.close()
+        server.shutdown()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+"""Benchmark for merging re-run results with `rebot --rerunmerge`.
+
+Usage: rerunmerge.py [tests] [reruns]
+
+Creates an original result with the given number of tests (default 50000)
+in one flat suite and the given number of re-run results (default 5) each
+containing every tenth test. Reports how long merging all re-run results
+takes. Results are created in memory to measure only merging.
+"""
+
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.result import Result, TestSuite
+from robot.result.rerunmerger import ReRunMerger
+
+
+def create_result(names, status):
+    suite = TestSuite(name='Root')
+    suite.suites.create(name='Sub').tests = [
+        suite.test_class(name=name, status=status) for name in names]
+    return Result(root_suite=suite)
+
+
+if __name__ == '__main__':
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    names = ['Test %d' % i for i in range(tests)]
+    original = create_result(names, 'FAIL')
+    merged = [create_result(names[i::10], 'PASS') for i in range(reruns)]
+    start = time.time()
+    ReRunMerger(original).merge(merged)
+    print '%d tests, %d reruns: %.2f s' % (tests, reruns, time.time() - start)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Benchmark for compressing strings when building log and report models.
+
+Usage: stringcompression.py output.xml [processes]
+
+Builds the JavaScript model from the given output file using zlib
+compression levels 1, 6 and 9 in one process, and using the default level
+with 1 to the given number of processes (default 4). Reports the build time
+and the total size of strings in the model. Message heavy outputs show the
+difference best.
+"""
+
+import base64
+import sys
+import time
+import zlib
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.api import ExecutionResult
+from robot.reporting.jsmodelbuilders import JsModelBuilder
+from robot.reporting.parallel import ParallelCompressor, can_use_processes
+
+
+def level_compressor(level):
+    def compress(texts):
+        return [base64.b64encode(zlib.compress(text.encode('UTF-8'), level))
+                for text in texts]
+    return compress
+
+
+def benchmark(name, path, compressor):
+    result = ExecutionResult(path)
+    start = time.time()
+    model = JsModelBuilder(string_compressor=compressor).build_from(result)
+    elapsed = time.time() - start
+    size = sum(len(string) for string in model.strings)
+    print '%-20s %8.2f s %10.2f MB' % (name, elapsed, size / 1024.0 ** 2)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        sys.exit(__doc__)
+    path = sys.argv[1]
+    processes = int(sys.argv[2]) if len(sys.argv) == 3 else 4
+    for level in 1, 6, 9:
+        benchmark('level %d' % level, path, level_compressor(level))
+    for count in range(1, processes + 1):
+        if count == 1 or can_use_processes(count):
+            benchmark('%d process(es)' % count, path,
+                      ParallelCompressor(count) if count > 1 else None)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""Benchmark for tag statistics, filtering and criticality using tag patterns.
+
+Usage: tagstatistics.py [tests] [combined]
+
+Creates the given number of tests (default 100000) having five tags each and
+reports how long creating tag statistics with the given number of
+`--tagstatcombine` patterns (default 50) takes. Also reports time used by
+filtering tests by tags and by checking their criticality.
+"""
+
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.model import Criticality
+from robot.model.filter import Filter
+from robot.model.tagstatistics import TagStatisticsBuilder
+from robot.result import TestSuite
+
+
+def create_suite(tests):
+    suite = TestSuite(name='Root')
+    suite.tests = [suite.test_class(name='Test %d' % index, status='PASS',
+                                    tags=['feature-%d' % (index % 100),
+                                          'owner-%d' % (index % 7),
+                                          'id-%d' % index,
+                                          'smoke' if index % 3 else 'regression',
+                                          'priority %d' % (index % 4)])
+                   for index in range(tests)]
+    return suite
+
+
+def combined_patterns(count):
+    patterns = ['feature-%dANDowner-*' % index for index in range(count // 3)]
+    patterns += ['smokeNOTpriority%d' % index for index in range(count // 3)]
+    patterns += ['regression OR feature-%d*' % index
+                 for index in range(count - len(patterns))]
+    return [(pattern, None) for pattern in patterns]
+
+
+def measure(name, function):
+    start = time.time()
+    function()
+    print '%-20s %8.2f s' % (name, time.time() - start)
+
+
+def tag_statistics(suite, combined):
+    def build():
+        builder = TagStatisticsBuilder(Criticality(['smoke']),
+                                       excluded=['id-*'], combined=combined)
+        for test in suite.tests:
+            builder.add_test(test)
+    return build
+
+
+def filtering(suite):
+    def filter():
+        Filter(include_tags=['feature-1*', 'priority 2', 'smokeANDowner-3'],
+               exclude_tags=['id-?', 'regression']).start_suite(suite)
+    return filter
+
+
+def criticality(suite):
+    def check():
+        criticality = Criticality(['smoke', 'feature-*'], ['owner-1'])
+        for test in suite.tests:
+            criticality.test_is_critical(test)
+    return check
+
+
+if __name__ == '__main__':
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    combined = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    start = time.time()
+    suite = create_suite(tests)
+    print '%-20s %8.2f s' % ('creating tests', time.time() - start)
+    measure('tag statistics', tag_statistics(suite, combined_patterns(combined)))
+    measure('criticality', criticality(suite))
+    measure('filtering', filtering(suite))
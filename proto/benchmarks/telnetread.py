@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+"""Benchmark for reading large outputs with the Telnet library.
+
+Usage: telnetread.py [megabytes]
+
+Starts a telnet stub server on the loopback interface that replies to every
+command with the given amount (default 1) of configuration like output
+followed by a prompt. Option negotiation and escaped IAC bytes are mixed in
+the output. Reports how long `Read Until`, `Read Until Regexp` and
+`Read Until Prompt` take using the Telnet library and how long reading the
+same output takes using plain `telnetlib`. All reads time out after
+60 seconds.
+"""
+
+import socket
+import sys
+import telnetlib
+import threading
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.libraries.Telnet import TelnetConnection
+from robot.output import LOGGER
+
+LOGGER.disable_automatic_console_logger()
+
+IAC, DO, WILL, ECHO = telnetlib.IAC, telnetlib.DO, telnetlib.WILL, telnetlib.ECHO
+PROMPT = 'device# '
+
+
+class StubServer(threading.Thread):
+
+    def __init__(self, megabytes):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.output = self._create_output(megabytes)
+        self.server = socket.socket()
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(5)
+        self.port = self.server.getsockname()[1]
+
+    def _create_output(self, megabytes):
+        lines = []
+        size = 0
+        index = 0
+        while size < megabytes * 1024 * 1024:
+            line = 'interface GigabitEthernet0/%d\r\n ip address 10.0.%d.%d ' \
+                   '255.255.255.0\r\n description uplink %s\r\n' \
+                   % (index, index % 256, index % 254 + 1,
+                      IAC + IAC if index % 1000 == 0 else '-')
+            lines.append(line)
+            size += len(line)
+            index += 1
+        return ''.join(lines) + 'end\r\n' + PROMPT
+
+    def run(self):
+        while True:
+            connection = self.server.accept()[0]
+            threading.Thread(target=self._serve, args=(connection,)).start()
+
+    def _serve(self, connection):
+        connection.sendall(IAC + WILL + ECHO + PROMPT)
+        try:
+            while True:
+                data = connection.recv(1024)
+                if not data:
+                    break
+                # Replies to option negotiation are not commands.
+                if '\n' in data:
+                    connection.sendall(IAC + DO + ECHO + self.output)
+        except socket.error:
+            pass
+        connection.close()
+
+
+def robot_connection(port, **config):
+    connection = TelnetConnection('127.0.0.1', port, timeout=60,
+                                  encoding='ISO-8859-1', **config)
+    connection.read_until(PROMPT, 'DEBUG')
+    connection.write_bare('show running-config\r\n')
+    return connection
+
+
+def robot_read_until(port):
+    return robot_connection(port).read_until(PROMPT, 'DEBUG')
+
+
+def robot_read_until_regexp(port):
+    return robot_connection(port).read_until_regexp('device# $', 'DEBUG')
+
+
+def robot_read_until_prompt(port):
+    return robot_connection(port, prompt=PROMPT).read_until_prompt('DEBUG')
+
+
+def telnetlib_read_until(port):
+    connection = telnetlib.Telnet('127.0.0.1', port)
+    connection.read_until(PROMPT, 60)
+    connection.write('show running-config\r\n')
+    return connection.read_until(PROMPT, 60)
+
+
+def telnetlib_expect(port):
+    connection = telnetlib.Telnet('127.0.0.1', port)
+    connection.read_until(PROMPT, 60)
+    connection.write('show running-config\r\n')
+    return connection.expect(['device# $'], 60)[-1]
+
+
+def benchmark(name, reader, port, expected):
+    start = time.time()
+    output = reader(port)
+    elapsed = time.time() - start
+    if isinstance(output, unicode):
+        output = output.encode('ISO-8859-1')
+    print '%-24s %8.2f s%s' % (name, elapsed,
+                               ' (timeout)' if output != expected else '')
+
+
+if __name__ == '__main__':
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    server = StubServer(megabytes)
+    server.start()
+    expected = server.output.replace(IAC + IAC, IAC)
+    benchmark('Read Until', robot_read_until, server.port, expected)
+    benchmark('Read Until Regexp', robot_read_until_regexp, server.port,
+              expected)
+    benchmark('Read Until Prompt', robot_read_until_prompt, server.port,
+              expected)
+    benchmark('telnetlib read_until', telnetlib_read_until, server.port,
+              expected)
+    benchmark('telnetlib expect', telnetlib_expect, server.port, expected)
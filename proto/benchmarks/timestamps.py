@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+"""Benchmark for handling execution timestamps.
+
+Usage: timestamps.py [keywords]
+
+Simulates what happens to start and end times of the given number of
+keywords (default 100000) during execution, when writing output XML and
+when reading it and building the log model. Reports how long that takes
+when timestamps are kept as strings that are parsed every time they are
+needed and when they are kept as integer milliseconds that are formatted
+only when serialized and parsed only once.
+"""
+
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.utils import (get_epoch_millis, get_timestamp, millis_to_timestamp,
+                         timestamp_to_millis)
+from robot.utils.robottime import _timestamp_to_millis
+
+
+def strings(keywords):
+    for index in xrange(keywords):
+        # Execution
+        start = get_timestamp()
+        end = get_timestamp()
+        _string_elapsed(start, end)
+        # Reading output XML
+        _string_elapsed(start, end)
+        # Building log model
+        _timestamp_to_millis(start)
+
+
+def _string_elapsed(start, end):
+    if start[:-4] == end[:-4]:
+        return int(end[-3:]) - int(start[-3:])
+    return _timestamp_to_millis(end) - _timestamp_to_millis(start)
+
+
+def millis(keywords):
+    for index in xrange(keywords):
+        # Execution
+        start = get_epoch_millis()
+        end = get_epoch_millis()
+        end - start
+        # Writing output XML
+        start = millis_to_timestamp(start)
+        end = millis_to_timestamp(end)
+        # Reading output XML
+        start = timestamp_to_millis(start)
+        end = timestamp_to_millis(end)
+        end - start
+
+
+def benchmark(name, function, keywords):
+    start = time.time()
+    function(keywords)
+    print '%-8s %8.2f s' % (name, time.time() - start)
+
+
+if __name__ == '__main__':
+    keywords = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    benchmark('strings', strings, keywords)
+    benchmark('millis', millis, keywords)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""Benchmark for `Wait Until Created` and `Wait Until Removed` keywords.
+
+Usage: waituntil.py [rounds] [directory]
+
+Creates and removes a file in the given directory (default is a new
+temporary directory) from a background thread the given number of times
+(default 10) while the keywords wait for it. Reports the average and maximum
+detection latency and how many times the path was checked with `glob.glob`
+using inotify based waiting, when available, and using polling.
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.libraries import OperatingSystem
+
+
+class GlobCounter(object):
+
+    def __init__(self):
+        self.count = 0
+        self._glob = glob.glob
+
+    def __call__(self, pattern):
+        self.count += 1
+        return self._glob(pattern)
+
+
+def change_later(path, create, delay, changed):
+    def change():
+        time.sleep(delay)
+        if create:
+            open(path, 'w').close()
+        else:
+            os.remove(path)
+        changed.append(time.time())
+    thread = threading.Thread(target=change)
+    thread.start()
+    return thread
+
+
+def benchmark(name, directory, rounds):
+    library = OperatingSystem.OperatingSystem()
+    counter = OperatingSystem.glob.glob = GlobCounter()
+    path = join(directory, 'file-%d.txt')
+    latencies = []
+    try:
+        for index in range(rounds):
+            for create, wait in [(True, library.wait_until_created),
+                                 (False, library.wait_until_removed)]:
+                changed = []
+                thread = change_later(path % index, create,
+                                      0.2 + index % 7 * 0.037, changed)
+                wait(join(directory, 'file-%d.*' % index), '10s')
+                latencies.append(time.time() - changed[0])
+                thread.join()
+    finally:
+        OperatingSystem.glob.glob = counter._glob
+    print '%-10s avg %6.1f ms   max %6.1f ms   %6d checks' \
+        % (name, sum(latencies) / len(latencies) * 1000,
+           max(latencies) * 1000, counter.count)
+
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    directory = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp()
+    create_watcher = OperatingSystem._create_path_watcher
+    try:
+        if OperatingSystem._InotifyWatcher.available():
+            benchmark('inotify', directory, rounds)
+        OperatingSystem._create_path_watcher = \
+            lambda path: OperatingSystem._PollingWatcher()
+        benchmark('polling', directory, rounds)
+    finally:
+        OperatingSystem._create_path_watcher = create_watcher
+        if len(sys.argv) < 3:
+            shutil.rmtree(directory)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""Benchmark for caching parsed documents in the XML library.
+
+Usage: xmlcache.py [megabytes] [assertions]
+
+Creates an XML file of the given size (default 2) and reports how long
+running the given number (default 20) of read only keywords against it
+takes with and without caching parsed documents.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.libraries.XML import XML
+from robot.output import LOGGER
+
+LOGGER.disable_automatic_console_logger()
+
+
+def create_xml(path, megabytes):
+    with open(path, 'w') as output:
+        output.write('<response xmlns="http://example.com/ns">\n')
+        index = 0
+        while output.tell() < megabytes * 1024 * 1024:
+            output.write('  <item id="%d" type="%s"><name>Item %d</name>'
+                         '<value>%d</value></item>\n'
+                         % (index, 'odd' if index % 2 else 'even', index,
+                            index * 7))
+            index += 1
+        output.write('</response>\n')
+    return index
+
+
+def assertions(library, path, items, count):
+    for index in xrange(count):
+        item = (items - 1) * index // max(count - 1, 1)
+        if index % 2:
+            library.element_attribute_should_be(path, 'type',
+                                                'odd' if item % 2 else 'even',
+                                                "item[@id='%d']" % item)
+        else:
+            library.element_text_should_be(path, 'Item %d' % item,
+                                           "item[@id='%d']/name" % item)
+
+
+def benchmark(name, path, items, count, cache_size):
+    library = XML(cache_size=cache_size)
+    start = time.time()
+    assertions(library, path, items, count)
+    print '%-12s %8.2f s' % (name, time.time() - start)
+
+
+if __name__ == '__main__':
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    fd, path = tempfile.mkstemp(suffix='.xml')
+    os.close(fd)
+    try:
+        items = create_xml(path, megabytes)
+        benchmark('no cache', path, items, count, 0)
+        benchmark('cache', path, items, count, 5)
+    finally:
+        os.remove(path)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Benchmark for writing output XML files using `robot.utils.XmlWriter`.
+
+Usage: xmlwriter.py [keywords]
+
+Writes elements like keywords, arguments, messages and statuses similarly
+as when output XML is written with TRACE level logging. Reports how long
+writing the given number of keywords (default 100000) takes without
+buffering, with the default buffer, and with gzip compression.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(dirname(dirname(abspath(__file__)))), 'src'))
+
+from robot.utils import XmlWriter
+
+
+def write(writer, keywords):
+    for index in xrange(keywords):
+        writer.start('kw', {'name': u'BuiltIn.Log', 'type': u'kw'})
+        writer.element('doc', u'Logs the given message with the given level.')
+        writer.start('arguments')
+        writer.element('arg', u'Message number %d' % index)
+        writer.element('arg', u'TRACE')
+        writer.end('arguments')
+        writer.element('msg', u'Arguments: [ Message number %d | TRACE ]'
+                       % index, {'timestamp': u'20140101 12:00:00.000',
+                                 'level': u'TRACE'})
+        writer.element('msg', u'Message <%d> & more' % index,
+                       {'timestamp': u'20140101 12:00:00.001',
+                        'level': u'INFO'})
+        writer.element('status', attrs={'status': u'PASS',
+                                        'starttime': u'20140101 12:00:00.000',
+                                        'endtime': u'20140101 12:00:00.002'})
+        writer.end('kw')
+    writer.close()
+
+
+def benchmark(name, path, keywords, **config):
+    start = time.time()
+    write(XmlWriter(path, **config), keywords)
+    elapsed = time.time() - start
+    print '%-12s %8.2f s %10.2f MB' % (name, elapsed,
+                                       os.path.getsize(path) / 1024.0 ** 2)
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    keywords = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    directory = tempfile.mkdtemp()
+    path = join(directory, 'output.xml')
+    try:
+        benchmark('unbuffered', path, keywords, buffer_size=0)
+        benchmark('buffered', path, keywords)
+        benchmark('gzip', path + '.gz', keywords)
+    finally:
+        os.rmdir(directory)
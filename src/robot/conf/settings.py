@@ -61,7 +61,8 @@ class _BaseSettings(object):
                  'MonitorColors'    : ('monitorcolors', 'AUTO'),
                  'StdOut'           : ('stdout', None),
                  'StdErr'           : ('stderr', None),
-                 'XUnitSkipNonCritical' : ('xunitskipnoncritical', False)}
+                 'XUnitSkipNonCritical' : ('xunitskipnoncritical', False),
+                 'Processes'        : ('processes', 1)}
     _output_opts = ['Output', 'Log', 'Report', 'XUnit', 'DebugFile']
 
     def __init__(self, options=None, **extra_options):
@@ -109,7 +110,7 @@ class _BaseSettings(object):
             return self._process_value('XUnit', value)
         if name == 'OutputDir':
             return utils.abspath(value)
-        if name in ['SuiteStatLevel', 'MonitorWidth']:
+        if name in ['SuiteStatLevel', 'MonitorWidth', 'Processes']:
             return self._convert_to_positive_integer_or_default(name, value)
         if name in ['Listeners', 'VariableFiles']:
             return [self._split_args_from_name_or_path(item) for item in value]
@@ -121,6 +122,8 @@ class _BaseSettings(object):
             return [v for v in [self._process_tag_stat_link(v) for v in value] if v]
         if name == 'Randomize':
             return self._process_randomize_value(value)
+        if name == 'SplitLevel':
+            return self._process_split_level(value)
         if name == 'RunMode':
             LOGGER.warn('Option --runmode is deprecated in Robot Framework 2.8 '
                         'and will be removed in the future.')
@@ -172,6 +175,12 @@ class _BaseSettings(object):
             self._raise_invalid_option_value('--randomize', original)
         return value, seed
 
+    def _process_split_level(self, original):
+        value = original.lower()
+        if value not in ('suite', 'test'):
+            self._raise_invalid_option_value('--splitlevel', original)
+        return value
+
     def _raise_invalid_option_value(self, option_name, given_value):
         raise DataError("Option '%s' does not support value '%s'."
                         % (option_name, given_value))
@@ -339,6 +348,10 @@ class _BaseSettings(object):
     def split_log(self):
         return self['SplitLog']
 
+    @property
+    def processes(self):
+        return self['Processes']
+
     @property
     def status_rc(self):
         return not self['NoStatusRC']
@@ -390,7 +403,9 @@ class RobotSettings(_BaseSettings):
                        'Listeners'          : ('listener', []),
                        'MonitorWidth'       : ('monitorwidth', 78),
                        'MonitorMarkers'     : ('monitormarkers', 'AUTO'),
-                       'DebugFile'          : ('debugfile', None)}
+                       'DebugFile'          : ('debugfile', None),
+                       'SplitLevel'         : ('splitlevel', 'suite'),
+                       'Durations'          : ('durations', None)}
 
     def get_rebot_settings(self):
         settings = RebotSettings()
@@ -475,7 +490,9 @@ class RebotSettings(_BaseSettings):
                        'ProcessEmptySuite' : ('processemptysuite', False),
                        'StartTime'         : ('starttime', None),
                        'EndTime'           : ('endtime', None),
-                       'ReRunMerge'        : ('rerunmerge', False)}
+                       'ReRunMerge'        : ('rerunmerge', False),
+                       'Streaming'         : ('streaming', False),
+                       'Processes'         : ('reportprocesses', 1)}
 
     def _output_disabled(self):
         return False
@@ -534,6 +551,10 @@ class RebotSettings(_BaseSettings):
     def rerun_merge(self):
         return self['ReRunMerge']
 
+    @property
+    def streaming(self):
+        return self['Streaming']
+
     @property
     def console_logger_config(self):
         return {
@@ -14,6 +14,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import random
 import re
 import time
 
@@ -1482,39 +1483,92 @@ class _RunKeyword:
         keyword again after the previous run has failed.
 
         Both `timeout` and `retry_interval` must be given in Robot Framework's
-        time format (e.g. '1 minute', '2 min 3 s', '4.5').
+        time format (e.g. '1 minute', '2 min 3 s', '4.5'). Alternatively
+        `timeout` can be given as a maximum number of attempts with postfix
+        'times' or 'x' (e.g. '5 times', '10 x'), similarly as with
+        `Repeat Keyword`.
+
+        `retry_interval` can be followed by comma separated options that
+        control how the interval changes between attempts:
+
+        - `backoff <factor>`: multiply the interval by `factor` after each
+          failed attempt (e.g. `backoff 2` doubles it)
+        - `max <time>`: never wait longer than the given time
+        - `jitter`: wait a random time between half of the interval and
+          the full interval to avoid retrying in lock-step with others
 
         If the executed keyword passes, returns its return value.
 
         Examples:
         | Wait Until Keyword Succeeds | 2 min | 5 sec | My keyword | argument |
         | ${result} = | Wait Until Keyword Succeeds | 30 s | 1 s | My keyword |
+        | Wait Until Keyword Succeeds | 5 times | 100 ms, backoff 2 | My keyword |
+        | Wait Until Keyword Succeeds | 5 min | 1 s, backoff 1.5, max 30 s, jitter | My keyword |
 
         Errors caused by invalid syntax, test or keyword timeouts, or fatal
         exceptions are not caught by this keyword.
 
+        The keyword to run is searched only once and the same keyword is
+        used in all attempts. Time used by failed attempts and the time
+        waited after them are logged on DEBUG level.
+
         Running the same keyword multiple times inside this keyword can create
         lots of output and considerably increase the size of the generated
         output files. Starting from Robot Framework 2.7, it is possible to
         remove unnecessary keywords from the outputs using
         `--RemoveKeywords WUKS` command line option.
+
+        Specifying `timeout` as number of attempts and options to
+        `retry_interval` are new in Robot Framework 2.8.6.
         """
-        timeout = utils.timestr_to_secs(timeout)
-        retry_interval = utils.timestr_to_secs(retry_interval)
-        maxtime = time.time() + timeout
-        error = None
-        while not error:
+        attempts = self._get_attempts(timeout)
+        if attempts is None:
+            timeout = utils.timestr_to_secs(timeout)
+        elif attempts < 1:
+            raise ValueError("Number of attempts must be positive, got '%s'."
+                             % timeout)
+        interval = _RetryInterval(retry_interval)
+        if not isinstance(name, basestring):
+            raise RuntimeError('Keyword name must be a string.')
+        handler = self._context.get_handler(name)
+        maxtime = time.time() + timeout if attempts is None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.time()
             try:
-                return self.run_keyword(name, *args)
+                return Keyword(name, list(args)).run(self._context, handler)
             except ExecutionFailed, err:
                 if err.dont_continue:
                     raise
-                if time.time() > maxtime:
-                    error = unicode(err)
-                else:
-                    time.sleep(retry_interval)
-        raise AssertionError("Timeout %s exceeded. The last error was: %s"
-                             % (utils.secs_to_timestr(timeout), error))
+                if attempts is not None and attempt >= attempts:
+                    raise AssertionError("Keyword '%s' failed after retrying "
+                                         "%d time%s. The last error was: %s"
+                                         % (name, attempt,
+                                            utils.plural_or_not(attempt),
+                                            unicode(err)))
+                if maxtime is not None and time.time() > maxtime:
+                    raise AssertionError("Timeout %s exceeded. The last error "
+                                         "was: %s"
+                                         % (utils.secs_to_timestr(timeout),
+                                            unicode(err)))
+            wait = interval.next()
+            if maxtime is not None:
+                wait = max(min(wait, maxtime - time.time()), 0)
+            self.log('Attempt %d failed in %s. Retrying in %s.'
+                     % (attempt, self._get_timestr(time.time() - started),
+                        self._get_timestr(wait)), 'DEBUG')
+            time.sleep(wait)
+
+    def _get_attempts(self, timeout):
+        timeout = utils.normalize(unicode(timeout))
+        for postfix in 'times', 'x':
+            if timeout.endswith(postfix):
+                return self._convert_to_integer(timeout[:-len(postfix)])
+        return None
+
+    def _get_timestr(self, secs):
+        return utils.secs_to_timestr(round(secs, 3), compact=True) or '0ms'
 
     def set_variable_if(self, condition, *values):
         """Sets variable based on the given condition.
@@ -2248,9 +2302,7 @@ class _Misc:
         - Starting from RF 2.6.2, library and resource names in the search order
           are both case and space insensitive.
         """
-        old_order = self._namespace.library_search_order
-        self._namespace.library_search_order = libraries
-        return old_order
+        return self._namespace.set_library_search_order(libraries)
 
     def keyword_should_exist(self, name, msg=None):
         """Fails unless the given keyword exists in the current scope.
@@ -2679,6 +2731,41 @@ class BuiltIn(_Verify, _Converter, _Variables, _RunKeyword, _Control, _Misc):
         return bool(condition)
 
 
+class _RetryInterval(object):
+    """Interval between Wait Until Keyword Succeeds attempts."""
+
+    def __init__(self, interval):
+        options = unicode(interval).split(',')
+        self._interval = utils.timestr_to_secs(options[0])
+        self._factor = 1
+        self._maximum = None
+        self._jitter = False
+        for option in options[1:]:
+            self._parse_option(option.strip(), interval)
+
+    def _parse_option(self, option, interval):
+        name, _, value = option.partition(' ')
+        name = name.lower()
+        if name == 'backoff' and value:
+            self._factor = float(value)
+        elif name == 'max' and value:
+            self._maximum = utils.timestr_to_secs(value)
+        elif name == 'jitter' and not value:
+            self._jitter = True
+        else:
+            raise ValueError("Invalid retry interval option '%s' in '%s'."
+                             % (option, interval))
+
+    def next(self):
+        interval = self._interval
+        if self._maximum is not None:
+            interval = min(interval, self._maximum)
+        self._interval = interval * self._factor
+        if self._jitter:
+            interval = random.uniform(interval / 2.0, interval)
+        return interval
+
+
 class RobotNotRunningError(AttributeError):
     """Used when something cannot be done because Robot is not running.
 
@@ -13,14 +13,20 @@
 #  limitations under the License.
 
 from __future__ import with_statement
+import atexit
 import codecs
+import errno
 import fnmatch
 import glob
 import os
+import re
+import select
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 
 try:
@@ -346,7 +352,8 @@ class OperatingSystem:
         with open(path, 'rb') as f:
             return f.read()
 
-    def grep_file(self, path, pattern, encoding='UTF-8', encoding_errors='strict'):
+    def grep_file(self, path, pattern, encoding='UTF-8', encoding_errors='strict',
+                  offset=0):
         """Returns the lines of the specified file that match the `pattern`.
 
         This keyword reads a file from the file system using the defined
@@ -369,21 +376,47 @@ class OperatingSystem:
         `Get File` in combination with String library keywords like `Get
         Lines Matching Regexp`.
 
-        `encoding_errors` argument is new in Robot Framework 2.8.5.
+        The file is read in chunks, so also very large files can be grepped
+        without reading them into memory. With ASCII compatible encodings
+        like UTF-8 and Latin-1, lines not containing the longest literal part
+        of the pattern are skipped without decoding them. Possible decoding
+        errors on these lines are thus not reported.
+
+        The optional `offset` specifies the byte position where to start
+        reading the file. Together with `Get File Size` it makes it possible
+        to grep only the content added to a file after a certain point. If
+        the file is smaller than the offset, for example, because a log
+        file has been rotated, the file is read from the beginning. The offset
+        must be a non-negative integer.
+
+        | ${size} = | Get File Size | /var/log/myapp.log |
+        | Do Something |
+        | ${errors} = | Grep File | /var/log/myapp.log | ERROR | offset=${size} |
+
+        `encoding_errors` argument is new in Robot Framework 2.8.5 and
+        `offset` in Robot Framework 2.8.6.
         """
-        pattern = '*%s*' % pattern
         path = self._absnorm(path)
-        lines = []
-        total_lines = 0
+        offset = self._convert_offset(offset)
+        grep = _FileGrep(pattern, encoding, encoding_errors)
         self._link("Reading file '%s'", path)
-        with codecs.open(path, encoding=encoding, errors=encoding_errors) as f:
-            for line in f.readlines():
-                total_lines += 1
-                line = line.rstrip('\r\n')
-                if fnmatch.fnmatchcase(line, pattern):
-                    lines.append(line)
-            self._info('%d out of %d lines matched' % (len(lines), total_lines))
-            return '\n'.join(lines)
+        with open(path, 'rb') as f:
+            if offset > os.fstat(f.fileno()).st_size:
+                offset = 0
+            f.seek(offset)
+            lines = grep.grep(f)
+        self._info('%d out of %d lines matched' % (len(lines), grep.total_lines))
+        return '\n'.join(lines)
+
+    def _convert_offset(self, offset):
+        try:
+            converted = int(offset)
+        except (TypeError, ValueError):
+            converted = -1
+        if converted < 0:
+            raise ValueError("Offset must be a non-negative integer, got '%s'."
+                             % offset)
+        return converted
 
     def log_file(self, path, encoding='UTF-8', encoding_errors='strict'):
         """Wrapper for `Get File` that also logs the returned file.
@@ -520,15 +553,19 @@ class OperatingSystem:
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path does not exist in the first place.
+
+        On Linux the parent directory is watched using inotify and the
+        keyword notices changes immediately. Changes done by other machines
+        on network file systems are not reported by inotify, and are noticed
+        when the path is re-checked once a second. Elsewhere, and when the
+        parent directory itself is a pattern or does not exist, the path is
+        checked ten times a second.
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while glob.glob(path):
-            time.sleep(0.1)
-            if timeout >= 0 and time.time() > maxtime:
-                raise AssertionError("'%s' was not removed in %s"
-                                     % (path, secs_to_timestr(timeout)))
+        if not self._wait_until(path, timeout, exists=False):
+            raise AssertionError("'%s' was not removed in %s"
+                                 % (path, secs_to_timestr(timeout)))
         self._link("'%s' was removed", path)
 
     def wait_until_created(self, path, timeout='1 minute'):
@@ -546,17 +583,38 @@ class OperatingSystem:
 
         If the timeout is negative, the keyword is never timed-out. The keyword
         returns immediately, if the path already exists.
+
+        How changes are noticed is explained in `Wait Until Removed`.
+
+        *NOTE:* Starting from Robot Framework 2.8.6, on Linux this keyword
+        returns immediately when the path is created, not up to 0.1 seconds
+        later like earlier. The content of a created file may thus not have
+        been fully written when the keyword returns. If a file is read right
+        after waiting, the process creating it should write it using
+        a temporary name and then rename it to the final name.
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while not glob.glob(path):
-            time.sleep(0.1)
-            if timeout >= 0 and time.time() > maxtime:
-                raise AssertionError("'%s' was not created in %s"
-                                     % (path, secs_to_timestr(timeout)))
+        if not self._wait_until(path, timeout, exists=True):
+            raise AssertionError("'%s' was not created in %s"
+                                 % (path, secs_to_timestr(timeout)))
         self._link("'%s' was created", path)
 
+    def _wait_until(self, path, timeout, exists):
+        maxtime = time.time() + timeout
+        watcher = _create_path_watcher(path)
+        try:
+            while bool(glob.glob(path)) is not exists:
+                if timeout < 0:
+                    watcher.wait()
+                elif time.time() > maxtime:
+                    return False
+                else:
+                    watcher.wait(maxtime - time.time())
+        finally:
+            watcher.close()
+        return True
+
     # Dir/file empty
 
     def directory_should_be_empty(self, path, msg=None):
@@ -1450,6 +1508,256 @@ class OperatingSystem:
             print '*%s* %s' % (level, msg)
 
 
+class _FileGrep(object):
+    chunk_size = 1024 * 1024
+    _wildcards = re.compile(r'\*|\?|\[!?\]?[^\]]*\]')
+    _ascii_compatible = ('ascii', 'utf-8', 'latin', 'iso8859', 'cp125')
+
+    def __init__(self, pattern, encoding, errors):
+        self._pattern = '*%s*' % pattern
+        self._encoding = encoding
+        self._errors = errors
+        self._literal = self._get_literal(pattern, encoding, errors)
+        self.total_lines = 0
+
+    def _get_literal(self, pattern, encoding, errors):
+        """Returns the longest literal part of the pattern as bytes.
+
+        Returns `None` if lines cannot be filtered at byte level. Literals
+        cannot be trusted if decoding may remove bytes or if decoding
+        replaces invalid bytes with a character the literal contains.
+        """
+        if not self._is_ascii_compatible(encoding) \
+                or errors not in ('strict', 'replace'):
+            return None
+        literal = max(self._wildcards.split(pattern), key=len)
+        if u'\ufffd' in literal:
+            return None
+        try:
+            return literal.encode(encoding)
+        except UnicodeError:
+            return None
+
+    def _is_ascii_compatible(self, encoding):
+        name = codecs.lookup(encoding).name
+        return name.startswith(self._ascii_compatible) \
+            and u'\n'.encode(encoding) == '\n'
+
+    def grep(self, file):
+        if self._literal is None:
+            return self._grep_decoded(file)
+        return self._grep_bytes(file)
+
+    def _grep_decoded(self, file):
+        reader = codecs.getreader(self._encoding)(file, self._errors)
+        matches = []
+        for line in reader:
+            self.total_lines += 1
+            line = line.rstrip('\r\n')
+            if fnmatch.fnmatchcase(line, self._pattern):
+                matches.append(line)
+        return matches
+
+    def _grep_bytes(self, file):
+        matches = []
+        rest = ''
+        for chunk in iter(lambda: file.read(self.chunk_size), ''):
+            chunk = rest + chunk
+            end = chunk.rfind('\n') + 1
+            chunk, rest = chunk[:end], chunk[end:]
+            self.total_lines += chunk.count('\n')
+            matches.extend(self._grep_chunk(chunk))
+        if rest:
+            self.total_lines += 1
+            matches.extend(self._grep_chunk(rest))
+        return matches
+
+    def _grep_chunk(self, chunk):
+        matches = []
+        for text in self._get_candidates(chunk):
+            text = text.decode(self._encoding, self._errors)
+            for line in text.splitlines(True):
+                line = line.rstrip('\r\n')
+                if fnmatch.fnmatchcase(line, self._pattern):
+                    matches.append(line)
+        return matches
+
+    def _get_candidates(self, chunk):
+        if not self._literal:
+            yield chunk
+            return
+        index = chunk.find(self._literal)
+        while index != -1:
+            start = chunk.rfind('\n', 0, index) + 1
+            end = chunk.find('\n', index)
+            if end == -1:
+                end = len(chunk)
+            yield chunk[start:end]
+            index = chunk.find(self._literal, end)
+
+
+def _create_path_watcher(path):
+    if _InotifyWatcher.available():
+        try:
+            return _InotifyWatcher(path)
+        except (OSError, ValueError):
+            pass
+    return _PollingWatcher()
+
+
+class _PollingWatcher(object):
+    interval = 0.1
+
+    def wait(self, timeout=None):
+        time.sleep(self._get_wait_time(timeout))
+
+    def _get_wait_time(self, timeout):
+        if timeout is None:
+            return self.interval
+        return min(self.interval, timeout)
+
+    def close(self):
+        pass
+
+
+class _InotifyWatcher(_PollingWatcher):
+    """Waits for changes in a directory using Linux inotify API via ctypes.
+
+    Only entries matching the last component of the watched path are taken
+    into account. The path is also re-checked after `interval` seconds,
+    because inotify does not see all changes on network file systems.
+
+    Closing an inotify instance takes several milliseconds, so each thread
+    uses one instance and only watches are removed after waiting. Instances
+    are closed when their thread ends and, for the main thread, at exit.
+    """
+    interval = 1.0
+    _libc = None
+    _local = threading.local()
+    _flags = os.O_NONBLOCK | 0x80000        # non-blocking, close-on-exec
+    _mask = (0x40 | 0x80 | 0x100 | 0x200 |  # moved from/to, create, delete
+             0x400 | 0x800)                 # delete self, move self
+    _event_header_size = 16
+
+    @classmethod
+    def available(cls):
+        if cls._libc is None:
+            cls._libc = cls._load_libc()
+        return bool(cls._libc)
+
+    @classmethod
+    def _load_libc(cls):
+        if not sys.platform.startswith('linux'):
+            return False
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6',
+                               use_errno=True)
+            libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+        except (ImportError, OSError, AttributeError):
+            return False
+        return libc
+
+    def __init__(self, path):
+        directory, pattern = os.path.split(self._encode(path))
+        if not pattern or glob.has_magic(directory):
+            raise ValueError('Cannot watch path %s.' % path)
+        self._pattern = pattern
+        self._fd = self._get_inotify_instance()
+        self._wd = self._libc.inotify_add_watch(self._fd, directory,
+                                                self._mask)
+        if self._wd < 0:
+            raise self._error()
+
+    def _encode(self, path):
+        if isinstance(path, unicode):
+            return path.encode(sys.getfilesystemencoding() or 'UTF-8')
+        return path
+
+    def _get_inotify_instance(self):
+        instance = getattr(self._local, 'instance', None)
+        if not instance:
+            instance = _InotifyInstance(self._libc.inotify_init1(self._flags))
+            if not instance:
+                raise self._error()
+            self._local.instance = instance
+        return instance.fd
+
+    @classmethod
+    def close_instance(cls):
+        instance = getattr(cls._local, 'instance', None)
+        if instance:
+            del cls._local.instance
+            instance.close()
+
+    def _error(self):
+        import ctypes
+        code = ctypes.get_errno()
+        return OSError(code, os.strerror(code))
+
+    def wait(self, timeout=None):
+        maxtime = time.time() + self._get_wait_time(timeout)
+        remaining = maxtime - time.time()
+        while remaining > 0:
+            if self._select(remaining) and self._has_matching_event():
+                return
+            remaining = maxtime - time.time()
+
+    def _select(self, timeout):
+        try:
+            return bool(select.select([self._fd], [], [], timeout)[0])
+        except select.error, err:
+            if err.args[0] != errno.EINTR:
+                raise
+            return False
+
+    def _has_matching_event(self):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except OSError:
+            return True
+        index = 0
+        while index < len(data):
+            wd, mask, cookie, length = \
+                struct.unpack('iIII', data[index:index+self._event_header_size])
+            index += self._event_header_size
+            name = data[index:index+length].rstrip('\0')
+            index += length
+            if wd == -1:    # event queue overflow
+                return True
+            if wd == self._wd and (not name or
+                                   fnmatch.fnmatchcase(name, self._pattern)):
+                return True
+        return False
+
+    def close(self):
+        self._libc.inotify_rm_watch(self._fd, self._wd)
+
+
+atexit.register(_InotifyWatcher.close_instance)
+
+
+class _InotifyInstance(object):
+    """Owns an inotify file descriptor and closes it when garbage collected.
+
+    Stored in thread-local storage, which is released when the thread ends.
+    """
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def __nonzero__(self):
+        return self.fd >= 0
+
+    def close(self, close=os.close):
+        if self.fd >= 0:
+            close(self.fd)
+            self.fd = -1
+
+    __del__ = close
+
+
 class _Process:
 
     def __init__(self, command):
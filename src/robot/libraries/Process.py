@@ -15,11 +15,14 @@
 from __future__ import with_statement
 
 import ctypes
+import errno
 import os
 import subprocess
 import sys
+import threading
 import time
 import signal as signal_module
+from collections import deque
 
 from robot.utils import (ConnectionCache, abspath, encode_to_system,
                          decode_output, secs_to_timestr, timestr_to_secs)
@@ -94,6 +97,7 @@ class Process(object):
     | stdout     | Path of a file where to write standard output.        |
     | stderr     | Path of a file where to write standard error.         |
     | alias      | Alias given to the process.                           |
+    | max_output_size | Maximum number of bytes of output to keep.       |
 
     Note that because `**configuration` is passed using `name=value` syntax,
     possible equal signs in other arguments passed to `Run Process` and
@@ -175,6 +179,24 @@ class Process(object):
     Note that the created output files are not automatically removed after
     the test run. The user is responsible to remove them if needed.
 
+    == Limiting output ==
+
+    Processes producing huge amounts of output can consume lot of memory
+    when all their output is stored in the `result object`. The
+    `max_output_size` argument can be used to keep only the given number
+    of bytes from the end of the standard output and error. When outputs
+    are not redirected to files, they are read on background while the
+    process is running and only the end is kept in memory. This also
+    avoids the process hanging due to the output buffers getting full.
+    When outputs are redirected to files, the files contain the whole
+    output but only the end is read into the result object.
+
+    Examples:
+    | ${result} = | `Run Process` | program | max_output_size=1048576 |
+    | ${result} = | `Run Process` | program | stdout=${TEMPDIR}/stdout.txt | max_output_size=10000 |
+
+    `max_output_size` is new in Robot Framework 2.8.6.
+
     == Alias ==
 
     A custom name given to the process that can be used when selecting the
@@ -287,6 +309,7 @@ class Process(object):
     def __init__(self):
         self._processes = ConnectionCache('No active process.')
         self._results = {}
+        self._waiters = {}
 
     def run_process(self, command, *arguments, **configuration):
         """Runs a process and waits for it to complete.
@@ -345,10 +368,11 @@ class Process(object):
         executable_command = self._cmd(command, arguments, config.shell)
         logger.info('Starting process:\n%s' % executable_command)
         logger.debug('Process configuration:\n%s' % config)
-        process = subprocess.Popen(executable_command, **config.full_config)
+        process = Popen(executable_command, **config.full_config)
         self._results[process] = ExecutionResult(process,
                                                  config.stdout_stream,
-                                                 config.stderr_stream)
+                                                 config.stderr_stream,
+                                                 max_output_size=config.max_output_size)
         return self._processes.register(process, alias=config.alias)
 
     def _cmd(self, command, args, use_shell):
@@ -455,6 +479,9 @@ class Process(object):
 
     def _wait(self, process):
         result = self._results[process]
+        waiter = self._waiters.pop(process, None)
+        if waiter:
+            waiter.close()
         result.rc = process.wait() or 0
         result.close_streams()
         logger.info('Process completed.')
@@ -555,6 +582,8 @@ class Process(object):
         for handle in range(1, len(self._processes) + 1):
             if self.is_process_running(handle):
                 self.terminate_process(handle, kill=kill)
+        for waiter in self._waiters.values():
+            waiter.close()
         self.__init__()
 
     def send_signal_to_process(self, signal, handle=None, group=False):
@@ -721,17 +750,111 @@ class Process(object):
         self._processes.switch(handle)
 
     def _process_is_stopped(self, process, timeout):
-        max_time = time.time() + timeout
-        while time.time() <= max_time:
+        if process not in self._waiters:
             if process.poll() is not None:
                 return True
-            time.sleep(0.1)
-        return False
+            self._waiters[process] = ProcessWaiter(process)
+        if not self._waiters[process].wait(timeout):
+            return False
+        self._waiters.pop(process).close()
+        return True
+
+
+class Popen(subprocess.Popen):
+    """`subprocess.Popen` that can be safely waited from multiple threads.
+
+    Without locking, a thread whose `waitpid` call loses the race gets
+    `ECHILD` and `subprocess` sets the return code to zero.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._wait_lock = threading.Lock()
+        subprocess.Popen.__init__(self, *args, **kwargs)
+
+    def wait(self):
+        with self._wait_lock:
+            return subprocess.Popen.wait(self)
+
+    def poll(self):
+        if not self._wait_lock.acquire(False):
+            return self.returncode
+        try:
+            return subprocess.Popen.poll(self)
+        finally:
+            self._wait_lock.release()
+
+
+class ProcessWaiter(object):
+    """Waits for a process to stop on background without polling.
+
+    A daemon thread blocks in `Popen.wait` and notifies when the process
+    has stopped. On POSIX systems the notification is done by writing to
+    a pipe that `wait` selects on, elsewhere `threading.Event` is used.
+
+    Closing never blocks. If the process is still running, the thread
+    closes the pipe itself when the process stops.
+    """
+
+    def __init__(self, process):
+        self._process = process
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pipe = self._create_pipe()
+        self._thread = threading.Thread(target=self._wait)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def _create_pipe(self):
+        if os.sep == '/' and not sys.platform.startswith('java'):
+            return os.pipe()
+        return None
+
+    def _wait(self):
+        try:
+            self._process.wait()
+        finally:
+            with self._lock:
+                if self._pipe:
+                    os.write(self._pipe[1], 'x')
+                    os.close(self._pipe[1])
+                    if self._closed:
+                        os.close(self._pipe[0])
+                self._stopped.set()
+
+    def wait(self, timeout):
+        if self._stopped.isSet():
+            return True
+        if self._pipe:
+            return self._select(self._pipe[0], timeout)
+        self._stopped.wait(timeout)
+        return self._stopped.isSet()
+
+    def _select(self, fd, timeout):
+        import select
+        max_time = time.time() + timeout
+        while True:
+            try:
+                return bool(select.select([fd], [], [], timeout)[0])
+            except select.error, err:
+                if err.args[0] != errno.EINTR:
+                    raise
+            timeout = max(max_time - time.time(), 0)
+
+    def close(self):
+        with self._lock:
+            if not self._stopped.isSet():
+                self._closed = True
+                return
+        self._thread.join()
+        if self._pipe:
+            os.close(self._pipe[0])
+            self._pipe = None
 
 
 class ExecutionResult(object):
 
-    def __init__(self, process, stdout, stderr, rc=None):
+    def __init__(self, process, stdout, stderr, rc=None, max_output_size=None):
         self._process = process
         self.stdout_path = self._get_path(stdout)
         self.stderr_path = self._get_path(stderr)
@@ -740,6 +863,9 @@ class ExecutionResult(object):
         self._stderr = None
         self._custom_streams = [stream for stream in (stdout, stderr)
                                 if self._is_custom_stream(stream)]
+        self._max_output_size = max_output_size
+        self._stdout_reader = self._get_reader(process.stdout)
+        self._stderr_reader = self._get_reader(process.stderr)
 
     def _get_path(self, stream):
         return stream.name if self._is_custom_stream(stream) else None
@@ -747,6 +873,11 @@ class ExecutionResult(object):
     def _is_custom_stream(self, stream):
         return stream not in (subprocess.PIPE, subprocess.STDOUT)
 
+    def _get_reader(self, stream):
+        if self._max_output_size is None or not stream:
+            return None
+        return OutputReader(stream, self._max_output_size)
+
     @property
     def stdout(self):
         if self._stdout is None:
@@ -760,26 +891,45 @@ class ExecutionResult(object):
         return self._stderr
 
     def _read_stdout(self):
-        self._stdout = self._read_stream(self.stdout_path, self._process.stdout)
+        self._stdout = self._read_stream(self.stdout_path, self._process.stdout,
+                                         self._stdout_reader, 'stdout')
 
     def _read_stderr(self):
-        self._stderr = self._read_stream(self.stderr_path, self._process.stderr)
+        self._stderr = self._read_stream(self.stderr_path, self._process.stderr,
+                                         self._stderr_reader, 'stderr')
 
-    def _read_stream(self, stream_path, stream):
+    def _read_stream(self, stream_path, stream, reader, name):
+        if reader:
+            return self._format_output(reader.read(), reader.truncated, name)
         if stream_path:
             stream = open(stream_path, 'r')
         elif not self._is_open(stream):
             return ''
         try:
-            return self._format_output(stream.read())
+            truncated = self._seek_to_tail(stream) if stream_path else False
+            return self._format_output(stream.read(), truncated, name)
         finally:
             if stream_path:
                 stream.close()
 
+    def _seek_to_tail(self, stream):
+        if self._max_output_size is None:
+            return False
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        if size <= self._max_output_size:
+            stream.seek(0)
+            return False
+        stream.seek(size - self._max_output_size)
+        return True
+
     def _is_open(self, stream):
         return stream and not stream.closed
 
-    def _format_output(self, output):
+    def _format_output(self, output, truncated=False, name=None):
+        if truncated:
+            logger.info('Only the last %d bytes of %s were kept.'
+                        % (self._max_output_size, name))
         if output.endswith('\n'):
             output = output[:-1]
         return decode_output(output, force=True)
@@ -802,16 +952,61 @@ class ExecutionResult(object):
         return '<result object with rc %d>' % self.rc
 
 
+class OutputReader(object):
+    """Reads a standard stream on background keeping only its end.
+
+    Output is read in chunks to a ring buffer and chunks falling totally
+    outside the last `max_size` bytes are discarded. Reading continuously
+    also prevents the process from blocking when the pipe buffer is full.
+    """
+    chunk_size = 65536
+
+    def __init__(self, stream, max_size):
+        self._stream = stream
+        self._max_size = max_size
+        self._chunks = deque()
+        self._size = 0
+        self.truncated = False
+        self._thread = threading.Thread(target=self._read)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def _read(self):
+        read, chunks = self._stream.read, self._chunks
+        while True:
+            try:
+                chunk = read(self.chunk_size)
+            except (IOError, ValueError):
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self._size += len(chunk)
+            while len(chunks) > 1 and \
+                    self._size - len(chunks[0]) >= self._max_size:
+                self._size -= len(chunks.popleft())
+                self.truncated = True
+
+    def read(self):
+        self._thread.join()
+        output = ''.join(self._chunks)
+        if len(output) > self._max_size:
+            output = output[len(output)-self._max_size:]
+            self.truncated = True
+        return output
+
+
 class ProcessConfig(object):
 
     def __init__(self, cwd=None, shell=False, stdout=None, stderr=None,
-                 alias=None, env=None, **rest):
+                 alias=None, env=None, max_output_size=None, **rest):
         self.cwd = self._get_cwd(cwd)
         self.stdout_stream = self._new_stream(stdout)
         self.stderr_stream = self._get_stderr(stderr, stdout, self.stdout_stream)
         self.shell = is_true(shell)
         self.alias = alias
         self.env = self._construct_env(env, rest)
+        self.max_output_size = self._get_max_output_size(max_output_size)
 
     def _get_cwd(self, cwd):
         if cwd:
@@ -831,6 +1026,17 @@ class ProcessConfig(object):
             return subprocess.STDOUT
         return self._new_stream(stderr)
 
+    def _get_max_output_size(self, size):
+        if size is None:
+            return None
+        try:
+            max_size = int(size)
+        except ValueError:
+            max_size = -1
+        if max_size < 0:
+            raise RuntimeError("Invalid 'max_output_size' value '%s'." % size)
+        return max_size
+
     def _construct_env(self, env, extra):
         if env:
             env = dict((encode_to_system(k), encode_to_system(v))
@@ -865,8 +1071,10 @@ stdout_stream = %s
 stderr_stream = %s
 shell = %r
 alias = %s
-env = %r""" % (self.cwd, self.stdout_stream, self.stderr_stream,
-               self.shell, self.alias, self.env))
+env = %r
+max_output_size = %s""" % (self.cwd, self.stdout_stream, self.stderr_stream,
+                           self.shell, self.alias, self.env,
+                           self.max_output_size))
 
 
 def is_true(argument):
@@ -12,9 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import httplib
 import re
+import select
 import socket
 import sys
+import threading
 import time
 import xmlrpclib
 try:
@@ -38,6 +41,7 @@ class Remote(object):
             uri = 'http://' + uri
         self._uri = uri
         self._client = XmlRpcRemoteClient(uri)
+        self._coercer = ArgumentCoercer()
 
     def get_keyword_names(self, attempts=5):
         for i in range(attempts):
@@ -61,9 +65,8 @@ class Remote(object):
             return None
 
     def run_keyword(self, name, args, kwargs):
-        coercer = ArgumentCoercer()
-        args = coercer.coerce(args)
-        kwargs = coercer.coerce(kwargs)
+        args = self._coercer.coerce(args)
+        kwargs = self._coercer.coerce(kwargs)
         result = RemoteResult(self._client.run_keyword(name, args, kwargs))
         sys.stdout.write(result.output)
         if result.status != 'PASS':
@@ -74,14 +77,17 @@ class Remote(object):
 
 class ArgumentCoercer(object):
     binary = re.compile('[\x00-\x08\x0B\x0C\x0E-\x1F]')
-    non_ascii = re.compile('[\x80-\xff]')
+    binary_or_non_ascii = re.compile('[\x00-\x08\x0B\x0C\x0E-\x1F\x80-\xff]')
+
+    def __init__(self):
+        self._handlers = [(self._is_string, self._handle_string),
+                          (self._is_number, self._pass_through),
+                          (is_list_like, self._coerce_list),
+                          (is_dict_like, self._coerce_dict),
+                          (lambda arg: True, self._to_string)]
 
     def coerce(self, argument):
-        for handles, handle in [(self._is_string, self._handle_string),
-                                (self._is_number, self._pass_through),
-                                (is_list_like, self._coerce_list),
-                                (is_dict_like, self._coerce_dict),
-                                (lambda arg: True, self._to_string)]:
+        for handles, handle in self._handlers:
             if handles(argument):
                 return handle(argument)
 
@@ -97,9 +103,9 @@ class ArgumentCoercer(object):
         return arg
 
     def _contains_binary(self, arg):
-        return (self.binary.search(arg) or
-                isinstance(arg, str) and not IRONPYTHON and
-                self.non_ascii.search(arg))
+        if isinstance(arg, str) and not IRONPYTHON:
+            return self.binary_or_non_ascii.search(arg)
+        return self.binary.search(arg)
 
     def _handle_binary(self, arg):
         try:
@@ -165,27 +171,67 @@ class RemoteResult(object):
 class XmlRpcRemoteClient(object):
 
     def __init__(self, uri):
-        self._server = xmlrpclib.ServerProxy(uri, encoding='UTF-8')
+        self._server = xmlrpclib.ServerProxy(uri, KeepAliveTransport(uri),
+                                             encoding='UTF-8')
+        self._keyword_names = None
+        self._metadata = None
 
     def get_keyword_names(self):
         try:
-            return self._server.get_keyword_names()
+            self._keyword_names = self._server.get_keyword_names()
         except socket.error, (errno, err):
             raise TypeError(err)
         except xmlrpclib.Error, err:
             raise TypeError(err)
+        return self._keyword_names
 
     def get_keyword_arguments(self, name):
-        try:
-            return self._server.get_keyword_arguments(name)
-        except xmlrpclib.Error:
-            raise TypeError
+        return self._get_metadata('get_keyword_arguments', name)
 
     def get_keyword_documentation(self, name):
-        try:
-            return self._server.get_keyword_documentation(name)
-        except xmlrpclib.Error:
+        return self._get_metadata('get_keyword_documentation', name)
+
+    def _get_metadata(self, method, name):
+        if self._metadata is None:
+            self._metadata = self._get_all_metadata()
+        key = (method, name)
+        if key not in self._metadata:
+            try:
+                self._metadata[key] = getattr(self._server, method)(name)
+            except xmlrpclib.Error, err:
+                self._metadata[key] = err
+        value = self._metadata[key]
+        if isinstance(value, xmlrpclib.Error):
             raise TypeError
+        return value
+
+    def _get_all_metadata(self):
+        # Arguments and documentation of all keywords are got using one
+        # `system.multicall` request if the server supports it. Otherwise
+        # they are got one by one when needed.
+        if not self._keyword_names:
+            return {}
+        names = list(self._keyword_names) + ['__intro__', '__init__']
+        keys = [(method, name) for name in names
+                for method in ('get_keyword_arguments',
+                               'get_keyword_documentation')]
+        multicall = xmlrpclib.MultiCall(self._server)
+        for method, name in keys:
+            getattr(multicall, method)(name)
+        try:
+            results = multicall()
+        except (xmlrpclib.Error, socket.error, httplib.HTTPException,
+                ExpatError):
+            return {}
+        metadata = {}
+        for index, key in enumerate(keys):
+            try:
+                metadata[key] = results[index]
+            except xmlrpclib.Error, err:
+                metadata[key] = err
+            except (TypeError, ValueError, IndexError):
+                return {}
+        return metadata
 
     def run_keyword(self, name, args, kwargs):
         run_keyword_args = [name, args, kwargs] if kwargs else [name, args]
@@ -201,3 +247,129 @@ class XmlRpcRemoteClient(object):
                        'contains characters that are not valid in XML. '
                        'Original error was: ExpatError: %s' % err)
         raise RuntimeError(message)
+
+
+class KeepAliveTransport(xmlrpclib.Transport):
+    """XML-RPC transport using persistent HTTP connections.
+
+    Connections are taken from a pool shared by all transports using
+    the same server. They are kept open between requests if the server
+    supports it, and can be used by multiple threads at the same time.
+    """
+
+    def __init__(self, uri):
+        xmlrpclib.Transport.__init__(self)
+        if uri.lower().startswith('https://'):
+            self._connection_class = httplib.HTTPSConnection
+        else:
+            self._connection_class = httplib.HTTPConnection
+
+    def request(self, host, handler, request_body, verbose=0):
+        self.verbose = verbose
+        host, extra_headers, _ = self.get_host_info(host)
+        key = (self._connection_class, host)
+        connection = CONNECTIONS.get(key)
+        try:
+            if connection.sock is not None and self._is_closed(connection):
+                connection.close()
+            reused = connection.sock is not None
+            try:
+                self._send_request(connection, handler, request_body,
+                                   extra_headers)
+            except socket.error:
+                # Retrying is safe only because the request was not sent.
+                # Failures after that are not retried, because for example
+                # `run_keyword` may already have been executed.
+                if not reused:
+                    raise
+                connection.close()
+                self._send_request(connection, handler, request_body,
+                                   extra_headers)
+            response = self._get_response(connection)
+            if response.status != 200:
+                response.read()
+                raise xmlrpclib.ProtocolError(host + handler, response.status,
+                                              response.reason, response.msg)
+            result = self.parse_response(response)
+        except:
+            connection.close()
+            raise
+        CONNECTIONS.release(key, connection)
+        return result
+
+    def _is_closed(self, connection):
+        # An idle connection closed by the server is readable.
+        try:
+            return bool(select.select([connection.sock], [], [], 0)[0])
+        except (select.error, socket.error):
+            return True
+
+    def _send_request(self, connection, handler, request_body, extra_headers):
+        if connection.sock is None:
+            connection.connect()
+            connection.sock.setsockopt(socket.IPPROTO_TCP,
+                                       socket.TCP_NODELAY, 1)
+        connection.putrequest('POST', handler, skip_accept_encoding=True)
+        for name, value in extra_headers or []:
+            connection.putheader(name, value)
+        connection.putheader('User-Agent', self.user_agent)
+        connection.putheader('Content-Type', 'text/xml')
+        connection.putheader('Content-Length', str(len(request_body)))
+        if sys.version_info >= (2, 7):
+            connection.endheaders(request_body)
+        else:
+            connection.endheaders()
+            connection.send(request_body)
+
+    def _get_response(self, connection):
+        if sys.version_info >= (2, 7):
+            return connection.getresponse(buffering=True)
+        return connection.getresponse()
+
+
+class ConnectionPool(object):
+    """Thread-safe pool of idle connections grouped by a key."""
+
+    def __init__(self, max_idle=10):
+        self._max_idle = max_idle
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns an idle connection or creates a new one.
+
+        `key` is a tuple of a connection class and a host.
+        """
+        self._lock.acquire()
+        try:
+            if self._idle.get(key):
+                return self._idle[key].pop()
+        finally:
+            self._lock.release()
+        connection_class, host = key
+        return connection_class(host)
+
+    def release(self, key, connection):
+        self._lock.acquire()
+        try:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(connection)
+                return
+        finally:
+            self._lock.release()
+        connection.close()
+
+    def close(self):
+        """Closes all idle connections."""
+        self._lock.acquire()
+        try:
+            idle, self._idle = self._idle, {}
+        finally:
+            self._lock.release()
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+CONNECTIONS = ConnectionPool()
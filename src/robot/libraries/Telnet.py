@@ -18,6 +18,7 @@ import telnetlib
 import time
 import re
 import inspect
+import select
 import struct
 
 
@@ -454,6 +455,8 @@ class TelnetConnection(telnetlib.Telnet):
     NEW_ENVIRON_VAR = chr(0)
     NEW_ENVIRON_VALUE = chr(1)
     INTERNAL_UPDATE_FREQUENCY = 0.03
+    READ_CHUNK_SIZE = 64 * 1024
+    READ_BATCH_SIZE = 1024 * 1024
 
     def __init__(self, host=None, port=23, timeout=3.0, newline='CRLF',
                  prompt=None, prompt_is_regexp=False,
@@ -846,8 +849,99 @@ class TelnetConnection(telnetlib.Telnet):
         if self._terminal_emulator:
             return self._terminal_read_until(expected)
         expected = self._encode(expected)
-        output = telnetlib.Telnet.read_until(self, expected, self._timeout)
-        return output.endswith(expected), self._decode(output)
+        success, output = self._read_until_found(self._text_finder(expected),
+                                                 self._timeout)
+        return success, self._decode(output)
+
+    def _text_finder(self, expected):
+        def find(data, searched):
+            # Only new data, and the end of old data where a match could
+            # begin, needs to be searched.
+            start = max(0, searched - len(expected) + 1)
+            index = data.find(expected, start)
+            return index + len(expected) if index != -1 else -1
+        return find
+
+    def _regexp_finder(self, regexp_list):
+        def find(data, searched):
+            match = _first_match(regexp_list, data)
+            return match.end() if match else -1
+        return find
+
+    def _read_until_found(self, find, timeout):
+        """Reads until `find` returns the end of the match or timeout expires.
+
+        `find` gets the received data and the length of data already
+        searched earlier as arguments. It is called again only after new
+        data has been received.
+        """
+        max_time = time.time() + timeout
+        self.process_rawq()
+        searched = 0
+        while True:
+            end = find(self.cookedq, searched)
+            if end != -1:
+                output, self.cookedq = self.cookedq[:end], self.cookedq[end:]
+                return True, output
+            searched = len(self.cookedq)
+            if not self._receive(max_time - time.time()):
+                return False, self.read_very_lazy()
+
+    def _receive(self, timeout):
+        """Waits for data max `timeout` seconds and reads all data available.
+
+        Data is read until no more is immediately available, or at least
+        `READ_BATCH_SIZE` bytes have been read, to avoid searching the
+        received output too often. Returns False if no data was received.
+        """
+        if self.eof or timeout <= 0 \
+                or not select.select([self], [], [], timeout)[0]:
+            return False
+        received = 0
+        while True:
+            self.fill_rawq()
+            received += len(self.rawq)
+            self.process_rawq()
+            if self.eof or received >= self.READ_BATCH_SIZE \
+                    or not self.sock_avail():
+                return True
+
+    def fill_rawq(self):
+        # Overrides telnetlib's version that reads only 50 bytes at a time
+        # to avoid quadratic behavior in its process_rawq.
+        if self.irawq >= len(self.rawq):
+            self.rawq = ''
+            self.irawq = 0
+        data = self.sock.recv(self.READ_CHUNK_SIZE)
+        self.msg("recv %r", data)
+        self.eof = not data
+        self.rawq = self.rawq + data
+
+    def process_rawq(self):
+        # telnetlib processes data one byte at a time. Here only telnet
+        # commands are processed that way and all data between them is
+        # moved to the cooked queue in one go.
+        data = self.rawq[self.irawq:]
+        self.rawq = ''
+        self.irawq = 0
+        cooked = [self.cookedq]
+        start = 0
+        while start < len(data):
+            if not (self.iacseq or self.sb):
+                end = data.find(telnetlib.IAC, start)
+                if end == -1:
+                    end = len(data)
+                if end > start:
+                    cooked.append(data[start:end].replace(telnetlib.theNULL, '')
+                                                 .replace('\021', ''))
+                    start = end
+                    continue
+            self.cookedq = ''.join(cooked)
+            self.rawq = data[start]
+            telnetlib.Telnet.process_rawq(self)
+            cooked = [self.cookedq]
+            start += 1
+        self.cookedq = ''.join(cooked)
 
     @property
     def _terminal_frequency(self):
@@ -858,9 +952,12 @@ class TelnetConnection(telnetlib.Telnet):
         out = self._terminal_emulator.read_until(expected)
         if out:
             return True, out
+        finder = self._text_finder(self._encode(expected))
         while time.time() < max_time:
-            input_bytes = telnetlib.Telnet.read_until(self, expected,
-                                                      self._terminal_frequency)
+            input_bytes = self._read_until_found(finder,
+                                                 self._terminal_frequency)[1]
+            if not input_bytes:
+                continue
             self._terminal_emulator.feed(input_bytes)
             out = self._terminal_emulator.read_until(expected)
             if out:
@@ -881,8 +978,12 @@ class TelnetConnection(telnetlib.Telnet):
         out = self._terminal_emulator.read_until_regexp(regexp_list)
         if out:
             return True, out
+        finder = self._regexp_finder(regexp_list)
         while time.time() < max_time:
-            output = self.expect(regexp_list, self._terminal_frequency)[-1]
+            output = self._read_until_found(finder,
+                                            self._terminal_frequency)[1]
+            if not output:
+                continue
             self._terminal_emulator.feed(output)
             out = self._terminal_emulator.read_until_regexp(regexp_list)
             if out:
@@ -891,10 +992,13 @@ class TelnetConnection(telnetlib.Telnet):
 
     def _telnet_read_until_regexp(self, expected_list):
         try:
-            index, _, output = self.expect(expected_list, self._timeout)
+            regexp_list = [rgx if hasattr(rgx, 'search') else re.compile(rgx)
+                           for rgx in expected_list]
+            success, output = self._read_until_found(
+                self._regexp_finder(regexp_list), self._timeout)
         except TypeError:
-            index, output = -1, ''
-        return index != -1, self._decode(output)
+            success, output = False, ''
+        return success, self._decode(output)
 
     def read_until_regexp(self, *expected):
         """Reads output until any of the `expected` regular expressions match.
@@ -1108,11 +1212,10 @@ class TerminalEmulator(object):
 
     def read_until_regexp(self, regexp_list):
         current_out = self.current_output
-        for rgx in regexp_list:
-            match = rgx.search(current_out)
-            if match:
-                self._update_buffer(current_out[match.end():])
-                return current_out[:match.end()]
+        match = _first_match(regexp_list, current_out)
+        if match:
+            self._update_buffer(current_out[match.end():])
+            return current_out[:match.end()]
         return None
 
     def _update_buffer(self, terminal_buffer):
@@ -1139,3 +1242,13 @@ class NoMatchError(AssertionError):
         if self.output is not None:
             msg += ' Output:\n%s' % self.output
         return msg
+
+
+def _first_match(regexp_list, data):
+    """Returns the match ending first or None. Earlier regexps win ties."""
+    first = None
+    for regexp in regexp_list:
+        match = regexp.search(data)
+        if match and (not first or match.end() < first.end()):
+            first = match
+    return first
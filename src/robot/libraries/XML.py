@@ -15,6 +15,7 @@
 from __future__ import with_statement
 
 import copy
+import os
 import re
 
 try:
@@ -87,6 +88,16 @@ class XML(object):
     escaped by doubling it (`\\\\`). Using the built-in variable `${/}`
     naturally works too.
 
+    Keywords that only read information from the source, such as
+    `Get Element Text`, `Get Element Count` and `Element Attribute Should Be`,
+    cache documents they have parsed. Using such keywords repeatedly with
+    the same XML file or string thus parses the document only once. Files
+    are parsed again if their modification time or size changes. Keywords
+    that return elements or modify them, such as `Parse XML`, `Get Element`
+    and `Set Element Text`, always parse the source again. How many
+    documents to cache can be configured when `importing` the library and
+    `Get Parse Cache Statistics` tells how well the cache works.
+
     = Example =
 
     The following simple example demonstrates parsing XML and verifying its
@@ -387,7 +398,7 @@ class XML(object):
     _whitespace = re.compile('\s+')
     _xml_declaration = re.compile('^<\?xml .*\?>\n')
 
-    def __init__(self, use_lxml=False):
+    def __init__(self, use_lxml=False, cache_size=5):
         """Import library with optionally lxml mode enabled.
 
         By default this library uses Python's standard
@@ -402,6 +413,11 @@ class XML(object):
         will emit a warning and revert back to using the standard ElementTree.
 
         The support for lxml is new in Robot Framework 2.8.5.
+
+        `cache_size` specifies how many parsed documents keywords that only
+        read information from them cache. Use `0` to disable the cache. See
+        `Parsing XML` section for more information. New in Robot Framework
+        2.8.6.
         """
         if use_lxml and lxml_etree:
             self.etree = lxml_etree
@@ -414,6 +430,9 @@ class XML(object):
         if use_lxml and not lxml_etree:
             logger.warn('XML library reverted to use standard ElementTree '
                         'because lxml module is not installed.')
+        self._cache = ParseCache(int(cache_size))
+        self._finder = ElementFinder(self.etree, self.modern_etree,
+                                     self.lxml_etree)
 
     def parse_xml(self, source, keep_clark_notation=False):
         """Parses the given XML file or string into an element structure.
@@ -473,7 +492,10 @@ class XML(object):
         given as a string. The XML structure parsed based on the string and
         then modified is nevertheless returned.
         """
-        elements = self.get_elements(source, xpath)
+        return self._get_element(source, xpath)
+
+    def _get_element(self, source, xpath='.', read_only=False):
+        elements = self._get_elements(source, xpath, read_only)
         if len(elements) != 1:
             self._raise_wrong_number_of_matches(len(elements), xpath)
         return elements[0]
@@ -507,10 +529,17 @@ class XML(object):
         | ${children} =    | Get Elements | ${XML} | first/child |
         | Should Be Empty  |  ${children} |        |             |
         """
+        return self._get_elements(source, xpath)
+
+    def _get_elements(self, source, xpath, read_only=False):
+        # Read only access can use cached documents because returned
+        # elements are not modified nor returned to the user.
         if isinstance(source, basestring):
-            source = self.parse_xml(source)
-        finder = ElementFinder(self.etree, self.modern_etree, self.lxml_etree)
-        return finder.find_all(source, xpath)
+            if read_only:
+                source = self._cache.get(source, self.parse_xml)
+            else:
+                source = self.parse_xml(source)
+        return self._finder.find_all(source, xpath)
 
     def get_child_elements(self, source, xpath='.'):
         """Returns the child elements of the specified element as a list.
@@ -540,7 +569,7 @@ class XML(object):
 
         New in Robot Framework 2.7.5.
         """
-        count = len(self.get_elements(source, xpath))
+        count = len(self._get_elements(source, xpath, read_only=True))
         logger.info("%d element%s matched '%s'." % (count, s(count), xpath))
         return count
 
@@ -610,7 +639,7 @@ class XML(object):
         See also `Get Elements Texts`, `Element Text Should Be` and
         `Element Text Should Match`.
         """
-        element = self.get_element(source, xpath)
+        element = self._get_element(source, xpath, read_only=True)
         text = ''.join(self._yield_texts(element))
         if normalize_whitespace:
             text = self._normalize_whitespace(text)
@@ -645,8 +674,9 @@ class XML(object):
         | Should Be Equal  | @{texts}[0]        | more text |             |
         | Should Be Equal  | @{texts}[1]        | ${EMPTY}  |             |
         """
+        elements = self._get_elements(source, xpath, read_only=True)
         return [self.get_element_text(elem, normalize_whitespace=normalize_whitespace)
-                for elem in self.get_elements(source, xpath)]
+                for elem in elements]
 
     def element_text_should_be(self, source, expected, xpath='.',
                                normalize_whitespace=False, message=None):
@@ -714,7 +744,8 @@ class XML(object):
         See also `Get Element Attributes`, `Element Attribute Should Be`,
         `Element Attribute Should Match` and `Element Should Not Have Attribute`.
         """
-        return self.get_element(source, xpath).get(name, default)
+        element = self._get_element(source, xpath, read_only=True)
+        return element.get(name, default)
 
     def get_element_attributes(self, source, xpath='.'):
         """Returns all attributes of the specified element.
@@ -734,7 +765,7 @@ class XML(object):
 
         Use `Get Element Attribute` to get the value of a single attribute.
         """
-        return dict(self.get_element(source, xpath).attrib)
+        return dict(self._get_element(source, xpath, read_only=True).attrib)
 
     def element_attribute_should_be(self, source, name, expected, xpath='.',
                                     message=None):
@@ -869,7 +900,8 @@ class XML(object):
                           normalize_whitespace):
         normalizer = self._normalize_whitespace if normalize_whitespace else None
         comparator = ElementComparator(comparator, normalizer, exclude_children)
-        comparator.compare(self.get_element(source), self.get_element(expected))
+        comparator.compare(self._get_element(source, read_only=True),
+                           self._get_element(expected, read_only=True))
 
     def set_element_tag(self, source, tag, xpath='.'):
         """Sets the tag of the specified element to `tag`.
@@ -1167,7 +1199,8 @@ class XML(object):
 
         See also `Log Element` and `Save XML`.
         """
-        string = self.etree.tostring(self.get_element(source, xpath), encoding='UTF-8')
+        element = self._get_element(source, xpath, read_only=True)
+        string = self.etree.tostring(element, encoding='UTF-8')
         return self._xml_declaration.sub('', string.decode('UTF-8')).strip()
 
     def log_element(self, source, level='INFO', xpath='.'):
@@ -1234,6 +1267,33 @@ class XML(object):
             raise RuntimeError("'Evaluate Xpath' keyword only works in lxml mode.")
         return self.get_element(source, context).xpath(expression)
 
+    def get_parse_cache_statistics(self):
+        """Returns statistics about caching parsed documents as a dictionary.
+
+        The returned dictionary contains the number of times a cached
+        document was used (`hits`) and a document needed to be parsed
+        (`misses`), how many documents are currently cached (`size`), and
+        the maximum number of cached documents (`max_size`). Additionally
+        `xpaths` tells how many compiled xpaths are cached in lxml mode.
+
+        See `Parsing XML` section for more information about caching.
+
+        Example:
+        | Element Text Should Be | ${XML}       | text      | first |
+        | Element Text Should Be | ${XML}       | more text | third/child |
+        | ${stats} =             | Get Parse Cache Statistics |
+        | Should Be Equal        | ${stats['hits']} | ${1}  |
+
+        New in Robot Framework 2.8.6.
+        """
+        stats = self._cache.statistics
+        stats['xpaths'] = self._finder.compiled_xpaths
+        logger.info('%d hit%s, %d miss%s, %d/%d document%s cached.'
+                    % (stats['hits'], s(stats['hits']), stats['misses'],
+                       'es' if stats['misses'] != 1 else '', stats['size'],
+                       stats['max_size'], s(stats['max_size'])))
+        return stats
+
 
 class NameSpaceStripper(object):
 
@@ -1254,12 +1314,65 @@ class NameSpaceStripper(object):
             self.unstrip(child, ns)
 
 
+class ParseCache(object):
+    """Least recently used cache of parsed XML files and strings.
+
+    Files are identified by their absolute path, modification time and size.
+    Strings are used as keys themselves.
+    """
+
+    def __init__(self, max_size=5):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._keys = []    # Least recently used first.
+        self._elements = {}
+
+    @property
+    def statistics(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._keys), 'max_size': self.max_size}
+
+    def get(self, source, parse):
+        """Returns cached `source` or parses it using `parse`."""
+        if self.max_size <= 0:
+            return parse(source)
+        key = self._get_key(source)
+        if key in self._elements:
+            self.hits += 1
+            self._keys.remove(key)
+            self._keys.append(key)
+            return self._elements[key]
+        self.misses += 1
+        element = parse(source)
+        self._elements[key] = element
+        self._keys.append(key)
+        if len(self._keys) > self.max_size:
+            del self._elements[self._keys.pop(0)]
+        return element
+
+    def _get_key(self, source):
+        if source.lstrip().startswith('<'):
+            return source
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return source
+        return os.path.abspath(source), stat.st_mtime, stat.st_size
+
+
 class ElementFinder(object):
+    _max_compiled_xpaths = 1000
 
     def __init__(self, etree, modern=True, lxml=False):
         self.etree = etree
         self.modern = modern
         self.lxml = lxml
+        self._compiled = {}
+
+    @property
+    def compiled_xpaths(self):
+        return len(self._compiled)
 
     def find_all(self, elem, xpath):
         xpath = self._get_xpath(xpath)
@@ -1267,8 +1380,14 @@ class ElementFinder(object):
             return [elem]
         if not self.lxml:
             return elem.findall(xpath)
-        finder = self.etree.ETXPath(xpath)
-        return finder(elem)
+        return self._compile(xpath)(elem)
+
+    def _compile(self, xpath):
+        if xpath not in self._compiled:
+            if len(self._compiled) >= self._max_compiled_xpaths:
+                self._compiled.clear()
+            self._compiled[xpath] = self.etree.ETXPath(xpath)
+        return self._compiled[xpath]
 
     def _get_xpath(self, xpath):
         if not xpath:
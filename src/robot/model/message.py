@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import html_escape
+from robot.utils import html_escape, Timestamp
 
 from .itemlist import ItemList
 from .modelobject import ModelObject
@@ -24,7 +24,11 @@ class Message(ModelObject):
     The message can be a log message triggered by a keyword, or a warning
     or an error occurred during the test execution.
     """
-    __slots__ = ['message', 'level', 'html', 'timestamp', 'parent']
+    __slots__ = ['message', 'level', 'html', '_timestamp', 'parent']
+    #: Timestamp in format ``%Y%m%d %H:%M:%S.%f``.
+    timestamp = Timestamp('_timestamp')
+    #: Timestamp in milliseconds after the epoch.
+    timestamp_millis = Timestamp('_timestamp', millis=True)
 
     def __init__(self, message='', level='INFO', html=False, timestamp=None,
                  parent=None):
@@ -35,7 +39,6 @@ class Message(ModelObject):
         self.level = level
         #: ``True`` if the content is in HTML, ``False`` otherwise.
         self.html = html
-        #: Timestamp in format ``%Y%m%d %H:%M:%S.%f``.
         self.timestamp = timestamp
         #: The object this message was triggered by.
         self.parent = parent
@@ -12,7 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import Matcher, NormalizedDict, setter
+import re
+
+from robot.utils import get_normalizer, setter
+
+
+# Normalized tags are cached which avoids normalizing same tags repeatedly
+# and also makes equal normalized tags share same string objects.
+_normalize = get_normalizer(ignore=['_'])
 
 
 class Tags(object):
@@ -23,17 +30,23 @@ class Tags(object):
     @setter
     def _tags(self, tags):
         if not tags:
+            self._normalized = frozenset()
             return ()
         if isinstance(tags, basestring):
             tags = (tags,)
         return self._normalize(tags)
 
     def _normalize(self, tags):
-        normalized = NormalizedDict(((t, 1) for t in tags), ignore='_')
-        for removed in '', 'NONE':
-            if removed in normalized:
-                normalized.pop(removed)
-        return tuple(normalized)
+        # The first tag wins if tags are equal after normalization.
+        normalized = {}
+        for tag in tags:
+            key = _normalize(tag)
+            if key not in normalized:
+                normalized[key] = tag
+        for removed in '', 'none':
+            normalized.pop(removed, None)
+        self._normalized = frozenset(normalized)
+        return tuple(normalized[key] for key in sorted(normalized))
 
     def add(self, tags):
         self._tags = tuple(self) + tuple(Tags(tags))
@@ -71,14 +84,20 @@ class Tags(object):
         return Tags(tuple(self) + tuple(Tags(other)))
 
 
+def _get_normalized(tags):
+    if not isinstance(tags, Tags):
+        tags = Tags(tags)
+    return tags._normalized
+
+
 class TagPatterns(object):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in Tags(patterns))
+        self._matcher = _OrTagPattern(self._patterns)
 
     def match(self, tags):
-        tags = tags if isinstance(tags, Tags) else Tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        return self._matcher.match(tags)
 
     def __contains__(self, tag):
         return self.match(tag)
@@ -93,7 +112,57 @@ class TagPatterns(object):
         return self._patterns[index]
 
 
+class MultiTagPatterns(object):
+    """Matches tags against multiple tag patterns at once.
+
+    Results depend only on tags that match some of the patterns, and they
+    are cached based on these tags. Matching is thus fast when tests have
+    similar tags even if there are lots of patterns.
+    """
+    _max_cache_size = 10000
+
+    def __init__(self, patterns):
+        self._patterns = tuple(p if isinstance(p, TagPatterns) else
+                               TagPatterns(p) for p in patterns)
+        self._relevant = _OrTagPattern(single for p in self._patterns
+                                       for pattern in p
+                                       for single in
+                                       pattern._get_single_patterns())
+        self._relevant_cache = {}
+        self._match_cache = {}
+
+    def match(self, tags):
+        """Returns indices of patterns that match the given tags."""
+        relevant = frozenset(tag for tag in _get_normalized(tags)
+                             if self._is_relevant(tag))
+        if relevant not in self._match_cache:
+            self._add_to_cache(self._match_cache, relevant,
+                               tuple(index for index, pattern
+                                     in enumerate(self._patterns)
+                                     if pattern._matcher._match(relevant)))
+        return self._match_cache[relevant]
+
+    def _is_relevant(self, tag):
+        if tag not in self._relevant_cache:
+            self._add_to_cache(self._relevant_cache, tag,
+                               self._relevant._match((tag,)))
+        return self._relevant_cache[tag]
+
+    def _add_to_cache(self, cache, key, value):
+        if len(cache) >= self._max_cache_size:
+            cache.clear()
+        cache[key] = value
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+
 def TagPattern(pattern):
+    if not isinstance(pattern, basestring):
+        return pattern
     if 'NOT' in pattern:
         return _NotTagPattern(*pattern.split('NOT'))
     if 'OR' in pattern:
@@ -103,41 +172,103 @@ def TagPattern(pattern):
     return _SingleTagPattern(pattern)
 
 
-class _SingleTagPattern(object):
+class _TagPattern(object):
+    """Base class for tag patterns.
 
-    def __init__(self, pattern):
-        self._matcher = Matcher(pattern, ignore='_')
+    Patterns are matched against normalized tags that :class:`Tags` objects
+    create only once. Subclasses implement matching in :meth:`_match`.
+    """
 
     def match(self, tags):
-        return self._matcher.match_any(tags)
+        return self._match(_get_normalized(tags))
 
-    def __unicode__(self):
-        return self._matcher.pattern
+    def _match(self, normalized):
+        raise NotImplementedError
 
+    def _get_single_patterns(self):
+        for pattern in self._patterns:
+            for single in pattern._get_single_patterns():
+                yield single
 
-class _AndTagPattern(object):
 
-    def __init__(self, patterns):
-        self._patterns = tuple(TagPattern(p) for p in patterns)
+class _SingleTagPattern(_TagPattern):
+    _wildcards = re.compile('(\*|\?)')
 
-    def match(self, tags):
-        return all(p.match(tags) for p in self._patterns)
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.normalized = _normalize(pattern)
+        self.regexp = self._get_regexp(self.normalized)
+        self._matcher = re.compile('^%s$' % self.regexp, re.DOTALL) \
+                if self.is_wildcard else None
+
+    @property
+    def is_wildcard(self):
+        return '*' in self.normalized or '?' in self.normalized
+
+    def _get_regexp(self, pattern):
+        tokens = self._wildcards.split(pattern)
+        return ''.join('.*' if token == '*' else '.' if token == '?' else
+                       re.escape(token) for token in tokens)
+
+    def _match(self, normalized):
+        if not self._matcher:
+            return self.normalized in normalized
+        return any(self._matcher.match(tag) for tag in normalized)
 
+    def _get_single_patterns(self):
+        yield self
 
-class _OrTagPattern(object):
+    def __unicode__(self):
+        return self.pattern
+
+
+class _AndTagPattern(_TagPattern):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in patterns)
 
-    def match(self, tags):
-        return any(p.match(tags) for p in self._patterns)
+    def _match(self, normalized):
+        return all(p._match(normalized) for p in self._patterns)
+
 
+class _OrTagPattern(_TagPattern):
+    """Matches if any of the patterns matches.
 
-class _NotTagPattern(object):
+    Patterns without wildcards are matched using a set and all wildcard
+    patterns are combined into one regular expression. Other patterns are
+    matched separately.
+    """
+
+    def __init__(self, patterns):
+        self._patterns = patterns = tuple(TagPattern(p) for p in patterns)
+        single = [p for p in patterns if isinstance(p, _SingleTagPattern)]
+        self._exact = frozenset(p.normalized for p in single
+                                if not p.is_wildcard)
+        wildcards = [p.regexp for p in single if p.is_wildcard]
+        self._wildcards = re.compile('^(?:%s)$' % '|'.join(wildcards),
+                                     re.DOTALL) if wildcards else None
+        self._others = tuple(p for p in patterns
+                             if not isinstance(p, _SingleTagPattern))
+
+    def _match(self, normalized):
+        for tag in normalized:
+            if tag in self._exact:
+                return True
+            if self._wildcards and self._wildcards.match(tag):
+                return True
+        return any(p._match(normalized) for p in self._others)
+
+
+class _NotTagPattern(_TagPattern):
 
     def __init__(self, must_match, *must_not_match):
         self._first = TagPattern(must_match)
         self._rest = _OrTagPattern(must_not_match)
 
-    def match(self, tags):
-        return self._first.match(tags) and not self._rest.match(tags)
+    def _match(self, normalized):
+        return self._first._match(normalized) and \
+            not self._rest._match(normalized)
+
+    @property
+    def _patterns(self):
+        return self._first, self._rest
@@ -18,7 +18,7 @@ from robot.utils import NormalizedDict
 
 from .criticality import Criticality
 from .stats import TagStat, CombinedTagStat
-from .tags import TagPatterns
+from .tags import MultiTagPatterns, TagPatterns
 
 
 class TagStatistics(object):
@@ -48,6 +48,9 @@ class TagStatisticsBuilder(object):
         self._excluded = TagPatterns(excluded)
         self._info = TagStatInfo(criticality, docs, links)
         self.stats = TagStatistics(self._info.get_combined_stats(combined))
+        self._combined = MultiTagPatterns(stat.combined
+                                          for stat in self.stats.combined)
+        self._included_tags = {}
 
     def add_test(self, test):
         self._add_tags_to_statistics(test)
@@ -61,14 +64,22 @@ class TagStatisticsBuilder(object):
                 self.stats.tags[tag].add_test(test)
 
     def _is_included(self, tag):
+        # Results are cached but the cache is cleared when it grows too big
+        # to avoid unique tags like ids using lots of memory.
+        if tag not in self._included_tags:
+            if len(self._included_tags) >= 10000:
+                self._included_tags.clear()
+            self._included_tags[tag] = self._match_included(tag)
+        return self._included_tags[tag]
+
+    def _match_included(self, tag):
         if self._included and not self._included.match(tag):
             return False
         return not self._excluded.match(tag)
 
     def _add_to_combined_statistics(self, test):
-        for comb in self.stats.combined:
-            if comb.match(test.tags):
-                comb.add_test(test)
+        for index in self._combined.match(test.tags):
+            self.stats.combined[index].add_test(test)
 
 
 class TagStatInfo(object):
@@ -0,0 +1,164 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import zlib
+
+from robot.errors import DataError
+from robot.result import binaryformat as fmt
+from robot.result.visitor import ResultVisitor
+from robot.utils import get_timestamp, unic
+from robot.version import get_full_version
+
+from .loggerhelper import IsLogged
+
+
+class BinaryLogger(ResultVisitor):
+    """Writes output in the compact binary format.
+
+    Has the same interface as :class:`~.xmllogger.XmlLogger` and can thus
+    be used in its place. See :mod:`robot.result.binaryformat` for details
+    about the format.
+    """
+
+    def __init__(self, path, log_level='TRACE', generator='Robot'):
+        self._log_message_is_logged = IsLogged(log_level)
+        self._error_message_is_logged = IsLogged('WARN')
+        self._writer = BinaryWriter(path, generator)
+        self._errors = []
+
+    def close(self):
+        self.start_errors()
+        for msg in self._errors:
+            self._write_message(msg)
+        self._writer.close()
+
+    def set_log_level(self, level):
+        return self._log_message_is_logged.set_level(level)
+
+    def message(self, msg):
+        if self._error_message_is_logged(msg.level):
+            self._errors.append(msg)
+
+    def log_message(self, msg):
+        if self._log_message_is_logged(msg.level):
+            self._write_message(msg)
+
+    def _write_message(self, msg):
+        self._writer.record(fmt.MESSAGE, msg.message, msg.level,
+                            bool(msg.html), msg.timestamp or '')
+
+    def start_keyword(self, kw):
+        self._writer.record(fmt.KEYWORD_START, kw.name, kw.type,
+                            unicode(kw.timeout or ''), kw.doc,
+                            tuple(unic(a) for a in kw.args))
+
+    def end_keyword(self, kw):
+        self._writer.record(fmt.KEYWORD_END, *self._get_status(kw))
+
+    def start_test(self, test):
+        self._writer.record(fmt.TEST_START, test.name,
+                            unicode(test.timeout or ''))
+
+    def end_test(self, test):
+        self._writer.record(fmt.TEST_END, test.doc,
+                            *self._get_status(test) + (tuple(test.tags),))
+
+    def start_suite(self, suite):
+        self._writer.record(fmt.SUITE_START, suite.name, suite.source or '')
+
+    def end_suite(self, suite):
+        metadata = tuple(item for name_and_value in suite.metadata.items()
+                         for item in name_and_value)
+        self._writer.record(fmt.SUITE_END, suite.doc,
+                            *self._get_status(suite)[1:] + (metadata,))
+
+    def _get_status(self, item):
+        return (fmt.STATUS_CODES.get(item.status, 0), item.message,
+                item.starttime or '', item.endtime or '')
+
+    def start_errors(self, errors=None):
+        self._writer.record(fmt.ERRORS_START)
+
+    def visit_statistics(self, stats):
+        pass
+
+
+class BinaryWriter(object):
+
+    def __init__(self, path, generator='Robot'):
+        try:
+            self._output = open(path, 'wb')
+        except EnvironmentError, err:
+            raise DataError("Opening output file '%s' failed: %s" %
+                            (path, err.strerror))
+        self._write_header(get_full_version(generator), get_timestamp())
+        self._strings = {}
+        self._new_strings = []
+        self._records = []
+        self._count = 0
+
+    def _write_header(self, generator, generated):
+        header = '\n'.join([generator, generated, fmt.describe_records()])
+        header = header.encode('UTF-8')
+        self._output.write(fmt.MAGIC)
+        self._output.write(fmt.HEADER.pack(fmt.VERSION, len(header)))
+        self._output.write(header)
+
+    def record(self, type, *fields):
+        """Writes a record. Fields must be in the order the format defines.
+
+        With record types having string indices at the end, the last field
+        must be a sequence of strings.
+        """
+        records = self._records
+        records.append(chr(type))
+        if type in fmt.RECORDS_WITH_ITEMS:
+            items = [self._index(item) for item in fields[-1]]
+            fields = fields[:-1]
+        else:
+            items = None
+        records.append(fmt.RECORD_STRUCTS[type].pack(
+            *[self._index(f) if isinstance(f, basestring) else f
+              for f in fields]))
+        if items is not None:
+            records.append(fmt.COUNT.pack(len(items)))
+            records.append(fmt.uint_struct(len(items)).pack(*items))
+        self._count += 1
+        if self._count >= fmt.CHUNK_SIZE:
+            self._flush()
+
+    def _index(self, string):
+        try:
+            return self._strings[string]
+        except KeyError:
+            index = self._strings[string] = len(self._strings)
+            self._new_strings.append(unic(string).encode('UTF-8'))
+            return index
+
+    def _flush(self):
+        strings = self._new_strings
+        lengths = fmt.uint_struct(len(strings)).pack(*[len(s) for s in strings])
+        data = ''.join([fmt.COUNT.pack(len(strings)), lengths]
+                       + strings + self._records)
+        data = zlib.compress(data)
+        self._output.write(fmt.CHUNK.pack(len(data),
+                                          zlib.crc32(data) & 0xffffffff))
+        self._output.write(data)
+        self._new_strings = []
+        self._records = []
+        self._count = 0
+
+    def close(self):
+        self._flush()
+        self._output.close()
@@ -64,6 +64,7 @@ class _LibraryListenerProxy(ListenerProxy):
         self.name = type(library).__name__
         self.version = self._get_version(library.listener)
         self.is_java = self._is_java(library.listener)
+        self.is_async = False
         self.library_scope = library.scope
 
     def _get_method_names(self, name):
@@ -14,6 +14,9 @@
 
 import inspect
 import os.path
+import threading
+from collections import deque
+from Queue import Queue, Full
 
 from robot import utils
 from robot.errors import DataError
@@ -56,6 +59,7 @@ class Listeners(object):
     _start_attrs = ('id', 'doc', 'starttime', 'longname')
     _end_attrs = _start_attrs + ('endtime', 'elapsedtime', 'status', 'message')
     _kw_extra_attrs = ('args', '-id', '-longname', '-message')
+    _attr_names = {}
 
     def __init__(self, listeners):
         self._listeners = self._import_listeners(listeners)
@@ -69,7 +73,10 @@ class Listeners(object):
         listeners = []
         for name, args in listener_data:
             try:
-                listeners.append(ListenerProxy(name, args))
+                listener = ListenerProxy(name, args)
+                if listener.is_async:
+                    listener = AsyncListenerProxy(listener)
+                listeners.append(listener)
             except DataError, err:
                 if args:
                     name += ':' + ':'.join(args)
@@ -187,6 +194,9 @@ class Listeners(object):
     def close(self):
         for listener in self._listeners:
             listener.call_method(listener.close)
+        for listener in self._listeners:
+            if listener.is_async:
+                listener.stop()
 
     def _get_start_attrs(self, item, *extra):
         return self._get_attrs(item, self._start_attrs, extra)
@@ -199,13 +209,16 @@ class Listeners(object):
         return dict((n, self._get_attr_value(item, n)) for n in names)
 
     def _get_attr_names(self, default, extra):
-        names = list(default)
-        for name in extra:
-            if not name.startswith('-'):
-                names.append(name)
-            elif name[1:] in names:
-                names.remove(name[1:])
-        return names
+        key = (default, extra)
+        if key not in self._attr_names:
+            names = list(default)
+            for name in extra:
+                if not name.startswith('-'):
+                    names.append(name)
+                elif name[1:] in names:
+                    names.remove(name[1:])
+            self._attr_names[key] = tuple(names)
+        return self._attr_names[key]
 
     def _get_attr_value(self, item, name):
         value = getattr(item, name)
@@ -231,10 +244,17 @@ class ListenerProxy(AbstractLoggerProxy):
         self.name = name
         self.version = self._get_version(listener)
         self.is_java = self._is_java(listener)
+        self.is_async = self._is_async(listener)
 
     def _is_java(self, listener):
         return utils.is_jython and isinstance(listener, Object)
 
+    def _is_async(self, listener):
+        value = getattr(listener, 'ROBOT_LISTENER_ASYNC', False)
+        if isinstance(value, basestring):
+            return value.upper() not in ('', 'FALSE', 'NO')
+        return bool(value)
+
     def _import_listener(self, name, args):
         importer = utils.Importer('listener')
         return importer.import_class_or_module(os.path.normpath(name),
@@ -247,15 +267,20 @@ class ListenerProxy(AbstractLoggerProxy):
             return 1
 
     def call_method(self, method, *args):
-        if self.is_java:
-            args = [self._to_map(a) if isinstance(a, dict) else a for a in args]
         try:
-            method(*args)
+            self._call_method(method, args)
         except:
-            message, details = utils.get_error_details()
-            LOGGER.error("Calling listener method '%s' of listener '%s' failed: %s"
+            self._report_failure(method, *utils.get_error_details())
+
+    def _call_method(self, method, args):
+        if self.is_java:
+            args = [self._to_map(a) if isinstance(a, dict) else a for a in args]
+        method(*args)
+
+    def _report_failure(self, method, message, details):
+        LOGGER.error("Calling listener method '%s' of listener '%s' failed: %s"
                      % (method.__name__, self.name, message))
-            LOGGER.info("Details:\n%s" % details)
+        LOGGER.info("Details:\n%s" % details)
 
     def _to_map(self, dictionary):
         map = HashMap()
@@ -264,6 +289,87 @@ class ListenerProxy(AbstractLoggerProxy):
         return map
 
 
+class AsyncListenerProxy(object):
+    """Delivers listener method calls in a background thread.
+
+    Listeners opt in by setting ``ROBOT_LISTENER_ASYNC`` attribute. Calls are
+    put into a bounded queue whose size can be set with
+    ``ROBOT_LISTENER_QUEUE_SIZE`` attribute (default 1000). When the queue is
+    full, execution waits until there is room, or, if the attribute value is
+    ``'drop'``, ``log_message`` and ``message`` calls are dropped. Attributes
+    passed to listener methods are created for each call and not used by
+    the execution afterwards, so they can be delivered as is.
+    """
+    default_queue_size = 1000
+    _stop_record = None
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self._queue = Queue(self._get_queue_size(proxy.logger))
+        self._drop_messages = self._get_drop_messages(proxy.logger)
+        self._messages = (proxy.log_message, proxy.message)
+        self._failures = deque()
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._deliver,
+                                        name='RobotListenerThread')
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def __getattr__(self, name):
+        return getattr(self._proxy, name)
+
+    def _get_queue_size(self, listener):
+        try:
+            return int(getattr(listener, 'ROBOT_LISTENER_QUEUE_SIZE',
+                               self.default_queue_size))
+        except ValueError:
+            return self.default_queue_size
+
+    def _get_drop_messages(self, listener):
+        value = getattr(listener, 'ROBOT_LISTENER_ASYNC', '')
+        return isinstance(value, basestring) and value.upper() == 'DROP'
+
+    def call_method(self, method, *args):
+        self._report_failures()
+        if method == self._proxy._no_method:
+            return
+        if self._drop_messages and method in self._messages:
+            try:
+                self._queue.put_nowait((method, args))
+            except Full:
+                self.dropped += 1
+        else:
+            self._queue.put((method, args))
+
+    def stop(self):
+        """Waits until all queued calls are delivered and stops the thread."""
+        if self._thread.isAlive():
+            self._queue.put(self._stop_record)
+            self._thread.join()
+        self._report_failures()
+        if self.dropped:
+            LOGGER.warn("Listener '%s' dropped %d message%s because its "
+                        "queue was full." % (self.name, self.dropped,
+                                             utils.plural_or_not(self.dropped)))
+            self.dropped = 0
+
+    def _deliver(self):
+        while True:
+            record = self._queue.get()
+            if record is self._stop_record:
+                break
+            method, args = record
+            try:
+                self._proxy._call_method(method, args)
+            except:
+                self._failures.append((method, utils.get_error_details()))
+
+    def _report_failures(self):
+        while self._failures:
+            method, (message, details) = self._failures.popleft()
+            self._proxy._report_failure(method, message, details)
+
+
 # TODO: Remove in 2.9, left here in 2.8.5 for backwards compatibility.
 # Consider also decoupling importing from __init__ to ease extending.
 _ListenerProxy = ListenerProxy
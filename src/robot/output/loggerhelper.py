@@ -71,7 +71,8 @@ class Message(BaseMessage):
     def __init__(self, message, level='INFO', html=False, timestamp=None):
         message = self._normalize_message(message)
         level, html = self._get_level_and_html(level, html)
-        timestamp = timestamp or utils.get_timestamp()
+        if timestamp is None:
+            timestamp = utils.get_epoch_millis()
         BaseMessage.__init__(self, message, level, html, timestamp)
 
     def _normalize_message(self, msg):
@@ -12,7 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from robot.result.binaryformat import has_binary_extension
+
 from . import pyloggingconf
+from .binarylogger import BinaryLogger
 from .debugfile import DebugFile
 from .librarylisteners import LibraryListeners
 from .listeners import Listeners
@@ -25,10 +28,16 @@ class Output(AbstractLogger):
 
     def __init__(self, settings):
         AbstractLogger.__init__(self)
-        self._xmllogger = XmlLogger(settings['Output'], settings['LogLevel'])
+        self._xmllogger = self._get_output_logger(settings['Output'],
+                                                 settings['LogLevel'])
         self._register_loggers(settings['Listeners'], settings['DebugFile'])
         self._settings = settings
 
+    def _get_output_logger(self, path, log_level):
+        if has_binary_extension(path):
+            return BinaryLogger(path, log_level)
+        return XmlLogger(path, log_level)
+
     def _register_loggers(self, listeners, debugfile):
         LOGGER.register_context_changing_logger(self._xmllogger)
         for logger in (Listeners(listeners), LibraryListeners(),
@@ -14,8 +14,6 @@
 
 import re
 
-from robot.utils import format_time
-
 from .loggerhelper import Message, LEVELS
 
 
@@ -33,14 +31,18 @@ class StdoutLogSplitter(object):
     def _get_messages(self, output):
         for level, timestamp, msg in self._split_output(output):
             if timestamp:
-                timestamp = self._format_timestamp(timestamp[1:])
+                timestamp = self._to_millis(timestamp[1:])
             yield Message(msg.strip(), level, timestamp=timestamp)
 
     def _split_output(self, output):
+        if output and not self._may_contain_levels(output):
+            return [('INFO', None, output)]
         tokens = self._split_from_levels.split(output)
         tokens = self._add_initial_level_and_time_if_needed(tokens)
-        for i in xrange(0, len(tokens), 3):
-            yield tokens[i:i+3]
+        return [tokens[i:i+3] for i in xrange(0, len(tokens), 3)]
+
+    def _may_contain_levels(self, output):
+        return output.startswith('*') or '\n*' in output
 
     def _add_initial_level_and_time_if_needed(self, tokens):
         if self._output_started_with_level(tokens):
@@ -50,8 +52,8 @@ class StdoutLogSplitter(object):
     def _output_started_with_level(self, tokens):
         return tokens[0] == ''
 
-    def _format_timestamp(self, millis):
-        return format_time(float(millis)/1000, millissep='.')
+    def _to_millis(self, millis):
+        return int(round(float(millis)))
 
     def __iter__(self):
         return iter(self._messages)
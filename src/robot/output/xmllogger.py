@@ -145,9 +145,10 @@ class XmlLogger(ResultVisitor):
         self._writer.end(container_tag)
 
     def _write_status(self, item, extra_attrs=None):
-        attrs = {'status': item.status, 'starttime': item.starttime or 'N/A',
-                 'endtime': item.endtime or 'N/A'}
-        if not (item.starttime and item.endtime):
+        starttime, endtime = item.starttime, item.endtime
+        attrs = {'status': item.status, 'starttime': starttime or 'N/A',
+                 'endtime': endtime or 'N/A'}
+        if not (starttime and endtime):
             attrs['elapsedtime'] = str(item.elapsedtime)
         if extra_attrs:
             attrs.update(extra_attrs)
@@ -22,6 +22,7 @@ from robot import utils
 from robot.writer import DataFileWriter
 
 from .comments import Comment
+from .parsecache import PARSE_CACHE
 from .populators import FromFilePopulator, FromDirectoryPopulator
 from .settings import (Documentation, Fixture, Timeout, Tags, Metadata, Library,
     Resource, Variables, Arguments, Return, Template, MetadataList, ImportList)
@@ -62,6 +63,16 @@ class _TestData(object):
             for name in names:
                 yield name, table
 
+    def __getstate__(self):
+        # Table mapping contains a normalizer that cannot be pickled.
+        state = self.__dict__.copy()
+        del state['_tables']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._tables = utils.NormalizedDict(self._get_tables())
+
     def start_table(self, header_row):
         try:
             table = self._tables[header_row[0]]
@@ -128,10 +139,13 @@ class TestCaseFile(_TestData):
         _TestData.__init__(self, parent, source)
 
     def populate(self):
-        FromFilePopulator(self).populate(self.source)
+        PARSE_CACHE.populate(self, self._populate)
         self._validate()
         return self
 
+    def _populate(self):
+        FromFilePopulator(self).populate(self.source)
+
     def _validate(self):
         if not self.testcase_table.is_started():
             raise DataError('File has no test case table.')
@@ -163,10 +177,13 @@ class ResourceFile(_TestData):
         _TestData.__init__(self, source=source)
 
     def populate(self):
-        FromFilePopulator(self).populate(self.source)
+        PARSE_CACHE.populate(self, self._populate)
         self._report_status()
         return self
 
+    def _populate(self):
+        FromFilePopulator(self).populate(self.source)
+
     def _report_status(self):
         if self.setting_table or self.variable_table or self.keyword_table:
             LOGGER.info("Imported resource file '%s' (%d keywords)."
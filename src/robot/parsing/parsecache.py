@@ -0,0 +1,147 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Opt-in on-disk cache for parsed test case and resource files.
+
+The cache is enabled by setting the ``ROBOT_PARSE_CACHE`` environment
+variable to a directory where to store parsed files. Because the cache is
+used when parsing files, it is shared by all tools that parse test data.
+
+Cached files are identified by their absolute path, type and ``${CURDIR}``
+handling, and a cached file is used only if the modification time and size
+of the original file have not changed. Errors reported while parsing are
+stored into the cache and reported again when the cached file is used.
+"""
+
+from __future__ import with_statement
+
+import os
+import tempfile
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+from hashlib import sha1
+
+from robot.output import LOGGER
+from robot.utils import get_error_message
+from robot.version import get_full_version
+
+from . import populators
+
+
+class ParseCache(object):
+
+    def __init__(self, directory=None):
+        self._directory = directory
+
+    @property
+    def directory(self):
+        directory = self._directory
+        if directory is None:
+            directory = os.environ.get('ROBOT_PARSE_CACHE', 'NONE')
+        return directory if directory.upper() != 'NONE' else None
+
+    def populate(self, datafile, populate):
+        """Populates `datafile` from cache or using the given `populate`."""
+        directory = self.directory
+        if not directory or not datafile.source:
+            populate()
+            return
+        path = os.path.join(directory, self._get_cache_name(datafile))
+        stat = self._get_stat(datafile.source)
+        if not (stat and self._populate_from_cache(datafile, path, stat)):
+            errors = self._populate_and_record_errors(datafile, populate)
+            if stat:
+                self._write_cache(datafile, errors, path, stat)
+
+    def _get_cache_name(self, datafile):
+        key = '%s|%s|%s|%s' % (datafile.source, type(datafile).__name__,
+                               populators.PROCESS_CURDIR, get_full_version())
+        return sha1(key.encode('UTF-8')).hexdigest() + '.pickle'
+
+    def _get_stat(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def _populate_from_cache(self, datafile, path, stat):
+        try:
+            with open(path, 'rb') as cache:
+                cached_stat, errors, cached = pickle.load(cache)
+        except (IOError, EOFError):
+            return False
+        except Exception:
+            LOGGER.info("Reading parse cache '%s' failed: %s"
+                        % (path, get_error_message()))
+            return False
+        if cached_stat != stat:
+            return False
+        LOGGER.info("Using cached parsing results of file '%s'."
+                    % datafile.source)
+        parent = datafile.parent
+        datafile.__dict__.update(cached.__dict__)
+        datafile.parent = parent
+        for table in datafile:
+            table.parent = datafile
+        for message, level in errors:
+            datafile.report_invalid_syntax(message, level)
+        return True
+
+    def _populate_and_record_errors(self, datafile, populate):
+        errors = []
+        report_invalid_syntax = datafile.report_invalid_syntax
+        def record_and_report(message, level='ERROR'):
+            errors.append((message, level))
+            report_invalid_syntax(message, level)
+        datafile.report_invalid_syntax = record_and_report
+        try:
+            populate()
+        finally:
+            del datafile.report_invalid_syntax
+        return errors
+
+    def _write_cache(self, datafile, errors, path, stat):
+        parent = datafile.parent
+        datafile.parent = None
+        try:
+            self._write(path, (stat, errors, datafile))
+        except Exception:
+            LOGGER.info("Writing parse cache '%s' failed: %s"
+                        % (path, get_error_message()))
+        finally:
+            datafile.parent = parent
+
+    def _write(self, path, content):
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        # Written first to a temporary file to avoid concurrent processes
+        # reading partially written caches.
+        fd, temp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as cache:
+                pickle.dump(content, cache, pickle.HIGHEST_PROTOCOL)
+            if os.name == 'nt' and os.path.exists(path):
+                os.remove(path)
+            os.rename(temp, path)
+        except:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+
+
+PARSE_CACHE = ParseCache()
@@ -12,7 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import with_statement
+
 import os
+import threading
+from Queue import Queue
+from StringIO import StringIO
 
 from robot.errors import DataError
 from robot.model import SuiteNamePatterns
@@ -62,6 +67,9 @@ class FromFilePopulator(object):
             source.close()
 
     def _open(self, path):
+        prefetched = PREFETCHER.open(path)
+        if prefetched:
+            return prefetched
         if not os.path.isfile(path):
             raise DataError("Data source does not exist.")
         try:
@@ -122,12 +130,15 @@ class FromDirectoryPopulator(object):
             LOGGER.error(unicode(err))
 
     def _populate_children(self, datadir, children, include_suites, warn_on_skipped):
+        PREFETCHER.prefetch(children)
         for child in children:
             try:
                 datadir.add_child(child, include_suites)
             except DataError, err:
                 self._log_failed_parsing("Parsing data source '%s' failed: %s"
                             % (child, unicode(err)), warn_on_skipped)
+            finally:
+                PREFETCHER.discard(child)
 
     def _log_failed_parsing(self, message, warn):
         if warn:
@@ -198,3 +209,95 @@ class FromDirectoryPopulator(object):
 
     def _split_prefix(self, name):
         return name.split('__', 1)[-1]
+
+
+class FilePrefetcher(object):
+    """Reads test data files in background threads.
+
+    Reading files is started when a directory is parsed so that files are
+    already in memory when they are parsed. Parsing itself, and thus also
+    error reporting, happens in the calling thread in the normal order.
+
+    Enabled by setting the ``ROBOT_PARSING_THREADS`` environment variable
+    to the number of threads to use for reading files. Reading files in
+    threads is useful mainly with slow file systems.
+    """
+
+    def __init__(self, threads=None):
+        self._threads = threads
+        self._queue = None
+        self._files = {}
+        self._lock = threading.Lock()
+
+    @property
+    def threads(self):
+        threads = self._threads
+        if threads is None:
+            threads = os.environ.get('ROBOT_PARSING_THREADS', 1)
+        try:
+            return max(int(threads), 1)
+        except ValueError:
+            return 1
+
+    def prefetch(self, paths):
+        if self.threads < 2:
+            return
+        if not self._queue:
+            self._start_workers()
+        for path in paths:
+            with self._lock:
+                if path in self._files:
+                    continue
+                self._files[path] = _PrefetchedFile(path)
+            self._queue.put(self._files[path])
+
+    def _start_workers(self):
+        self._queue = Queue()
+        for _ in range(self.threads):
+            worker = threading.Thread(target=self._read_files)
+            worker.setDaemon(True)
+            worker.start()
+
+    def _read_files(self):
+        while True:
+            self._queue.get().read()
+
+    def open(self, path):
+        """Returns the prefetched file as a file-like object or None."""
+        with self._lock:
+            prefetched = self._files.pop(path, None)
+        return prefetched.open() if prefetched else None
+
+    def discard(self, path):
+        with self._lock:
+            self._files.pop(path, None)
+
+
+class _PrefetchedFile(object):
+
+    def __init__(self, path):
+        self._path = path
+        self._content = None
+        self._read = threading.Event()
+
+    def read(self):
+        try:
+            if os.path.isfile(self._path):
+                with open(self._path, 'rb') as source:
+                    self._content = source.read()
+        except EnvironmentError:
+            pass
+        finally:
+            self._read.set()
+
+    def open(self):
+        while not self._read.isSet():
+            self._read.wait(0.1)
+        if self._content is None:
+            return None
+        source = StringIO(self._content)
+        source.name = self._path
+        return source
+
+
+PREFETCHER = FilePrefetcher()
@@ -99,6 +99,21 @@ Options
                           the latter runs replace the original. Typically used
                           after using --rerunfailed option when running tests.
                           Example: rebot --rerunmerge orig.xml rerun.xml
+    --streaming           Process a single output file so that keywords are
+                          converted to log data while the file is being read
+                          and are not all kept in memory at the same time.
+                          Considerably reduces memory usage with large outputs.
+                          Generated log and report are identical to the ones
+                          created normally. Used only when creating a log file
+                          from one XML output file without --output,
+                          --rerunmerge or `--removekeywords passed`.
+    --reportprocesses count  Create log, report and xunit files using the
+                          given number of processes. Log and report data of
+                          child suites of the top level suite are built in
+                          parallel and files are written concurrently. Created
+                          files are identical to the ones created normally.
+                          Supported only on platforms where processes can be
+                          forked. Example: --reportprocesses 4
     --processemptysuite   Processes output also if the top level test suite is
                           empty. Useful e.g. with --include/--exclude when it
                           is not an error that no test matches the condition.
@@ -114,6 +129,13 @@ Options
                           specified. Given path, similarly as paths given to
                           --log, --report and --xunit, is relative to
                           --outputdir unless given as an absolute path.
+                          If the path has extension `.rbin`, output is written
+                          in a compact binary format. Input files in the binary
+                          format are recognized automatically and can be
+                          converted to XML like `rebot -o out.xml out.rbin`.
+                          If the extension is `.gz`, XML output is compressed
+                          using gzip. Compressed input files are recognized
+                          automatically.
  -l --log file            HTML log file. Can be disabled by giving a special
                           name `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l none`
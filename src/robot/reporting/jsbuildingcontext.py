@@ -17,20 +17,22 @@ import os.path
 
 from robot.output.loggerhelper import LEVELS
 from robot.utils import (html_escape, html_format, get_link_path,
-                         timestamp_to_secs)
+                         timestamp_to_millis)
 
 from .stringcache import StringCache
 
 
 class JsBuildingContext(object):
 
-    def __init__(self, log_path=None, split_log=False, prune_input=False):
+    def __init__(self, log_path=None, split_log=False, prune_input=False,
+                 string_compressor=None):
         # log_path can be a custom object in unit tests
         self._log_dir = os.path.dirname(log_path) \
                 if isinstance(log_path, basestring) else None
         self._split_log = split_log
         self._prune_input = prune_input
-        self._strings = self._top_level_strings = StringCache()
+        self._strings = self._top_level_strings = \
+                StringCache(string_compressor)
         self.basemillis = None
         self.split_results = []
         self.min_level = 'NONE'
@@ -55,7 +57,8 @@ class JsBuildingContext(object):
         if not time:
             return None
         # Must use `long` due to http://ironpython.codeplex.com/workitem/31549
-        millis = long(round(timestamp_to_secs(time) * 1000))
+        millis = long(timestamp_to_millis(time)
+                      if isinstance(time, basestring) else time)
         if self.basemillis is None:
             self.basemillis = millis
         return millis - self.basemillis
@@ -78,6 +81,20 @@ class JsBuildingContext(object):
     def strings(self):
         return self._strings.dump()
 
+    @property
+    def top_level_strings(self):
+        """Cache of strings not belonging to split log parts."""
+        return self._top_level_strings
+
+    @property
+    def message_links(self):
+        """Mapping from linked messages to indices of link target strings.
+
+        Keys are ``(message, level, timestamp)`` tuples and indices refer to
+        :attr:`top_level_strings`.
+        """
+        return self._msg_links
+
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
             self._strings = StringCache()
@@ -89,6 +106,21 @@ class JsBuildingContext(object):
         self._strings = self._top_level_strings
         return len(self.split_results)
 
+    def merge(self, other):
+        """Merges strings and other state of `other` context to this context.
+
+        Used when parts of the model are built in other processes. Returns
+        a list mapping string indices of `other` to indices in this context
+        and the number of split results this context had before merging.
+        """
+        indices = self._top_level_strings.merge(other.top_level_strings)
+        split_offset = len(self.split_results)
+        self.split_results.extend(other.split_results)
+        self.message_level(other.min_level)
+        for key, index in other.message_links.iteritems():
+            self._msg_links[key] = indices[index]
+        return indices, split_offset
+
     @contextmanager
     def prune_input(self, *items):
         yield
@@ -23,15 +23,16 @@ from .jsexecutionresult import JsExecutionResult
 class JsModelBuilder(object):
 
     def __init__(self, log_path=None, split_log=False,
-                 prune_input_to_save_memory=False):
+                 prune_input_to_save_memory=False, string_compressor=None):
         self._context = JsBuildingContext(log_path, split_log,
-                                          prune_input_to_save_memory)
+                                          prune_input_to_save_memory,
+                                          string_compressor)
 
     def build_from(self, result_from_xml):
         # Statistics must be build first because building suite may prune input.
         return JsExecutionResult(
             statistics=StatisticsBuilder().build(result_from_xml.statistics),
-            suite=SuiteBuilder(self._context).build(result_from_xml.suite),
+            suite=self._build_suite(result_from_xml.suite),
             errors=ErrorsBuilder(self._context).build(result_from_xml.errors),
             strings=self._context.strings,
             basemillis=self._context.basemillis,
@@ -39,6 +40,9 @@ class JsModelBuilder(object):
             min_level=self._context.min_level
         )
 
+    def _build_suite(self, suite):
+        return SuiteBuilder(self._context).build(suite)
+
 
 class _Builder(object):
     _statuses = {'FAIL': 0, 'PASS': 1, 'NOT_RUN': 2}
@@ -51,7 +55,7 @@ class _Builder(object):
 
     def _get_status(self, item):
         model = (self._statuses[item.status],
-                 self._timestamp(item.starttime),
+                 self._timestamp(item.starttime_millis),
                  item.elapsedtime)
         msg = getattr(item, 'message', '')
         if not msg:
@@ -85,11 +89,14 @@ class SuiteBuilder(_Builder):
                     self._html(suite.doc),
                     tuple(self._yield_metadata(suite)),
                     self._get_status(suite),
-                    tuple(self._build_suite(s) for s in suite.suites),
+                    self._build_suites(suite.suites),
                     tuple(self._build_test(t) for t in suite.tests),
                     tuple(self._build_keyword(k, split=True) for k in suite.keywords),
                     stats)
 
+    def _build_suites(self, suites):
+        return tuple(self._build_suite(s) for s in suites)
+
     def _yield_metadata(self, suite):
         for name, value in suite.metadata.iteritems():
             yield self._string(name)
@@ -149,7 +156,7 @@ class MessageBuilder(_Builder):
         return self._build(msg)
 
     def _build(self, msg):
-        return (self._timestamp(msg.timestamp),
+        return (self._timestamp(msg.timestamp_millis),
                 LEVELS[msg.level],
                 self._string(msg.html_message, escape=False))
 
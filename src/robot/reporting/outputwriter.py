@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from robot.output.binarylogger import BinaryLogger
 from robot.output.xmllogger import XmlLogger
 
 
@@ -29,3 +30,18 @@ class OutputWriter(XmlLogger):
 
     def end_result(self, result):
         self.close()
+
+
+class BinaryOutputWriter(BinaryLogger):
+
+    def __init__(self, output):
+        BinaryLogger.__init__(self, output, generator='Rebot')
+
+    def start_message(self, msg):
+        self._write_message(msg)
+
+    def close(self):
+        self._writer.close()
+
+    def end_result(self, result):
+        self.close()
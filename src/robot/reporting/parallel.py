@@ -0,0 +1,224 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Creates log, report and xUnit files using multiple processes.
+
+Models of the top level suite's child suites are built in forked worker
+processes. Each worker uses its own string cache and the results are merged
+in the original suite order, which keeps string indices, split log indices,
+and other details the same as when building the model in one process.
+Log, report and xUnit files are also written concurrently in forked
+processes, and long strings in the log are compressed using a process pool.
+
+Worker processes are forked so that they inherit the result model instead
+of getting it pickled. This is thus supported only on platforms having
+``os.fork`` and the ``multiprocessing`` module.
+"""
+
+import os
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+from robot.utils.compress import compress_text
+
+from .jsbuildingcontext import JsBuildingContext
+from .jsmodelbuilders import JsModelBuilder, SuiteBuilder
+from .stringcache import StringIndex
+
+
+# State inherited by forked worker processes.
+_FORKED_STATE = None
+
+
+def can_use_processes(processes):
+    return processes > 1 and multiprocessing is not None \
+        and hasattr(os, 'fork')
+
+
+def _fork_pool(processes, state):
+    global _FORKED_STATE
+    _FORKED_STATE = state
+    try:
+        return multiprocessing.Pool(processes)
+    finally:
+        _FORKED_STATE = None
+
+
+class ParallelJsModelBuilder(JsModelBuilder):
+
+    def __init__(self, log_path=None, split_log=False,
+                 prune_input_to_save_memory=False, processes=2):
+        JsModelBuilder.__init__(self, log_path, split_log,
+                                prune_input_to_save_memory,
+                                ParallelCompressor(processes))
+        self._log_path = log_path
+        self._split_log = split_log
+        self._processes = processes
+
+    def _build_suite(self, suite):
+        if len(suite.suites) < 2:
+            return JsModelBuilder._build_suite(self, suite)
+        self._initialize_basemillis(suite)
+        state = (suite.suites, self._log_path, self._split_log,
+                 self._context.basemillis)
+        pool = _fork_pool(min(self._processes, len(suite.suites)), state)
+        try:
+            built = pool.imap(_build_child_suite, range(len(suite.suites)))
+            return _ParallelSuiteBuilder(self._context, built).build(suite)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _initialize_basemillis(self, suite):
+        # Workers must use the base time that is got from the first
+        # timestamp when building the model in one process.
+        for timestamp in self._get_timestamps(suite):
+            if timestamp:
+                self._context.timestamp(timestamp)
+                return
+
+    def _get_timestamps(self, suite):
+        yield suite.starttime_millis
+        for child in suite.suites:
+            for timestamp in self._get_timestamps(child):
+                yield timestamp
+        for test in suite.tests:
+            yield test.starttime_millis
+            for kw in test.keywords:
+                for timestamp in self._get_keyword_timestamps(kw):
+                    yield timestamp
+        for kw in suite.keywords:
+            for timestamp in self._get_keyword_timestamps(kw):
+                yield timestamp
+
+    def _get_keyword_timestamps(self, kw):
+        yield kw.starttime_millis
+        for child in kw.keywords:
+            for timestamp in self._get_keyword_timestamps(child):
+                yield timestamp
+        for msg in kw.messages:
+            yield msg.timestamp_millis
+
+
+def _build_child_suite(index):
+    suites, log_path, split_log, basemillis = _FORKED_STATE
+    context = JsBuildingContext(log_path, split_log)
+    context.basemillis = basemillis
+    return SuiteBuilder(context).build(suites[index]), context
+
+
+class _ParallelSuiteBuilder(SuiteBuilder):
+
+    def __init__(self, context, built_suites):
+        SuiteBuilder.__init__(self, context)
+        self._built_suites = built_suites
+
+    def _build_suites(self, suites):
+        return tuple(self._merge(model, context)
+                     for model, context in self._built_suites)
+
+    def _merge(self, model, context):
+        indices, split_offset = self._context.merge(context)
+        return _ModelRemapper(indices, split_offset).remap_suite(model)
+
+
+class _ModelRemapper(object):
+
+    def __init__(self, string_indices, split_offset):
+        self._string_indices = string_indices
+        self._split_offset = split_offset
+
+    def remap_suite(self, suite):
+        return (self._remap(suite[:6]) +
+                (tuple(self.remap_suite(s) for s in suite[6]),
+                 tuple(self._remap_test(t) for t in suite[7]),
+                 tuple(self._remap_keyword(k) for k in suite[8]),
+                 suite[9]))
+
+    def _remap_test(self, test):
+        return self._remap(test[:6]) + (self._remap_keywords(test[6]),)
+
+    def _remap_keyword(self, kw):
+        return (self._remap(kw[:6]) + (self._remap_keywords(kw[6]),) +
+                self._remap(kw[7:]))
+
+    def _remap_keywords(self, keywords):
+        # Split keywords are replaced with an index to split results.
+        if isinstance(keywords, tuple):
+            return self._remap(keywords)
+        return keywords + self._split_offset
+
+    def _remap(self, model):
+        return tuple(self._string_indices[item]
+                     if isinstance(item, StringIndex) else
+                     self._remap(item) if isinstance(item, tuple) else item
+                     for item in model)
+
+
+class ParallelCompressor(object):
+    """Compresses texts of a :class:`~.stringcache.StringCache` in batches.
+
+    Texts are divided between worker processes in chunks. Forking processes
+    is not worth it with small logs, and fewer texts than ``min_texts`` are
+    compressed in the current process.
+    """
+
+    def __init__(self, processes, min_texts=1000):
+        self._processes = processes
+        self._min_texts = min_texts
+
+    def __call__(self, texts):
+        if len(texts) < self._min_texts:
+            return [compress_text(text) for text in texts]
+        pool = multiprocessing.Pool(self._processes)
+        try:
+            chunksize = len(texts) // (self._processes * 4) + 1
+            return pool.map(compress_text, texts, chunksize)
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+class ForkedWriter(object):
+    """Runs the given writer in a forked process.
+
+    The process is started with :meth:`start` and :meth:`write` waits until
+    writing is done and re-raises possible errors. Arguments given to
+    :meth:`write` are ignored and accepted only for compatibility with
+    normal writers. The writer and its arguments given to :meth:`start` are
+    inherited by the forked process and not pickled.
+    """
+
+    def __init__(self, writer):
+        self._writer = writer
+        self._pool = None
+        self._result = None
+
+    def start(self, *args):
+        self._pool = _fork_pool(1, (self._writer, args))
+        self._result = self._pool.apply_async(_run_writer)
+        self._pool.close()
+
+    def write(self, *args):
+        try:
+            return self._result.get()
+        finally:
+            self._pool.join()
+
+
+def _run_writer():
+    writer, args = _FORKED_STATE
+    writer(*args)
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import partial
+
 from robot.conf import RebotSettings
 from robot.errors import DataError
 from robot.output import LOGGER
@@ -20,6 +22,8 @@ from robot.utils import unic
 
 from .jsmodelbuilders import JsModelBuilder
 from .logreportwriters import LogWriter, ReportWriter
+from .parallel import ForkedWriter, ParallelJsModelBuilder, can_use_processes
+from .streamingbuilder import StreamingJsModelBuilder, can_stream
 from .xunitwriter import XUnitWriter
 
 
@@ -54,6 +58,9 @@ class ResultWriter(object):
         results = Results(settings, *self._sources)
         if settings.output:
             self._write_output(results.result, settings.output)
+        if can_use_processes(settings.processes):
+            self._write_concurrently(results, settings)
+            return results.return_code
         if settings.xunit:
             self._write_xunit(results.result, settings.xunit,
                               settings.xunit_skip_noncritical)
@@ -67,6 +74,34 @@ class ResultWriter(object):
                                settings.report_config)
         return results.return_code
 
+    def _write_concurrently(self, results, settings):
+        # Writers are started as soon as their input is ready, but results
+        # are reported in the same order as when writing sequentially.
+        writers = []
+        if settings.xunit:
+            xunit = XUnitWriter(results.result, settings.xunit_skip_noncritical)
+            writers.append(self._start('XUnit', xunit.write, settings.xunit))
+        if settings.log:
+            config = dict(settings.log_config,
+                          minLevel=results.js_result.min_level)
+            log = LogWriter(results.js_result)
+            writers.append(self._start('Log', log.write, settings.log, config))
+        if settings.report:
+            report = partial(self._write_report_file, results.js_result)
+            writers.append(self._start('Report', report, settings.report,
+                                       settings.report_config))
+        for name, writer, path in writers:
+            self._write(name, writer.write, path)
+
+    def _start(self, name, writer, path, *args):
+        writer = ForkedWriter(writer)
+        writer.start(path, *args)
+        return name, writer, path
+
+    def _write_report_file(self, js_result, path, config):
+        js_result.remove_data_not_needed_in_report()
+        ReportWriter(js_result).write(path, config)
+
     def _write_output(self, result, path):
         self._write('Output', result.save, path)
 
@@ -108,9 +143,13 @@ class Results(object):
             self._prune = True
             self.return_code = -1
         self._js_result = None
+        self._streaming = (self._prune and settings.streaming and
+                           can_stream(settings, sources))
 
     @property
     def result(self):
+        if self._result is None and self._streaming:
+            self._build_streaming()
         if self._result is None:
             include_keywords = bool(self._settings.log or self._settings.output)
             flattened = self._settings.flatten_keywords
@@ -119,19 +158,45 @@ class Results(object):
                                            flattened_keywords=flattened,
                                            rerun_merge=rerun_merge,
                                            *self._sources)
-            self._result.configure(self._settings.status_rc,
-                                   self._settings.suite_config,
-                                   self._settings.statistics_config)
-            self.return_code = self._result.return_code
+            self._configure(self._result, self._settings.suite_config)
         return self._result
 
+    def _configure(self, result, suite_config):
+        result.configure(self._settings.status_rc, suite_config,
+                         self._settings.statistics_config)
+        self.return_code = result.return_code
+
+    def _build_streaming(self):
+        # Keywords are removed and messages filtered already when streaming.
+        suite_config = dict(self._settings.suite_config, remove_keywords=None,
+                            log_level=None)
+        builder = StreamingJsModelBuilder(
+            log_path=self._settings.log,
+            split_log=self._settings.split_log,
+            remove_keywords=self._settings.remove_keywords,
+            log_level=self._settings['LogLevel'],
+            flattened_keywords=self._settings.flatten_keywords
+        )
+        self._result, self._js_result = builder.build(
+            self._sources[0], lambda result: self._configure(result, suite_config)
+        )
+
     @property
     def js_result(self):
+        if self._js_result is None and self._streaming:
+            self._build_streaming()
         if self._js_result is None:
-            builder = JsModelBuilder(log_path=self._settings.log,
-                                     split_log=self._settings.split_log,
-                                     prune_input_to_save_memory=self._prune)
-            self._js_result = builder.build_from(self.result)
+            self._js_result = self._get_js_model_builder().build_from(self.result)
             if self._prune:
                 self._result = None
         return self._js_result
+
+    def _get_js_model_builder(self):
+        if can_use_processes(self._settings.processes):
+            return ParallelJsModelBuilder(log_path=self._settings.log,
+                                          split_log=self._settings.split_log,
+                                          prune_input_to_save_memory=self._prune,
+                                          processes=self._settings.processes)
+        return JsModelBuilder(log_path=self._settings.log,
+                              split_log=self._settings.split_log,
+                              prune_input_to_save_memory=self._prune)
@@ -0,0 +1,370 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Builds the log/report JS model while output XML is being parsed.
+
+Keywords are the dominant part of output files. This module converts each
+top level keyword, i.e. a test or suite keyword, into its JS model as soon as
+the keyword has been parsed and discards the keyword objects. Only suite and
+test objects without keyword content are thus kept in memory.
+
+Because string indices, relative timestamps, split log indices and warning
+link targets of the JS model depend on the order in which the normal
+:class:`~.jsmodelbuilders.JsModelBuilder` visits the whole model, these values
+are stored in a deferred form and resolved only after the whole output has
+been processed. The resolved model is identical to the model built normally.
+"""
+
+from __future__ import with_statement
+
+from robot.errors import DataError
+from robot.result import Result, TestSuite
+from robot.result.binaryformat import is_binary_output
+from robot.result.keyword import Keyword
+from robot.result.keywordremover import KeywordRemover
+from robot.result.messagefilter import MessageFilter
+from robot.result.resultbuilder import ExecutionResultBuilder
+from robot.result.xmlelementhandlers import XmlElementHandler
+from robot.utils import ETSource, get_error_message, timestamp_to_millis
+
+from .jsbuildingcontext import JsBuildingContext
+from .jsexecutionresult import JsExecutionResult
+from .jsmodelbuilders import (ErrorsBuilder, ErrorMessageBuilder,
+                              KeywordBuilder, MessageBuilder, StatisticsBuilder,
+                              SuiteBuilder, TestBuilder)
+from .stringcache import StringCache, StringIndex
+
+
+def can_stream(settings, sources):
+    """Returns True if results can be processed using streaming."""
+    return (len(sources) == 1 and isinstance(sources[0], basestring)
+            and not is_binary_output(sources[0])
+            and not settings.rerun_merge and not settings.output
+            and bool(settings.log)
+            and 'PASSED' not in [r.upper() for r in settings.remove_keywords])
+
+
+class StreamingJsModelBuilder(object):
+    """Creates a result and a JS model from an output file in one pass.
+
+    The returned :class:`~robot.result.executionresult.Result` does not
+    contain keyword content and the returned JS model is identical to one
+    created by :class:`~.jsmodelbuilders.JsModelBuilder` from a full result.
+
+    Removing keywords with ``PASSED`` mode is not supported because it
+    depends on the final statuses of tests.
+    """
+
+    def __init__(self, log_path=None, split_log=False, remove_keywords=None,
+                 log_level=None, flattened_keywords=None):
+        self._context = DeferredJsBuildingContext(log_path, split_log)
+        self._keyword_processors = [KeywordRemover(how)
+                                    for how in remove_keywords or ()]
+        self._keyword_processors.append(MessageFilter(log_level))
+        self._flattened_keywords = flattened_keywords
+
+    def build(self, source, configure=None):
+        """Builds the result and the JS model based on the given output.
+
+        :param source: Path to an output XML file.
+        :param configure: Callable that is used to configure the result after
+            parsing but before building the suite model. Removing keywords and
+            filtering messages must be configured already in the initializer.
+        """
+        keyword_builder = KeywordConverter(self._context,
+                                           self._keyword_processors)
+        result = self._build_result(source, keyword_builder.convert)
+        if configure:
+            configure(result)
+        return result, self._build_model(result, keyword_builder.converted)
+
+    def _build_result(self, source, keyword_ended):
+        ets = ETSource(source)
+        builder = _StreamingResultBuilder(ets, keyword_ended,
+                                          self._flattened_keywords)
+        try:
+            return builder.build(Result(source))
+        except IOError, err:
+            error = err.strerror
+        except:
+            error = get_error_message()
+        raise DataError("Reading XML source '%s' failed: %s"
+                        % (unicode(ets), error))
+
+    def _build_model(self, result, converted):
+        context = self._context
+        # Suite and test objects are not pruned to keep the returned result.
+        context.stop_pruning()
+        context.min_level = 'NONE'
+        statistics = StatisticsBuilder().build(result.statistics)
+        suite = ConvertedSuiteBuilder(context, converted).build(result.suite)
+        errors = DeferredErrorsBuilder(context).build(result.errors)
+        resolver = ModelResolver()
+        suite = resolver.resolve(suite)
+        errors = resolver.resolve(errors)
+        return JsExecutionResult(suite=suite,
+                                 statistics=statistics,
+                                 errors=errors,
+                                 strings=resolver.strings,
+                                 basemillis=resolver.basemillis,
+                                 split_results=resolver.split_results,
+                                 min_level=context.min_level)
+
+
+class _StreamingResultBuilder(ExecutionResultBuilder):
+
+    def __init__(self, source, keyword_ended, flattened_keywords=None):
+        ExecutionResultBuilder.__init__(
+            self, source, flattened_keywords=flattened_keywords)
+        self._keyword_ended = keyword_ended
+
+    def build(self, result):
+        handler = XmlElementHandler(result)
+        with self._source as source:
+            self._parse(source, handler.start, self._get_end_handler(handler))
+        result.handle_suite_teardown_failures()
+        return result
+
+    def _get_end_handler(self, handler):
+        stack = handler._stack
+        keyword_ended = self._keyword_ended
+
+        def end(elem):
+            result = stack[-1][1]
+            handler.end(elem)
+            if elem.tag == 'kw' and stack[-1][0].tag != 'kw':
+                keyword_ended(result)
+        return end
+
+
+class KeywordConverter(object):
+    """Converts top level keywords to deferred JS models and clears them."""
+
+    def __init__(self, context, processors):
+        self._context = context
+        self._build = DeferredKeywordBuilder(context).build
+        self._processors = processors
+        self.converted = {}
+
+    def convert(self, kw):
+        for processor in self._processors:
+            kw.visit(processor)
+        # Suite keywords are split individually and test keywords as a group.
+        split = isinstance(kw.parent, TestSuite)
+        self._context.min_level = 'NONE'
+        model = self._build(kw, split=split)
+        self.converted[kw] = (model, self._context.min_level)
+
+
+class ConvertedSuiteBuilder(SuiteBuilder):
+
+    def __init__(self, context, converted):
+        SuiteBuilder.__init__(self, context)
+        self._build_test = ConvertedTestBuilder(context, converted).build
+        self._build_keyword = ConvertedKeywordBuilder(context, converted).build
+
+
+class ConvertedTestBuilder(TestBuilder):
+
+    def __init__(self, context, converted):
+        TestBuilder.__init__(self, context)
+        self._build_keyword = ConvertedKeywordBuilder(context, converted).build
+
+
+class ConvertedKeywordBuilder(object):
+
+    def __init__(self, context, converted):
+        self._context = context
+        self._converted = converted
+
+    def build(self, kw, split=False):
+        model, min_level = self._converted.pop(kw)
+        self._context.message_level(min_level)
+        return model
+
+
+class DeferredKeywordBuilder(KeywordBuilder):
+
+    def __init__(self, context):
+        KeywordBuilder.__init__(self, context)
+        self._build_message = DeferredMessageBuilder(context).build
+
+
+class DeferredMessageBuilder(MessageBuilder):
+
+    def build(self, msg):
+        model = MessageBuilder.build(self, msg)
+        if msg.level != 'WARN':
+            return model
+        return (LinkTarget(self._context.link_key(msg), msg.parent),) + model
+
+
+class DeferredErrorsBuilder(ErrorsBuilder):
+
+    def __init__(self, context):
+        ErrorsBuilder.__init__(self, context)
+        self._build_message = DeferredErrorMessageBuilder(context).build
+
+
+class DeferredErrorMessageBuilder(ErrorMessageBuilder):
+
+    def build(self, msg):
+        return self._build(msg) + (Link(self._context.link_key(msg)),)
+
+
+class DeferredJsBuildingContext(JsBuildingContext):
+    """Building context returning deferred strings, timestamps and splits.
+
+    Strings are returned in their encoded form that is mapped to indices
+    when resolving. Timestamps are absolute milliseconds and content to
+    split is wrapped into :class:`Split` objects.
+    """
+
+    def __init__(self, log_path=None, split_log=False):
+        JsBuildingContext.__init__(self, log_path, split_log,
+                                   prune_input=True)
+        self._strings = DeferredStringCache()
+
+    def timestamp(self, time):
+        if not time:
+            return None
+        return Millis(timestamp_to_millis(time)
+                      if isinstance(time, basestring) else time)
+
+    def stop_pruning(self):
+        self._prune_input = False
+
+    def create_link_target(self, msg):
+        pass
+
+    def link_key(self, msg):
+        return self._link_key(msg)
+
+    def start_splitting_if_needed(self, split=False):
+        return self._split_log and split
+
+    def end_splitting(self, model):
+        return Split(model)
+
+    @property
+    def strings(self):
+        raise TypeError('Deferred strings must be resolved.')
+
+
+class DeferredStringCache(StringCache):
+
+    def add(self, text):
+        if not text:
+            return self._zero_index
+        text = self._encode(text)
+        return self._cache.setdefault(text, text)
+
+
+class Millis(long):
+    __slots__ = []
+
+
+class Split(object):
+    __slots__ = ['model']
+
+    def __init__(self, model):
+        self.model = model
+
+
+class LinkTarget(object):
+    __slots__ = ['key', 'parent', 'suffix']
+
+    def __init__(self, key, parent):
+        self.key = key
+        # Store only the top level keyword and the id relative to it because
+        # ids of top level keywords may change if tests are filtered.
+        top = parent
+        while isinstance(top.parent, Keyword):
+            top = top.parent
+        self.parent = top
+        self.suffix = parent.id[len(top.id):]
+
+    @property
+    def id(self):
+        return self.parent.id + self.suffix
+
+
+class Link(object):
+    __slots__ = ['key']
+
+    def __init__(self, key):
+        self.key = key
+
+
+class ModelResolver(object):
+    """Resolves deferred values in the same order JsModelBuilder creates them.
+    """
+
+    def __init__(self):
+        self._top_level_strings = ResolvingStringCache()
+        self._strings = self._top_level_strings
+        self._links = {}
+        self.basemillis = None
+        self.split_results = []
+
+    @property
+    def strings(self):
+        return self._top_level_strings.dump()
+
+    def resolve(self, model):
+        if isinstance(model, tuple):
+            return self._resolve_tuple(model)
+        if isinstance(model, basestring):
+            return self._strings.add_encoded(model)
+        if isinstance(model, Millis):
+            return self._resolve_millis(model)
+        if isinstance(model, Split):
+            return self._resolve_split(model)
+        return model
+
+    def _resolve_tuple(self, model):
+        if not model:
+            return model
+        if isinstance(model[0], LinkTarget):
+            target = model[0]
+            self._links[target.key] \
+                = self._top_level_strings.add_encoded('*' + target.id)
+            model = model[1:]
+        if isinstance(model[-1], Link):
+            link = self._links.get(model[-1].key)
+            resolved = tuple(self.resolve(item) for item in model[:-1])
+            return resolved if link is None else resolved + (link,)
+        return tuple(self.resolve(item) for item in model)
+
+    def _resolve_millis(self, millis):
+        millis = long(millis)
+        if self.basemillis is None:
+            self.basemillis = millis
+        return millis - self.basemillis
+
+    def _resolve_split(self, split):
+        self._strings = ResolvingStringCache()
+        model = self.resolve(split.model)
+        self.split_results.append((model, self._strings.dump()))
+        self._strings = self._top_level_strings
+        return len(self.split_results)
+
+
+class ResolvingStringCache(StringCache):
+
+    def add_encoded(self, text):
+        return self._add(text)
+
+    def _compress(self, texts):
+        pass  # Texts are encoded already when they are deferred.
@@ -32,17 +32,24 @@ class StringCache(object):
     _use_compressed_threshold = 1.1
     _zero_index = StringIndex(0)
 
-    def __init__(self):
+    def __init__(self, compressor=None):
         self._cache = {'*': self._zero_index}
+        self._compressor = compressor or _compress_texts
 
     def add(self, text):
         if not text:
             return self._zero_index
-        text = self._encode(text)
+        return self._add(self._raw(text))
+
+    def _add(self, text):
         if text not in self._cache:
             self._cache[text] = StringIndex(len(self._cache))
         return self._cache[text]
 
+    def merge(self, other):
+        """Adds strings from another cache and returns their indices."""
+        return [self._add(text) for text in other._get_texts()]
+
     def _encode(self, text):
         raw = self._raw(text)
         if raw in self._cache or len(raw) < self._compress_threshold:
@@ -56,5 +63,24 @@ class StringCache(object):
         return '*'+text
 
     def dump(self):
-        return tuple(item[0] for item in sorted(self._cache.iteritems(),
-                                                key=itemgetter(1)))
+        texts = self._get_texts()
+        self._compress(texts)
+        return tuple(texts)
+
+    def _get_texts(self):
+        return [item[0] for item in sorted(self._cache.iteritems(),
+                                           key=itemgetter(1))]
+
+    def _compress(self, texts):
+        # Texts are compressed only when dumping to compress each text once
+        # and to allow the compressor to handle all texts in one batch.
+        indices = [index for index, text in enumerate(texts)
+                   if len(text) >= self._compress_threshold]
+        compressed = self._compressor([texts[index][1:] for index in indices])
+        for index, text in zip(indices, compressed):
+            if len(text) * self._use_compressed_threshold < len(texts[index]):
+                texts[index] = text
+
+
+def _compress_texts(texts):
+    return [compress_text(text) for text in texts]
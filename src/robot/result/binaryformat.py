@@ -0,0 +1,117 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Compact binary output format.
+
+The format is an alternative to output XML that is considerably faster to
+read and smaller. All integers are stored in little-endian byte order.
+
+Files start with :data:`MAGIC` followed by the format version and the length
+of the header as unsigned 16 and 32 bit integers. The header consists of
+UTF-8 encoded lines containing the generator, the generation time and
+the :func:`description <describe_records>` of the record layouts. Readers
+must reject files with an unsupported version or layout.
+
+The header is followed by chunks, each starting with the length and
+the CRC-32 checksum of the chunk data as unsigned 32 bit integers. The data
+is compressed with :mod:`zlib` and contains first the strings used for
+the first time in the chunk and then records.
+
+All strings are stored only once and referenced using indices in the order
+they have been introduced. The strings of a chunk are stored as their count,
+the lengths of their UTF-8 encoded forms and the encoded strings. Missing
+timestamps are stored as empty strings.
+
+Each record starts with its type as one byte followed by fields packed
+using the :mod:`struct` format in :data:`RECORD_FORMATS`. ``I`` fields are
+string indices and ``B`` fields statuses or booleans. Records whose type is
+in :data:`RECORDS_WITH_ITEMS` end with a count and that many string indices.
+
+Record types and their fields:
+
+- ``SUITE_START``: name, source
+- ``SUITE_END``: doc, message, start, end, metadata as name/value pairs
+- ``TEST_START``: name, timeout
+- ``TEST_END``: doc, status, message, start, end, tags
+- ``KEYWORD_START``: name, type, timeout, doc, arguments
+- ``KEYWORD_END``: status, message, start, end
+- ``MESSAGE``: message, level, html, timestamp
+- ``ERRORS_START``: no fields, following messages are execution errors
+"""
+
+from __future__ import with_statement
+
+import os
+import struct
+
+EXTENSION = '.rbin'
+MAGIC = 'RBIN\x00'
+VERSION = 2
+CHUNK_SIZE = 1000
+
+(SUITE_START, SUITE_END, TEST_START, TEST_END, KEYWORD_START, KEYWORD_END,
+ MESSAGE, ERRORS_START) = range(8)
+
+RECORD_NAMES = ('SUITE_START', 'SUITE_END', 'TEST_START', 'TEST_END',
+                'KEYWORD_START', 'KEYWORD_END', 'MESSAGE', 'ERRORS_START')
+RECORD_FORMATS = ('II', 'IIII', 'II', 'IBIII', 'IIII', 'BIII', 'IIBI', '')
+RECORDS_WITH_ITEMS = (SUITE_END, TEST_END, KEYWORD_START)
+RECORD_STRUCTS = tuple(struct.Struct('<' + f) for f in RECORD_FORMATS)
+
+HEADER = struct.Struct('<HI')
+CHUNK = struct.Struct('<II')
+COUNT = struct.Struct('<I')
+_UINT_STRUCTS = {}
+
+STATUSES = ('FAIL', 'PASS', 'NOT_RUN')
+STATUS_CODES = dict((status, code) for code, status in enumerate(STATUSES))
+
+
+def describe_records():
+    """Returns the record layouts as a string stored in the header.
+
+    Contains ``name=format`` pairs in record type order. Format of records
+    ending with string indices has a ``+`` suffix.
+    """
+    return ' '.join('%s=%s%s' % (name, format,
+                                 '+' if type in RECORDS_WITH_ITEMS else '')
+                    for type, (name, format)
+                    in enumerate(zip(RECORD_NAMES, RECORD_FORMATS)))
+
+
+def uint_struct(count):
+    """Returns a cached struct for the given number of unsigned integers."""
+    if count not in _UINT_STRUCTS:
+        _UINT_STRUCTS[count] = struct.Struct('<%dI' % count)
+    return _UINT_STRUCTS[count]
+
+
+def is_binary_output(path):
+    """Returns True if the given output path uses the binary format.
+
+    Existing files are recognized based on their content and others based
+    on the :data:`EXTENSION`.
+    """
+    if not isinstance(path, basestring):
+        return False
+    if os.path.isfile(path):
+        with open(path, 'rb') as source:
+            return source.read(len(MAGIC)) == MAGIC
+    return has_binary_extension(path)
+
+
+def has_binary_extension(path):
+    """Returns True if new output written to the given path should use
+    the binary format."""
+    return isinstance(path, basestring) and path.lower().endswith(EXTENSION)
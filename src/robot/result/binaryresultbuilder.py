@@ -0,0 +1,272 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import with_statement
+
+import gc
+import zlib
+
+from robot.errors import DataError
+
+from . import binaryformat as fmt
+from .flattenkeywordmatcher import FlattenKeywordMatcher
+from .keyword import Keyword
+
+# Internal record type for keywords whose content is flattened.
+_FLATTENED_KEYWORD_START = -1
+
+
+class BinaryResultBuilder(object):
+
+    def __init__(self, source, include_keywords=True, flattened_keywords=None):
+        """Builds :class:`~.executionresult.Result` objects from output
+        files in the binary format.
+
+        :param source: Path to a binary output file.
+        :param include_keywords: Include keyword information to the
+            :class:`~.executionresult.Result` objects
+        """
+        self._source = source
+        self._include_keywords = include_keywords
+        self._flattened_keywords = flattened_keywords
+
+    def build(self, result):
+        # All created objects stay alive and the cyclic garbage collector
+        # would traverse them repeatedly while they are created.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(self._source, 'rb') as source:
+                self._build_from(source, result)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        result.handle_suite_teardown_failures()
+        return result
+
+    def _build_from(self, source, result):
+        reader = BinaryReader(source)
+        result.generated_by_robot = reader.generated_by_robot
+        records = reader.records()
+        if not self._include_keywords:
+            records = self._omit_keywords(records)
+        elif self._flattened_keywords:
+            records = self._flatten_keywords(records, reader.strings,
+                                             self._flattened_keywords)
+        self._build(records, reader.strings, result)
+
+    def _omit_keywords(self, records):
+        started_kws = 0
+        for record in records:
+            type = record[0]
+            if type == fmt.KEYWORD_START:
+                started_kws += 1
+            if not started_kws:
+                yield record
+            if type == fmt.KEYWORD_END:
+                started_kws -= 1
+
+    def _flatten_keywords(self, records, strings, flattened):
+        match = FlattenKeywordMatcher(flattened).match
+        started = -1
+        for record in records:
+            type = record[0]
+            if type == fmt.KEYWORD_START:
+                if started >= 0:
+                    started += 1
+                elif match(strings[record[1][0]], strings[record[1][1]]):
+                    started = 0
+                    record = (_FLATTENED_KEYWORD_START,) + record[1:]
+            if started <= 0 or type == fmt.MESSAGE:
+                yield record
+            if started >= 0 and type == fmt.KEYWORD_END:
+                started -= 1
+
+    def _build(self, records, strings, result):
+        # Building is performance optimized. Do not change without profiling!
+        # Keywords are created without calling `__init__` and their child
+        # keywords and messages are collected to lists and set only when
+        # the keyword ends. Creating and extending item lists is otherwise
+        # the dominating cost.
+        stack = [result]
+        keywords = [[]]
+        messages = [[]]
+        statuses = fmt.STATUSES
+        new_keyword = Keyword.__new__
+        new_message = Keyword.message_class
+        teardown = 'teardown'
+        for type, fields, items in records:
+            if type == fmt.MESSAGE:
+                messages[-1].append(new_message(strings[fields[0]],
+                                                strings[fields[1]],
+                                                bool(fields[2]),
+                                                strings[fields[3]] or None))
+            elif type == fmt.KEYWORD_START \
+                    or type == _FLATTENED_KEYWORD_START:
+                kw = new_keyword(Keyword)
+                kw.name = strings[fields[0]]
+                kw.type = strings[fields[1]]
+                kw.timeout = strings[fields[2]] or None
+                kw.doc = strings[fields[3]]
+                kw.args = tuple([strings[index] for index in items])
+                kw.message = ''
+                if type == _FLATTENED_KEYWORD_START:
+                    kw.doc = ('%s\n\n_*Keyword content flattened.*_'
+                              % kw.doc).strip()
+                keywords[-1].append(kw)
+                stack.append(kw)
+                keywords.append([])
+                messages.append([])
+            elif type == fmt.KEYWORD_END:
+                kw = stack.pop()
+                kw.status = statuses[fields[0]]
+                if kw.type == teardown:
+                    kw.message = strings[fields[1]]
+                kw.starttime = strings[fields[2]] or None
+                kw.endtime = strings[fields[3]] or None
+                kw.keywords = keywords.pop()
+                kw.messages = messages.pop()
+            elif type == fmt.TEST_START:
+                stack.append(stack[-1].tests.create(
+                    name=strings[fields[0]],
+                    timeout=strings[fields[1]] or None))
+                keywords.append([])
+            elif type == fmt.TEST_END:
+                test = stack.pop()
+                test.doc = strings[fields[0]]
+                test.status = statuses[fields[1]]
+                test.message = strings[fields[2]]
+                test.starttime = strings[fields[3]] or None
+                test.endtime = strings[fields[4]] or None
+                test.tags = [strings[index] for index in items]
+                test.keywords = keywords.pop()
+            elif type == fmt.SUITE_START:
+                stack.append(self._create_suite(stack[-1], result,
+                                                strings[fields[0]],
+                                                strings[fields[1]]))
+                keywords.append([])
+            elif type == fmt.SUITE_END:
+                suite = stack.pop()
+                suite.doc = strings[fields[0]]
+                suite.message = strings[fields[1]]
+                suite.starttime = strings[fields[2]] or None
+                suite.endtime = strings[fields[3]] or None
+                for index in range(0, len(items), 2):
+                    suite.metadata[strings[items[index]]] \
+                        = strings[items[index+1]]
+                suite.keywords = keywords.pop()
+            elif type == fmt.ERRORS_START:
+                stack.append(result.errors)
+        if stack[-1] is result.errors:
+            result.errors.messages = messages[-1]
+            stack.pop()
+        if len(stack) != 1:
+            raise DataError('File is incomplete.')
+
+    def _create_suite(self, parent, result, name, source):
+        if parent is not result:
+            return parent.suites.create(name=name, source=source)
+        result.suite.name = name
+        result.suite.source = source or None
+        return result.suite
+
+
+class BinaryReader(object):
+    """Reads the header and records of a binary output file.
+
+    See :mod:`robot.result.binaryformat` for details about the format.
+    """
+
+    def __init__(self, source):
+        self._source = source
+        self.generator, self.generated = self._read_header()
+        #: Strings read so far. Grows when records are read.
+        self.strings = []
+
+    @property
+    def generated_by_robot(self):
+        return self.generator.split()[0].upper() == 'ROBOT'
+
+    def _read_header(self):
+        if self._source.read(len(fmt.MAGIC)) != fmt.MAGIC:
+            raise DataError('Not a binary output file.')
+        version, length = self._unpack(fmt.HEADER)
+        if version != fmt.VERSION:
+            raise DataError('Unsupported binary output version %d.' % version)
+        header = self._read(length).decode('UTF-8').split('\n')
+        if len(header) != 3 or header[2] != fmt.describe_records():
+            raise DataError('Invalid binary output header.')
+        return header[:2]
+
+    def _unpack(self, struct):
+        return struct.unpack(self._read(struct.size))
+
+    def _read(self, size):
+        data = self._source.read(size)
+        if len(data) != size:
+            raise DataError('File is incomplete.')
+        return data
+
+    def records(self):
+        """Generates records as ``(type, fields, items)`` tuples.
+
+        `fields` is a tuple of the fixed size fields and `items` a tuple of
+        string indices or `None`. Strings the records refer to are available
+        in :attr:`strings` when the record is generated.
+        """
+        structs = fmt.RECORD_STRUCTS
+        has_items = [type in fmt.RECORDS_WITH_ITEMS
+                     for type in range(len(structs))]
+        count = fmt.COUNT
+        uint_struct = fmt.uint_struct
+        for data in self._chunks():
+            position = self._read_strings(data)
+            end = len(data)
+            while position < end:
+                type = ord(data[position])
+                record = structs[type]
+                fields = record.unpack_from(data, position + 1)
+                position += record.size + 1
+                if has_items[type]:
+                    items = count.unpack_from(data, position)[0]
+                    position += count.size
+                    items_struct = uint_struct(items)
+                    items = items_struct.unpack_from(data, position)
+                    position += items_struct.size
+                else:
+                    items = None
+                yield type, fields, items
+
+    def _chunks(self):
+        while self._source.read(1):
+            self._source.seek(-1, 1)
+            length, checksum = self._unpack(fmt.CHUNK)
+            data = self._read(length)
+            if zlib.crc32(data) & 0xffffffff != checksum:
+                raise DataError('Checksum mismatch.')
+            try:
+                yield zlib.decompress(data)
+            except zlib.error, err:
+                raise DataError('Decompressing data failed: %s' % err)
+
+    def _read_strings(self, data):
+        count = fmt.COUNT.unpack_from(data)[0]
+        position = fmt.COUNT.size
+        lengths = fmt.uint_struct(count)
+        strings = self.strings
+        position += lengths.size
+        for length in lengths.unpack_from(data, fmt.COUNT.size):
+            strings.append(data[position:position+length].decode('UTF-8'))
+            position += length
+        return position
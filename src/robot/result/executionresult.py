@@ -16,6 +16,7 @@ from __future__ import with_statement
 
 from robot.model import Statistics
 
+from .binaryformat import has_binary_extension
 from .executionerrors import ExecutionErrors
 from .testsuite import TestSuite
 
@@ -97,10 +98,14 @@ class Result(object):
         """Save results as a new output XML file.
 
         :param path: Path to save results to. If omitted, overwrites the
-            original file.
+            original file. If the path has extension ``.rbin``, results
+            are saved using the :mod:`binary format <.binaryformat>`.
+            If the extension is ``.gz``, XML is compressed using gzip.
         """
-        from robot.reporting.outputwriter import OutputWriter
-        self.visit(OutputWriter(path or self.source))
+        from robot.reporting.outputwriter import BinaryOutputWriter, OutputWriter
+        path = path or self.source
+        writer = BinaryOutputWriter if has_binary_extension(path) else OutputWriter
+        self.visit(writer(path))
 
     def visit(self, visitor):
         """An entry point to visit the whole result object.
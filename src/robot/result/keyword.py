@@ -19,17 +19,23 @@ from .message import Message
 
 class Keyword(model.Keyword):
     """Results of a single keyword."""
-    __slots__ = ['status', 'starttime', 'endtime', 'message']
+    __slots__ = ['status', '_starttime', '_endtime', 'message']
     message_class = Message
+    #: Keyword execution start time in format ``%Y%m%d %H:%M:%S.%f``.
+    starttime = utils.Timestamp('_starttime')
+    #: Keyword execution end time in format ``%Y%m%d %H:%M:%S.%f``.
+    endtime = utils.Timestamp('_endtime')
+    #: Keyword execution start time in milliseconds after the epoch.
+    starttime_millis = utils.Timestamp('_starttime', millis=True)
+    #: Keyword execution end time in milliseconds after the epoch.
+    endtime_millis = utils.Timestamp('_endtime', millis=True)
 
     def __init__(self, name='', doc='', args=(), type='kw', timeout='',
                  status='FAIL', starttime=None, endtime=None):
         model.Keyword.__init__(self, name, doc, args, type, timeout)
         #: String 'PASS' of 'FAIL'.
         self.status = status
-        #: Keyword execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Keyword execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
         #: Keyword status message. Used only with suite teardowns.
         self.message = ''
@@ -37,7 +43,7 @@ class Keyword(model.Keyword):
     @property
     def elapsedtime(self):
         """Elapsed execution time of the keyword in milliseconds."""
-        return utils.get_elapsed_time(self.starttime, self.endtime)
+        return utils.get_elapsed_time(self._starttime, self._endtime)
 
     @property
     def passed(self):
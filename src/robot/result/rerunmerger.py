@@ -16,20 +16,41 @@ from robot.model import SuiteVisitor
 
 
 class ReRunMerger(SuiteVisitor):
+    """Merges re-run results into the original result.
+
+    Tests in merged results replace tests with the same name in the same
+    suite in the original result. Suites and tests are looked up using name
+    indices that are created once per original suite, and replaced tests are
+    updated to the original suites only after all given results have been
+    merged. Merging multiple results with one :meth:`merge` call is thus
+    faster than merging them one by one.
+
+    Results given as an iterable are consumed one at a time and replaced
+    tests are detached from their results. A result created lazily, e.g.
+    by a generator, can thus be freed after it has been merged.
+    """
 
     def __init__(self, result):
         self.root = result.suite
         self.current = None
+        self._indices = {}
 
     def merge(self, merged):
-        merged.suite.visit(self)
+        """Merges a result or an iterable of results to the original."""
+        if hasattr(merged, 'suite'):
+            merged = [merged]
+        try:
+            for result in merged:
+                result.suite.visit(self)
+        finally:
+            self._replace_tests()
 
     def start_suite(self, suite):
         try:
             if not self.current:
                 self.current = self._find_root(suite)
             else:
-                self.current = self._find(self.current.suites, suite.name)
+                self.current = self._index(self.current).suite(suite.name)
         except ValueError:
             self._report_ignored(suite)
             return False
@@ -39,11 +60,10 @@ class ReRunMerger(SuiteVisitor):
             raise ValueError
         return self.root
 
-    def _find(self, items, name):
-        for item in items:
-            if item.name == name:
-                return item
-        raise ValueError
+    def _index(self, suite):
+        if suite not in self._indices:
+            self._indices[suite] = _SuiteIndex(suite)
+        return self._indices[suite]
 
     def _report_ignored(self, item, test=False):
         from robot.output import LOGGER
@@ -55,14 +75,15 @@ class ReRunMerger(SuiteVisitor):
         self.current = self.current.parent
 
     def visit_test(self, test):
+        index = self._index(self.current)
         try:
-            old = self._find(self.current.tests, test.name)
+            old = index.test(test.name)
         except ValueError:
             self._report_ignored(test, test=True)
         else:
             test.message = self._create_merge_message(test, old)
-            index = self.current.tests.index(old)
-            self.current.tests[index] = test
+            test.parent = self.current
+            index.replace_test(test)
 
     def _create_merge_message(self, new, old):
         return '\n'.join(['Test has been re-run and results replaced.',
@@ -72,3 +93,53 @@ class ReRunMerger(SuiteVisitor):
                           '-  -  -',
                           'Old status:  %s' % old.status,
                           'Old message:  %s' % old.message])
+
+    def _replace_tests(self):
+        for index in self._indices.values():
+            index.replace_tests()
+
+
+class _SuiteIndex(object):
+
+    def __init__(self, suite):
+        self._suite = suite
+        self._suites = self._create_index(suite.suites)
+        self._tests = self._create_index(suite.tests)
+        self._replaced = {}
+
+    def _create_index(self, items):
+        # Like earlier linear search, use the first item with a name.
+        index = {}
+        for position, item in enumerate(items):
+            index.setdefault(item.name, position)
+        return index
+
+    def suite(self, name):
+        if name not in self._suites:
+            raise ValueError
+        return self._suite.suites[self._suites[name]]
+
+    def add_suite(self, suite):
+        self._suites.setdefault(suite.name, len(self._suite.suites))
+        self._suite.suites.append(suite)
+
+    def test(self, name):
+        if name not in self._tests:
+            raise ValueError
+        position = self._tests[name]
+        if position in self._replaced:
+            return self._replaced[position]
+        return self._suite.tests[position]
+
+    def replace_test(self, test):
+        self._replaced[self._tests[test.name]] = test
+
+    def replace_tests(self):
+        # Replacing items in an ItemList one by one copies all items every
+        # time, so all replaced tests are set to a suite at once.
+        if self._replaced:
+            tests = list(self._suite.tests)
+            for position, test in self._replaced.items():
+                tests[position] = test
+            self._suite.tests = tests
+            self._replaced.clear()
@@ -17,6 +17,8 @@ from __future__ import with_statement
 from robot.errors import DataError
 from robot.utils import ET, ETSource, get_error_message
 
+from .binaryformat import is_binary_output
+from .binaryresultbuilder import BinaryResultBuilder
 from .executionresult import Result, CombinedResult
 from .flattenkeywordmatcher import FlattenKeywordMatcher
 from .rerunmerger import ReRunMerger
@@ -26,7 +28,8 @@ from .xmlelementhandlers import XmlElementHandler
 def ExecutionResult(*sources, **options):
     """Factory method to constructs :class:`~.executionresult.Result` objects.
 
-    :param sources: Path(s) to output XML file(s).
+    :param sources: Path(s) to output XML file(s) or to output files in
+                    the :mod:`binary format <.binaryformat>`.
     :param options: Configuration options. `rerun_merge` with True value causes
                     multiple results to be combined so that tests in the latter
                     results replace the ones in the original. Other options
@@ -47,9 +50,7 @@ def ExecutionResult(*sources, **options):
 def _rerun_merge_results(original, merged, options):
     result = ExecutionResult(original, **options)
     merger = ReRunMerger(result)
-    for path in merged:
-        merged = ExecutionResult(path, **options)
-        merger.merge(merged)
+    merger.merge(ExecutionResult(path, **options) for path in merged)
     return result
 
 
@@ -58,6 +59,8 @@ def _combine_results(sources, options):
 
 
 def _single_result(source, options):
+    if is_binary_output(source):
+        return _single_binary_result(source, options)
     ets = ETSource(source)
     try:
         return ExecutionResultBuilder(ets, **options).build(Result(source))
@@ -68,6 +71,16 @@ def _single_result(source, options):
     raise DataError("Reading XML source '%s' failed: %s" % (unicode(ets), error))
 
 
+def _single_binary_result(source, options):
+    try:
+        return BinaryResultBuilder(source, **options).build(Result(source))
+    except IOError, err:
+        error = err.strerror
+    except:
+        error = get_error_message()
+    raise DataError("Reading binary source '%s' failed: %s" % (source, error))
+
+
 class ExecutionResultBuilder(object):
 
     def __init__(self, source, include_keywords=True, flattened_keywords=None):
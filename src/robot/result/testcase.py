@@ -19,8 +19,16 @@ from keyword import Keyword
 
 class TestCase(model.TestCase):
     """Results of a single test case."""
-    __slots__ = ['status', 'message', 'starttime', 'endtime']
+    __slots__ = ['status', 'message', '_starttime', '_endtime']
     keyword_class = Keyword
+    #: Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``.
+    starttime = utils.Timestamp('_starttime')
+    #: Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``.
+    endtime = utils.Timestamp('_endtime')
+    #: Test case execution start time in milliseconds after the epoch.
+    starttime_millis = utils.Timestamp('_starttime', millis=True)
+    #: Test case execution end time in milliseconds after the epoch.
+    endtime_millis = utils.Timestamp('_endtime', millis=True)
 
     def __init__(self, name='', doc='', tags=None, timeout=None, status='FAIL',
                  message='', starttime=None, endtime=None):
@@ -29,15 +37,13 @@ class TestCase(model.TestCase):
         self.status = status
         #: Possible failure message.
         self.message = message
-        #: Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
 
     @property
     def elapsedtime(self):
         """Elapsed execution time of the test case in milliseconds."""
-        return utils.get_elapsed_time(self.starttime, self.endtime)
+        return utils.get_elapsed_time(self._starttime, self._endtime)
 
     @property
     def passed(self):
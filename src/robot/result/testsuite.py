@@ -28,18 +28,24 @@ from .testcase import TestCase
 
 class TestSuite(model.TestSuite):
     """Result of a single test suite."""
-    __slots__ = ['message', 'starttime', 'endtime', '_criticality']
+    __slots__ = ['message', '_starttime', '_endtime', '_criticality']
     test_class = TestCase
     keyword_class = Keyword
+    #: Suite execution start time in format ``%Y%m%d %H:%M:%S.%f``.
+    starttime = utils.Timestamp('_starttime')
+    #: Suite execution end time in format ``%Y%m%d %H:%M:%S.%f``.
+    endtime = utils.Timestamp('_endtime')
+    #: Suite execution start time in milliseconds after the epoch.
+    starttime_millis = utils.Timestamp('_starttime', millis=True)
+    #: Suite execution end time in milliseconds after the epoch.
+    endtime_millis = utils.Timestamp('_endtime', millis=True)
 
     def __init__(self, name='', doc='', metadata=None, source=None,
                  message='', starttime=None, endtime=None):
         model.TestSuite.__init__(self, name, doc, metadata, source)
         #: Suite setup/teardown error message.
         self.message = message
-        #: Suite execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Suite execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
         self._criticality = None
 
@@ -82,8 +88,8 @@ class TestSuite(model.TestSuite):
     @property
     def elapsedtime(self):
         """Total execution time of the suite in milliseconds."""
-        if self.starttime and self.endtime:
-            return utils.get_elapsed_time(self.starttime, self.endtime)
+        if self._starttime and self._endtime:
+            return utils.get_elapsed_time(self._starttime, self._endtime)
         return sum(child.elapsedtime for child in
                    chain(self.suites, self.tests, self.keywords))
 
@@ -146,6 +146,12 @@ Options
                           can also be further processed with Rebot tool. Can be
                           disabled by giving a special value `NONE`. In this
                           case, also log and report are automatically disabled.
+                          If the given path has extension `.rbin`, output is
+                          written in a compact binary format that is faster
+                          to process. Rebot can read it and convert it to XML.
+                          If the extension is `.gz`, XML output is compressed
+                          using gzip. Compressed outputs are recognized
+                          automatically when they are read.
                           Default: output.xml
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
@@ -273,6 +279,24 @@ Options
                           The seed must be an integer.
                           Examples: --randomize all
                                     --randomize tests:1234
+    --processes count     Execute tests in parallel using the given number of
+                          worker processes. Tests are split into work units
+                          based on --splitlevel and the units are distributed
+                          to processes so that their estimated execution times
+                          are as equal as possible. Outputs of the processes
+                          are combined into one output file. Notice that
+                          higher level suite setups and teardowns are run in
+                          each process executing tests under them. Log,
+                          report and xunit files are also created using
+                          multiple processes if processes can be forked.
+                          Example: --processes 4
+    --splitlevel suite|test  Whether suites directly containing tests (default)
+                          or individual tests are used as units of work with
+                          --processes.
+    --durations output    Output file of an earlier execution whose test
+                          execution times are used to balance work between
+                          processes with --processes. Tests not found from
+                          the output are estimated to take the average time.
     --runmode mode *      Deprecated in version 2.8. Use individual options
                           --dryrun, --exitonfailure, --skipteardownonexit, or
                           --randomize instead.
@@ -346,6 +370,18 @@ ROBOT_SYSLOG_FILE         Path to a file where Robot Framework writes internal
 ROBOT_SYSLOG_LEVEL        Log level to use when writing to the syslog file.
                           Available levels are the same as for --loglevel
                           command line option and the default is INFO.
+ROBOT_PARSE_CACHE         Directory where to cache parsed test case and
+                          resource files. Cached files are used instead of
+                          parsing files again if the files have not been
+                          modified. The cache is shared by all tools parsing
+                          test data, including libdoc, testdoc and tidy.
+                          Disabled by default.
+ROBOT_PARSING_THREADS     Number of threads to use for reading test data files
+                          when parsing directories. Files are parsed in the
+                          normal order but are read beforehand in background
+                          threads, which speeds up parsing on slow file
+                          systems. The default is 1, i.e. no background
+                          threads.
 
 Examples
 ========
@@ -382,6 +418,7 @@ from robot.conf import RobotSettings
 from robot.output import LOGGER
 from robot.reporting import ResultWriter
 from robot.running import TestSuiteBuilder
+from robot.running.parallel import ParallelRunner
 from robot.utils import Application
 
 
@@ -399,7 +436,11 @@ class RobotFramework(Application):
                                  settings['WarnOnSkipped'],
                                  settings['RunEmptySuite']).build(*datasources)
         suite.configure(**settings.suite_config)
-        result = suite.run(settings)
+        if settings.processes > 1:
+            runner = ParallelRunner(datasources, options, settings)
+            result = runner.run(suite)
+        else:
+            result = suite.run(settings)
         LOGGER.info("Tests execution ended. Statistics:\n%s"
                     % result.suite.stat_message)
         if settings.log or settings.report or settings.xunit:
@@ -21,6 +21,7 @@ from robot.errors import FrameworkError
 from robot import utils
 
 from .testlibraries import TestLibrary
+from .userkeyword import UserLibrary
 
 
 class Importer(object):
@@ -28,6 +29,7 @@ class Importer(object):
     def __init__(self):
         self._library_cache = ImportCache()
         self._resource_cache = ImportCache()
+        self._resource_keyword_cache = ImportCache()
 
     def reset(self):
         self.__init__()
@@ -50,6 +52,18 @@ class Importer(object):
             self._resource_cache[path] = resource
         return self._resource_cache[path]
 
+    def import_resource_keywords(self, resource):
+        """Returns keywords of an imported resource as a UserLibrary.
+
+        The same UserLibrary is shared by all namespaces importing
+        the resource so it must not be modified.
+        """
+        path = resource.source
+        if path not in self._resource_keyword_cache:
+            self._resource_keyword_cache[path] \
+                = UserLibrary(resource.keyword_table.keywords, path)
+        return self._resource_keyword_cache[path]
+
     def _import_library(self, name, positional, named, lib):
         args = positional + ['%s=%s' % arg for arg in sorted(named.items())]
         key = (name, positional, named)
@@ -13,7 +13,8 @@
 #  limitations under the License.
 
 from robot.utils import (format_assign_message, get_elapsed_time,
-                         get_error_message, get_timestamp, plural_or_not)
+                         get_epoch_millis, get_error_message, plural_or_not,
+                         Timestamp)
 from robot.errors import (ContinueForLoop, DataError, ExecutionFailed,
                           ExecutionFailures, ExecutionPassed, ExitForLoop,
                           HandlerExecutionFailed)
@@ -65,7 +66,11 @@ class Keywords(object):
         return iter(self._keywords)
 
 
-class _BaseKeyword:
+class _BaseKeyword(object):
+    starttime = Timestamp('_starttime')
+    endtime = Timestamp('_endtime')
+    starttime_millis = Timestamp('_starttime', millis=True)
+    endtime_millis = Timestamp('_endtime', millis=True)
 
     def __init__(self, name='', args=None, doc='', timeout='', type='kw'):
         self.name = name
@@ -99,8 +104,8 @@ class Keyword(_BaseKeyword):
         self.assign = assign or []
         self.handler_name = name
 
-    def run(self, context):
-        handler = self._start(context)
+    def run(self, context, handler=None):
+        handler = self._start(context, handler)
         try:
             return_value = self._run(handler, context)
         except ExecutionFailed, err:
@@ -113,13 +118,14 @@ class Keyword(_BaseKeyword):
             self._end(context, return_value)
             return return_value
 
-    def _start(self, context):
-        handler = context.get_handler(self.handler_name)
+    def _start(self, context, handler=None):
+        if handler is None:
+            handler = context.get_handler(self.handler_name)
         handler.init_keyword(context.variables)
         self.name = self._get_name(handler.longname)
         self.doc = handler.shortdoc
         self.timeout = getattr(handler, 'timeout', '')
-        self.starttime = get_timestamp()
+        self.starttime_millis = get_epoch_millis()
         context.start_keyword(self)
         if self.doc.startswith('*DEPRECATED*'):
             msg = self.doc.replace('*DEPRECATED*', '', 1).strip()
@@ -142,8 +148,9 @@ class Keyword(_BaseKeyword):
             self._report_failure(context)
 
     def _end(self, context, return_value=None, error=None):
-        self.endtime = get_timestamp()
-        self.elapsedtime = get_elapsed_time(self.starttime, self.endtime)
+        self.endtime_millis = get_epoch_millis()
+        self.elapsedtime = get_elapsed_time(self.starttime_millis,
+                                            self.endtime_millis)
         if error and self.type == 'teardown':
             self.message = unicode(error)
         try:
@@ -187,12 +194,13 @@ class ForLoop(_BaseKeyword):
                                  ' | '.join(data.items))
 
     def run(self, context):
-        self.starttime = get_timestamp()
+        self.starttime_millis = get_epoch_millis()
         context.start_keyword(self)
         error = self._run_with_error_handling(self._validate_and_run, context)
         self.status = self._get_status(error)
-        self.endtime = get_timestamp()
-        self.elapsedtime = get_elapsed_time(self.starttime, self.endtime)
+        self.endtime_millis = get_epoch_millis()
+        self.elapsedtime = get_elapsed_time(self.starttime_millis,
+                                            self.endtime_millis)
         context.end_keyword(self)
         if error:
             raise error
@@ -301,9 +309,10 @@ class _ForItem(_BaseKeyword):
         name = ', '.join(format_assign_message(var, item)
                          for var, item in zip(vars, items))
         _BaseKeyword.__init__(self, name, type='foritem')
-        self.starttime = get_timestamp()
+        self.starttime_millis = get_epoch_millis()
 
     def end(self, status):
         self.status = status
-        self.endtime = get_timestamp()
-        self.elapsedtime = get_elapsed_time(self.starttime, self.endtime)
+        self.endtime_millis = get_epoch_millis()
+        self.elapsedtime = get_elapsed_time(self.starttime_millis,
+                                            self.endtime_millis)
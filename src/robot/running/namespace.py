@@ -35,7 +35,7 @@ STDLIB_NAMES = set(('BuiltIn', 'Collections', 'DateTime', 'Dialogs', 'Easter',
 IMPORTER = Importer()
 
 
-class Namespace:
+class Namespace(object):
     _default_libraries = ('BuiltIn', 'Reserved', 'Easter')
     _deprecated_libraries = {'BuiltIn': 'DeprecatedBuiltIn',
                              'OperatingSystem': 'DeprecatedOperatingSystem'}
@@ -48,12 +48,25 @@ class Namespace:
         self.test = None
         self.uk_handlers = []
         self.variables = _VariableScopes(variables, parent_variables)
-        self.library_search_order = []
+        self._library_search_order = []
         self._imports = imports
         self._user_keywords = UserLibrary(user_keywords)
         self._testlibs = {}
         self._imported_resource_files = ImportCache()
         self._imported_variable_files = ImportCache()
+        self.keyword_cache = KeywordCache()
+
+    def _get_library_search_order(self):
+        return self._library_search_order
+
+    def set_library_search_order(self, order):
+        old_order = self._library_search_order
+        self._library_search_order = order
+        self.keyword_cache.clear()
+        return old_order
+
+    library_search_order = property(_get_library_search_order,
+                                    set_library_search_order)
 
     @property
     def libraries(self):
@@ -98,7 +111,8 @@ class Namespace:
             self.variables.set_from_variable_table(resource.variable_table,
                                                    overwrite)
             self._imported_resource_files[path] \
-                = UserLibrary(resource.keyword_table.keywords, resource.source)
+                = IMPORTER.import_resource_keywords(resource)
+            self.keyword_cache.clear()
             self._handle_imports(resource.setting_table.imports)
         else:
             LOGGER.info("Resource file '%s' already imported by suite '%s'"
@@ -138,6 +152,7 @@ class Namespace:
                         % (lib.name, self.suite.longname))
             return
         self._testlibs[lib.name] = lib
+        self.keyword_cache.clear()
         lib.start_suite()
         if self.test:
             lib.start_test()
@@ -207,13 +222,21 @@ class Namespace:
             raise DataError("No library with name '%s' found." % libname)
 
     def get_handler(self, name):
+        handler = self.keyword_cache.get(name)
+        if handler is None:
+            handler = self._get_handler_and_cache_it(name)
+        self._replace_variables_from_user_handlers(handler)
+        return handler
+
+    def _get_handler_and_cache_it(self, name):
+        self.keyword_cache.start_lookup()
         try:
             handler = self._get_handler(name)
             if handler is None:
                 raise DataError("No keyword with name '%s' found." % name)
         except DataError, err:
-            handler = UserErrorHandler(name, unicode(err))
-        self._replace_variables_from_user_handlers(handler)
+            return UserErrorHandler(name, unicode(err))
+        self.keyword_cache.set(name, handler)
         return handler
 
     def _replace_variables_from_user_handlers(self, handler):
@@ -326,6 +349,8 @@ class Namespace:
         else:
             return [handler1, handler2]
         if not RUN_KW_REGISTER.is_run_keyword(external.library.orig_name, external.name):
+            # Not cached to get the warning every time the keyword is used.
+            self.keyword_cache.disable_current_lookup()
             LOGGER.warn(
                 "Keyword '%s' found both from a user created test library "
                 "'%s' and Robot Framework standard library '%s'. The user "
@@ -360,6 +385,55 @@ class Namespace:
         raise DataError(error)
 
 
+class KeywordCache(object):
+    """Caches keyword handlers found from a namespace by their names.
+
+    Names are used as-is, without normalizing them, so that a hit requires
+    only one dictionary lookup. The cache must be cleared when imports or
+    the library search order change.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._cacheable = True
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name):
+        try:
+            handler = self._handlers[name]
+        except (KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return handler
+
+    def start_lookup(self):
+        self._cacheable = True
+
+    def disable_current_lookup(self):
+        self._cacheable = False
+
+    def set(self, name, handler):
+        if self._cacheable:
+            self._handlers[name] = handler
+
+    def clear(self):
+        self._handlers.clear()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return float(self.hits) / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def __unicode__(self):
+        return '%d hits, %d misses, hit rate %.1f%%' \
+                % (self.hits, self.misses, self.hit_rate * 100)
+
+
 class _VariableScopes:
 
     def __init__(self, suite_variables, parent_variables):
@@ -381,6 +455,9 @@ class _VariableScopes:
             return len(self.current)
         return 0
 
+    def __nonzero__(self):
+        return bool(self.current)
+
     def copy_all(self):
         vs = _VariableScopes(None, None)
         vs._suite = self._suite
@@ -427,14 +504,14 @@ class _VariableScopes:
         self._suite = self._test = self.current = None
 
     def start_test(self):
-        self._test = self.current = self._suite.copy()
+        self._test = self.current = self._suite.new_scope()
 
     def end_test(self):
         self.current = self._suite
 
     def start_uk(self):
         self._uk_handlers.append(self.current)
-        self.current = self.current.copy()
+        self.current = self.current.new_scope()
 
     def end_uk(self):
         self.current = self._uk_handlers.pop()
@@ -13,7 +13,6 @@
 #  limitations under the License.
 
 import sys
-from StringIO import StringIO
 
 from robot.output import LOGGER
 from robot.utils import decode_output, encode_output
@@ -23,10 +22,8 @@ class OutputCapturer(object):
 
     def __init__(self, library_import=False):
         self._library_import = library_import
-        self._python_out = PythonCapturer(stdout=True)
-        self._python_err = PythonCapturer(stdout=False)
-        self._java_out = JavaCapturer(stdout=True)
-        self._java_err = JavaCapturer(stdout=False)
+        for capturer in PYTHON_STDOUT, JAVA_STDOUT, PYTHON_STDERR, JAVA_STDERR:
+            capturer.start()
 
     def __enter__(self):
         if self._library_import:
@@ -48,44 +45,78 @@ class OutputCapturer(object):
             sys.__stderr__.write(encode_output(stderr+'\n'))
 
     def _release(self):
-        stdout = self._python_out.release() + self._java_out.release()
-        stderr = self._python_err.release() + self._java_err.release()
+        stdout = PYTHON_STDOUT.release() + JAVA_STDOUT.release()
+        stderr = PYTHON_STDERR.release() + JAVA_STDERR.release()
         return stdout, stderr
 
 
 class PythonCapturer(object):
+    """Captures output written to `sys.stdout` or `sys.stderr`.
 
-    def __init__(self, stdout=True):
-        if stdout:
-            self._original = sys.stdout
-            self._set_stream = self._set_stdout
-        else:
-            self._original = sys.stderr
-            self._set_stream = self._set_stderr
-        self._stream = StringIO()
-        self._set_stream(self._stream)
+    Only one instance per stream is created and it is reused by all
+    captures. Captures can be nested and each of them gets the output
+    written after it was started.
+    """
 
-    def _set_stdout(self, stream):
-        sys.stdout = stream
+    def __init__(self, stdout=True):
+        self._name = 'stdout' if stdout else 'stderr'
+        self._captures = []
 
-    def _set_stderr(self, stream):
-        sys.stderr = stream
+    def start(self):
+        stream = CaptureStream()
+        self._captures.append((getattr(sys, self._name), stream))
+        setattr(sys, self._name, stream)
 
     def release(self):
+        original, stream = self._captures.pop()
         # Original stream must be restored before closing the current
-        self._set_stream(self._original)
-        try:
-            return self._get_value(self._stream)
-        finally:
-            self._stream.close()
+        setattr(sys, self._name, original)
+        return stream.close()
+
+
+class CaptureStream(object):
+    """Minimal stream collecting written strings into a list.
+
+    Noticing that nothing was written requires no work. Like with other
+    closed streams, writing after the capture has ended fails. This matters
+    e.g. with `logging.StreamHandler` instances created during capturing.
+    """
+    __slots__ = ['_chunks', 'closed', 'softspace']
+
+    def __init__(self):
+        self._chunks = []
+        self.closed = False
+        self.softspace = 0
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+        if not isinstance(data, basestring):
+            data = str(data)
+        self._chunks.append(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
 
-    def _get_value(self, stream):
+    def flush(self):
+        if self.closed:
+            raise ValueError('I/O operation on closed file')
+
+    def isatty(self):
+        return False
+
+    def close(self):
+        """Closes the stream and returns the written output as Unicode."""
+        self.closed = True
+        chunks = self._chunks
+        if not chunks:
+            return u''
+        self._chunks = []
         try:
-            return decode_output(stream.getvalue())
+            return decode_output(''.join(chunks))
         except UnicodeError:
-            stream.buf = decode_output(stream.buf)
-            stream.buflist = [decode_output(item) for item in stream.buflist]
-            return stream.getvalue()
+            return u''.join(decode_output(chunk) for chunk in chunks)
 
 
 if not sys.platform.startswith('java'):
@@ -95,6 +126,9 @@ if not sys.platform.startswith('java'):
         def __init__(self, stdout=True):
             pass
 
+        def start(self):
+            pass
+
         def release(self):
             return u''
 
@@ -107,19 +141,30 @@ else:
 
         def __init__(self, stdout=True):
             if stdout:
-                self._original = System.out
+                self._get_stream = lambda: System.out
                 self._set_stream = System.setOut
             else:
-                self._original = System.err
+                self._get_stream = lambda: System.err
                 self._set_stream = System.setErr
-            self._bytes = ByteArrayOutputStream()
-            self._stream = PrintStream(self._bytes, False, 'UTF-8')
-            self._set_stream(self._stream)
+            self._captures = []
+
+        def start(self):
+            captured = ByteArrayOutputStream()
+            stream = PrintStream(captured, False, 'UTF-8')
+            self._captures.append((self._get_stream(), captured, stream))
+            self._set_stream(stream)
 
         def release(self):
+            original, captured, stream = self._captures.pop()
             # Original stream must be restored before closing the current
-            self._set_stream(self._original)
-            self._stream.close()
-            output = self._bytes.toString('UTF-8')
-            self._bytes.reset()
-            return output
+            self._set_stream(original)
+            stream.close()
+            if not captured.size():
+                return u''
+            return captured.toString('UTF-8')
+
+
+PYTHON_STDOUT = PythonCapturer(stdout=True)
+PYTHON_STDERR = PythonCapturer(stdout=False)
+JAVA_STDOUT = JavaCapturer(stdout=True)
+JAVA_STDERR = JavaCapturer(stdout=False)
@@ -0,0 +1,357 @@
+#  Copyright 2008-2014 Nokia Solutions and Networks
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Executes tests in multiple processes and combines the results.
+
+The executed suite is split into work units that are either suites directly
+containing tests or individual tests. Units are distributed to worker
+processes so that the expected execution time of each worker is as equal as
+possible. Expected times are got from an earlier output file if one is given
+and otherwise the number of tests is used as the weight. Each worker builds
+the suite from the original data sources, removes tests not belonging to its
+units, and executes the remaining tests writing an output file of its own.
+These outputs are finally combined into one result.
+
+Notice that higher level suite setups and teardowns are run in each process
+executing tests under them and that options like ``--exitonfailure`` affect
+only the process where the failure occurs.
+"""
+
+from __future__ import with_statement
+
+import heapq
+import os
+import shutil
+import tempfile
+
+from robot.conf import RobotSettings
+from robot.errors import DataError
+from robot.model import SuiteVisitor
+from robot.output import LOGGER
+from robot.result import ExecutionResult, ResultVisitor
+from robot.result.rerunmerger import ReRunMerger
+
+from .builder import TestSuiteBuilder
+
+
+class ParallelRunner(object):
+
+    def __init__(self, datasources, options, settings):
+        self._datasources = datasources
+        self._options = self._get_worker_options(options, settings)
+        self._settings = settings
+
+    def _get_worker_options(self, options, settings):
+        options = dict(options)
+        for name in ['stdout', 'stderr', 'processes', 'splitlevel',
+                     'durations']:
+            options.pop(name, None)
+        options.update(log='NONE', report='NONE', xunit='NONE',
+                       debugfile='NONE', runemptysuite=True)
+        if settings.randomize_suites or settings.randomize_tests:
+            # Workers must get the same order to have the same unit ids.
+            options['randomize'] = '%s:%d' % settings['Randomize']
+        return options
+
+    def run(self, suite):
+        durations = self._get_durations(self._settings['Durations'])
+        units = WorkUnits(suite, self._settings['SplitLevel'], durations)
+        partitions = units.partition(self._settings['Processes'])
+        if len(partitions) < 2:
+            return suite.run(self._settings)
+        LOGGER.info('Executing %d work unit%s in %d process%s.'
+                    % (len(units), '' if len(units) == 1 else 's',
+                       len(partitions), '' if len(partitions) == 1 else 'es'))
+        tempdir = tempfile.mkdtemp(prefix='robot-parallel-')
+        try:
+            outputs = self._run_partitions(partitions, tempdir)
+            result = self._combine(outputs, suite)
+        finally:
+            shutil.rmtree(tempdir, ignore_errors=True)
+        result.suite.visit(ExecutionReporter())
+        if self._settings.output:
+            result.save(self._settings.output)
+            LOGGER.output_file('Output', self._settings.output)
+        return result
+
+    def _get_durations(self, path):
+        if not path:
+            return {}
+        try:
+            result = ExecutionResult(path, include_keywords=False)
+        except DataError, err:
+            LOGGER.warn('Reading earlier execution times failed: %s' % err)
+            return {}
+        collector = DurationCollector()
+        result.visit(collector)
+        return collector.durations
+
+    def _run_partitions(self, partitions, tempdir):
+        try:
+            from multiprocessing import Pool
+        except ImportError:
+            raise DataError('Parallel execution requires the multiprocessing '
+                            'module that is not available on this interpreter.')
+        tasks = [(self._datasources, self._options, ids,
+                  os.path.join(tempdir, 'output-%d.xml' % index))
+                 for index, ids in enumerate(partitions)]
+        pool = Pool(len(tasks))
+        try:
+            return pool.map(_run_partition, tasks, chunksize=1)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _combine(self, outputs, original):
+        results = [ExecutionResult(output) for output in outputs]
+        result = results[0]
+        merger = ParallelResultMerger(result)
+        for other in results[1:]:
+            merger.merge(other)
+        original.visit(OriginalOrderRestorer(result.suite))
+        result.source = None
+        result.suite.set_criticality(self._settings.critical_tags,
+                                     self._settings.non_critical_tags)
+        result.configure(status_rc=self._settings.status_rc,
+                         stat_config=self._settings.statistics_config)
+        return result
+
+
+def _run_partition(task):
+    datasources, options, unit_ids, output = task
+    LOGGER.unregister_console_logger()
+    settings = RobotSettings(options, output=output)
+    suite = TestSuiteBuilder(settings['SuiteNames'],
+                             settings['WarnOnSkipped'],
+                             settings['RunEmptySuite']).build(*datasources)
+    suite.configure(**settings.suite_config)
+    # Name of the root suite may be generated from its children.
+    suite.name = suite.name
+    suite.visit(WorkUnitSelector(unit_ids))
+    suite.remove_empty_suites()
+    suite.run(settings)
+    return output
+
+
+class WorkUnit(object):
+
+    def __init__(self, id, tests, weight):
+        self.id = id
+        self.tests = tests
+        self.weight = weight
+
+    def __len__(self):
+        return len(self.tests)
+
+
+class WorkUnits(SuiteVisitor):
+    """Splits the given suite into work units.
+
+    With split level ``suite`` each suite directly containing tests is one
+    unit and with split level ``test`` each individual test is a unit.
+    Weight of a unit is the sum of earlier execution times of its tests.
+    Tests without earlier execution time get the average time of known tests.
+    """
+
+    def __init__(self, suite, split_level='suite', durations=None):
+        self._split_level = split_level
+        self._durations = durations or {}
+        self._default_weight = self._get_default_weight(self._durations)
+        self._units = []
+        suite.visit(self)
+
+    def _get_default_weight(self, durations):
+        if not durations:
+            return 1
+        return max(sum(durations.values()) / float(len(durations)), 1)
+
+    def start_suite(self, suite):
+        if not suite.tests:
+            return
+        if self._split_level == 'test':
+            self._units.extend(self._create_unit(test.id, [test])
+                               for test in suite.tests)
+        else:
+            self._units.append(self._create_unit(suite.id, list(suite.tests)))
+
+    def _create_unit(self, id, tests):
+        weight = sum(self._durations.get(test.longname, self._default_weight)
+                     for test in tests)
+        return WorkUnit(id, tests, weight)
+
+    def visit_test(self, test):
+        pass
+
+    def visit_keyword(self, kw):
+        pass
+
+    def partition(self, count):
+        """Returns unit ids split into at most `count` balanced partitions.
+
+        Units are assigned, heaviest first, to the partition having the
+        smallest total weight. Ids in partitions preserve the original order.
+        """
+        if count < 1:
+            raise ValueError('Partition count must be positive.')
+        order = dict((unit.id, index) for index, unit in enumerate(self))
+        partitions = [(0, index, []) for index in range(count)]
+        for unit in sorted(self, key=lambda unit: unit.weight, reverse=True):
+            weight, index, ids = heapq.heappop(partitions)
+            ids.append(unit.id)
+            heapq.heappush(partitions, (weight + unit.weight, index, ids))
+        return [sorted(ids, key=order.get)
+                for _, _, ids in sorted(partitions, key=lambda p: p[1]) if ids]
+
+    def __iter__(self):
+        return iter(self._units)
+
+    def __len__(self):
+        return len(self._units)
+
+
+class WorkUnitSelector(SuiteVisitor):
+    """Removes tests not belonging to the given work units.
+
+    Units are identified by suite or test ids. Suites left without tests
+    must be removed separately after visiting.
+    """
+
+    def __init__(self, unit_ids):
+        self._unit_ids = set(unit_ids)
+
+    def start_suite(self, suite):
+        if suite.id not in self._unit_ids:
+            suite.tests = [test for test in suite.tests
+                           if test.id in self._unit_ids]
+
+    def visit_test(self, test):
+        pass
+
+    def visit_keyword(self, kw):
+        pass
+
+
+class DurationCollector(ResultVisitor):
+
+    def __init__(self):
+        self.durations = {}
+
+    def visit_test(self, test):
+        self.durations[test.longname] = test.elapsedtime
+
+    def visit_keyword(self, kw):
+        pass
+
+
+class ParallelResultMerger(ReRunMerger):
+    """Combines results of partial executions of the same suite.
+
+    Suites and tests not found from the original result are added to it
+    instead of being reported as ignored like when merging re-executions.
+    """
+
+    def __init__(self, result):
+        ReRunMerger.__init__(self, result)
+        self._errors = result.errors
+
+    def merge(self, merged):
+        ReRunMerger.merge(self, merged)
+        self._errors.add(merged.errors)
+
+    def start_suite(self, suite):
+        try:
+            if not self.current:
+                self.current = self._find_root(suite)
+            else:
+                self.current = self._index(self.current).suite(suite.name)
+        except ValueError:
+            if not self.current:
+                self._report_ignored(suite)
+            else:
+                self._index(self.current).add_suite(suite)
+            return False
+        self._update_times(self.current, suite)
+
+    def _update_times(self, current, merged):
+        if merged.starttime_millis is not None and \
+                (current.starttime_millis is None or
+                 merged.starttime_millis < current.starttime_millis):
+            current.starttime = merged.starttime
+        if merged.endtime_millis is not None and \
+                (current.endtime_millis is None or
+                 merged.endtime_millis > current.endtime_millis):
+            current.endtime = merged.endtime
+
+    def visit_test(self, test):
+        self.current.tests.append(test)
+
+
+class OriginalOrderRestorer(SuiteVisitor):
+    """Sorts combined result suites and tests to the original execution order.
+    """
+
+    def __init__(self, result):
+        self._current = None
+        self._result = result
+
+    def start_suite(self, suite):
+        if self._current is None:
+            current = self._result
+        else:
+            current = self._find(self._current.suites, suite.name)
+        if current is None:
+            return False
+        self._current = current
+        self._current.suites = self._sort(self._current.suites, suite.suites)
+        self._current.tests = self._sort(self._current.tests, suite.tests)
+
+    def _find(self, items, name):
+        for item in items:
+            if item.name == name:
+                return item
+        return None
+
+    def _sort(self, items, original):
+        order = {}
+        for index, item in enumerate(original):
+            order.setdefault(item.name, index)
+        return sorted(items, key=lambda item: order.get(item.name, len(order)))
+
+    def end_suite(self, suite):
+        self._current = self._current.parent
+
+    def visit_test(self, test):
+        pass
+
+    def visit_keyword(self, kw):
+        pass
+
+
+class ExecutionReporter(SuiteVisitor):
+    """Reports combined results to loggers as if tests were run in order."""
+
+    def start_suite(self, suite):
+        LOGGER.start_suite(suite)
+
+    def end_suite(self, suite):
+        LOGGER.end_suite(suite)
+
+    def start_test(self, test):
+        LOGGER.start_test(test)
+
+    def end_test(self, test):
+        LOGGER.end_test(test)
+
+    def visit_keyword(self, kw):
+        pass
@@ -18,7 +18,7 @@ from robot.errors import ExecutionFailed, DataError, PassExecution
 from robot.model import SuiteVisitor
 from robot.result import TestSuite, Result
 from robot.variables import GLOBAL_VARIABLES
-from robot.utils import get_timestamp, NormalizedDict
+from robot.utils import get_epoch_millis, NormalizedDict
 
 from .context import EXECUTION_CONTEXTS
 from .keywords import Keywords, Keyword
@@ -55,7 +55,7 @@ class Runner(SuiteVisitor):
                            name=suite.name,
                            doc=suite.doc,
                            metadata=suite.metadata,
-                           starttime=get_timestamp())
+                           starttime=get_epoch_millis())
         if not self.result:
             result.set_criticality(self._settings.critical_tags,
                                    self._settings.non_critical_tags)
@@ -94,7 +94,7 @@ class Runner(SuiteVisitor):
             failure = self._run_teardown(suite.keywords.teardown, self._suite_status)
             if failure:
                 self._suite.suite_teardown_failed(unicode(failure))
-        self._suite.endtime = get_timestamp()
+        self._suite.endtime_millis = get_epoch_millis()
         self._suite.message = self._suite_status.message
         self._context.end_suite(self._suite)
         self._suite = self._suite.parent
@@ -108,7 +108,7 @@ class Runner(SuiteVisitor):
         result = self._suite.tests.create(name=test.name,
                                           doc=self._resolve_setting(test.doc),
                                           tags=test.tags,
-                                          starttime=get_timestamp(),
+                                          starttime=get_epoch_millis(),
                                           timeout=self._get_timeout(test))
         keywords = Keywords(test.keywords.normal, bool(test.template))
         status = TestStatus(self._suite_status)
@@ -146,7 +146,7 @@ class Runner(SuiteVisitor):
             status.test_failed(result.timeout.get_message(), result.critical)
             result.message = status.message
         result.status = status.status
-        result.endtime = get_timestamp()
+        result.endtime_millis = get_epoch_millis()
         self._output.end_test(ModelCombiner(result, test))
         self._context.end_test(result)
 
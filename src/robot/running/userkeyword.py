@@ -16,6 +16,7 @@ from __future__ import with_statement
 
 import os
 import re
+from bisect import insort
 
 from robot.errors import (DataError, ExecutionFailed, ExecutionPassed,
                           PassExecution, ReturnFromKeyword,
@@ -37,7 +38,7 @@ class UserLibrary(BaseLibrary):
     def __init__(self, user_keywords, path=None):
         self.name = self._get_name_for_resource_file(path)
         self.handlers = utils.NormalizedDict(ignore=['_'])
-        self.embedded_arg_handlers = []
+        self.embedded_arg_handlers = EmbeddedArgsTemplates()
         for kw in user_keywords:
             try:
                 handler = self._create_handler(kw)
@@ -56,7 +57,7 @@ class UserLibrary(BaseLibrary):
         except TypeError:
             handler = UserKeywordHandler(kw, self.name)
         else:
-            self.embedded_arg_handlers.append(handler)
+            self.embedded_arg_handlers.add(handler)
         return handler
 
     def _get_name_for_resource_file(self, path):
@@ -67,14 +68,7 @@ class UserLibrary(BaseLibrary):
     def has_handler(self, name):
         if BaseLibrary.has_handler(self, name):
             return True
-        for template in self.embedded_arg_handlers:
-            try:
-                EmbeddedArgs(name, template)
-            except TypeError:
-                pass
-            else:
-                return True
-        return False
+        return bool(self.embedded_arg_handlers.match(name))
 
     def get_handler(self, name):
         try:
@@ -88,13 +82,8 @@ class UserLibrary(BaseLibrary):
             self._raise_multiple_matching_keywords_found(name, found)
 
     def _get_embedded_arg_handlers(self, name):
-        found = []
-        for template in self.embedded_arg_handlers:
-            try:
-                found.append(EmbeddedArgs(name, template))
-            except TypeError:
-                pass
-        return found
+        return [EmbeddedArgs(name, template)
+                for template in self.embedded_arg_handlers.match(name)]
 
     def _raise_multiple_matching_keywords_found(self, name, found):
         names = utils.seq2str([f.orig_name for f in found])
@@ -266,6 +255,8 @@ class EmbeddedArgsTemplate(UserKeywordHandler):
                 = self._read_embedded_args_and_regexp(keyword.name)
         if not self.embedded_args:
             raise TypeError('Must have embedded arguments')
+        self.name_prefix, self.name_suffix \
+                = self._get_literal_prefix_and_suffix(keyword.name)
         UserKeywordHandler.__init__(self, keyword, libname)
         self.keyword = keyword
 
@@ -279,6 +270,11 @@ class EmbeddedArgsTemplate(UserKeywordHandler):
         full_pattern.extend([re.escape(string), '$'])
         return args, self._compile_regexp(full_pattern)
 
+    def _get_literal_prefix_and_suffix(self, string):
+        parts = [(before, string) for before, _, string
+                 in VariableIterator(string, identifiers='$')]
+        return parts[0][0], parts[-1][1]
+
     def _get_regexp_pattern(self, variable):
         if ':' not in variable:
             return variable, self._default_pattern
@@ -316,6 +312,71 @@ class EmbeddedArgsTemplate(UserKeywordHandler):
                             % utils.get_error_message())
 
 
+class EmbeddedArgsTemplates(object):
+    """Finds embedded argument templates matching a keyword name.
+
+    Templates are indexed by the literal text before their first and after
+    their last embedded argument. Only templates whose literal start and end
+    match the name are tried with their regular expression, which keeps
+    finding matches fast also when there are lots of templates.
+    """
+
+    def __init__(self):
+        self._templates = []
+        self._index = {}
+        self._prefix_lengths = []
+
+    def add(self, template):
+        prefix = template.name_prefix.lower()
+        suffix = template.name_suffix.lower()
+        if prefix not in self._index:
+            self._index[prefix] = ({}, [])
+            self._add_length(len(prefix), self._prefix_lengths)
+        by_suffix, suffix_lengths = self._index[prefix]
+        if suffix not in by_suffix:
+            by_suffix[suffix] = []
+            self._add_length(len(suffix), suffix_lengths)
+        by_suffix[suffix].append((len(self._templates), template))
+        self._templates.append(template)
+
+    def _add_length(self, length, lengths):
+        if length not in lengths:
+            insort(lengths, length)
+
+    def match(self, name):
+        """Returns templates matching the name in the order they were added.
+        """
+        candidates = self._get_candidates(name.lower())
+        if len(candidates) > 1:
+            candidates.sort()
+        return [template for _, template in candidates
+                if template.name_regexp.match(name)]
+
+    def _get_candidates(self, name):
+        candidates = []
+        for prefix_length in self._prefix_lengths:
+            if prefix_length > len(name):
+                break
+            if name[:prefix_length] not in self._index:
+                continue
+            by_suffix, suffix_lengths = self._index[name[:prefix_length]]
+            for suffix_length in suffix_lengths:
+                if prefix_length + suffix_length > len(name):
+                    break
+                suffix = name[len(name)-suffix_length:]
+                candidates.extend(by_suffix.get(suffix, ()))
+        return candidates
+
+    def __iter__(self):
+        return iter(self._templates)
+
+    def __len__(self):
+        return len(self._templates)
+
+    def __getitem__(self, index):
+        return self._templates[index]
+
+
 class EmbeddedArgs(UserKeywordHandler):
 
     def __init__(self, name, template):
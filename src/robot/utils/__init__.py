@@ -49,14 +49,15 @@ from .islike import is_dict_like, is_list_like, is_str_like
 from .match import eq, Matcher, MultiMatcher
 from .misc import (isatty, getdoc, plural_or_not, printable_name,
                    seq2str, seq2str2)
-from .normalizing import lower, normalize, NormalizedDict
+from .normalizing import get_normalizer, lower, normalize, NormalizedDict
 from .robotenv import get_env_var, set_env_var, del_env_var, get_env_vars
 from .robotinspect import is_java_init, is_java_method
 from .robotpath import abspath, find_file, get_link_path, normpath
 from .robottime import (get_timestamp, get_start_timestamp, format_time,
                         get_time, get_elapsed_time, elapsed_time_to_string,
                         timestr_to_secs, secs_to_timestr, secs_to_timestamp,
-                        timestamp_to_secs, parse_time)
+                        timestamp_to_secs, parse_time, get_epoch_millis,
+                        millis_to_timestamp, timestamp_to_millis, Timestamp)
 from .setter import setter
 from .text import (cut_long_message, format_assign_message,
                    pad_console_length, get_console_length)
@@ -15,6 +15,10 @@
 import sys
 import os.path
 from StringIO import StringIO
+try:
+    import gzip
+except ImportError:
+    gzip = None
 
 
 _IRONPYTHON = sys.platform == 'cli'
@@ -90,7 +94,12 @@ class ETSource(object):
         # especially on Windows: http://bugs.jython.org/issue1598
         # The bug has now been fixed in ET and worked around in Jython 2.5.2.
         def _open_file(self, source):
-            return open(source, 'rb')
+            opened = open(source, 'rb')
+            if gzip and opened.read(2) == '\x1f\x8b':
+                opened.close()
+                return gzip.open(source, 'rb')
+            opened.seek(0)
+            return opened
 
         def _open_string_io(self, source):
             return StringIO(source.encode('UTF-8'))
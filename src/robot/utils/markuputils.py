@@ -22,6 +22,10 @@ _generic_escapes = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'))
 _attribute_escapes = _generic_escapes \
          + (('"', '&quot;'), ('\n', '&#10;'), ('\r', '&#13;'), ('\t', '&#09;'))
 _illegal_chars_in_xml = re.compile(u'[\x00-\x08\x0B\x0C\x0E-\x1F\uFFFE\uFFFF]')
+# Used to avoid escaping, which is relatively slow, when it is not needed.
+_needs_xml_escaping = re.compile(u'[&<>\x00-\x08\x0B\x0C\x0E-\x1F\uFFFE\uFFFF]')
+_needs_attribute_escaping = re.compile(u'[&<>"\n\r\t\x00-\x08\x0B\x0C\x0E-\x1F'
+                                       u'\uFFFE\uFFFF]')
 
 
 def html_escape(text):
@@ -29,6 +33,8 @@ def html_escape(text):
 
 
 def xml_escape(text):
+    if not _needs_xml_escaping.search(text):
+        return text
     return _illegal_chars_in_xml.sub('', _escape(text))
 
 
@@ -37,6 +43,8 @@ def html_format(text):
 
 
 def attribute_escape(attr):
+    if not _needs_attribute_escaping.search(attr):
+        return attr
     return _escape(attr, _attribute_escapes)
 
 
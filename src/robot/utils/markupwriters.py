@@ -16,8 +16,10 @@ from .markuputils import html_escape, xml_escape, attribute_escape
 
 
 class _MarkupWriter(object):
+    default_buffer_size = 64 * 1024
 
-    def __init__(self, output, line_separator='\n', encoding='UTF-8'):
+    def __init__(self, output, line_separator='\n', encoding='UTF-8',
+                 buffer_size=None):
         """
         :param output: Either an opened, file like object, or a path to the
             desired output file. In the latter case, the file is created
@@ -25,14 +27,27 @@ class _MarkupWriter(object):
         :param line_separator: Defines the used line separator.
         :param encoding: Encoding to be used to encode all text written to the
             output file. If `None`, text will not be encoded.
+        :param buffer_size: Written text is collected into a buffer and
+            written to the output when the buffer has at least this many
+            characters or :py:meth:`flush` or :py:meth:`close` is called.
+            By default only files opened by the writer itself are buffered
+            using :py:attr:`default_buffer_size`. `0` disables buffering.
         """
         if isinstance(output, basestring):
-            output = open(output, 'w')
+            output = self._open(output)
+            if buffer_size is None:
+                buffer_size = self.default_buffer_size
         self.output = output
         self._line_separator = line_separator
         self._encoding = encoding
+        self._buffer_size = buffer_size or 0
+        self._buffer = []
+        self._buffered = 0
         self._preamble()
 
+    def _open(self, path):
+        return open(path, 'w')
+
     def _preamble(self):
         pass
 
@@ -66,14 +81,28 @@ class _MarkupWriter(object):
         self.content(content, escape, replace_newlines)
         self.end(name, newline)
 
+    def flush(self):
+        """Writes buffered text to the underlying output."""
+        if self._buffer:
+            self.output.write(self._encode(''.join(self._buffer)))
+            self._buffer = []
+            self._buffered = 0
+
     def close(self):
         """Closes the underlying output file."""
+        self.flush()
         self.output.close()
 
     def _write(self, text, newline=False):
-        self.output.write(self._encode(text))
         if newline:
-            self.output.write(self._line_separator)
+            text += self._line_separator
+        if not self._buffer_size:
+            self.output.write(self._encode(text))
+            return
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self._buffer_size:
+            self.flush()
 
     def _encode(self, text):
         return text.encode(self._encoding) if self._encoding else text
@@ -89,6 +118,19 @@ class HtmlWriter(_MarkupWriter):
 
 
 class XmlWriter(_MarkupWriter):
+    """Writes XML files.
+
+    If the output is given as a path with extension `.gz`, the file is
+    compressed using gzip. :class:`~robot.utils.etreewrapper.ETSource`
+    recognizes compressed files automatically when they are read.
+    """
+    compress_level = 6
+
+    def _open(self, path):
+        if path.lower().endswith('.gz'):
+            import gzip
+            return gzip.open(path, 'wb', self.compress_level)
+        return _MarkupWriter._open(self, path)
 
     def _preamble(self):
         self._write('<?xml version="1.0" encoding="%s"?>' % self._encoding,
@@ -100,4 +142,5 @@ class XmlWriter(_MarkupWriter):
 
 class NullMarkupWriter(object):
     """Null implementation of _MarkupWriter interface"""
-    __init__ = start = content = element = end = close = lambda *args: None
+    __init__ = start = content = element = end = flush = close \
+            = lambda *args: None
@@ -66,6 +66,46 @@ else:
         return False
 
 
+class _Normalizer(object):
+    """Normalizes strings according to the spec and caches the results.
+
+    The cache is cleared when it grows too big to keep memory usage bounded.
+    """
+    _max_cache_size = 10000
+
+    def __init__(self, ignore=(), caseless=True, spaceless=True):
+        self._spec = (tuple(ignore), caseless, spaceless)
+        self._cache = {}
+
+    def __call__(self, string):
+        try:
+            return self._cache[string]
+        except KeyError:
+            pass
+        normalized = normalize(string, *self._spec)
+        if len(self._cache) >= self._max_cache_size:
+            self._cache.clear()
+        self._cache[string] = normalized
+        return normalized
+
+    def __reduce__(self):
+        return get_normalizer, self._spec
+
+
+_NORMALIZERS = {}
+
+def get_normalizer(ignore=(), caseless=True, spaceless=True):
+    """Returns a caching callable normalizing strings according to given spec.
+
+    Normalizing spec has exact same semantics as with `normalize` method.
+    Same normalizer instance is returned for equal specs.
+    """
+    spec = (tuple(ignore), caseless, spaceless)
+    if spec not in _NORMALIZERS:
+        _NORMALIZERS[spec] = _Normalizer(*spec)
+    return _NORMALIZERS[spec]
+
+
 class NormalizedDict(UserDict):
     """Custom dictionary implementation automatically normalizing keys."""
 
@@ -79,7 +119,8 @@ class NormalizedDict(UserDict):
         """
         UserDict.__init__(self)
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        self._sorted_keys = None
+        self._normalize = get_normalizer(ignore, caseless, spaceless)
         if initial:
             self._add_initial(initial)
 
@@ -98,7 +139,9 @@ class NormalizedDict(UserDict):
 
     def _add_key(self, key):
         nkey = self._normalize(key)
-        self._keys.setdefault(nkey, key)
+        if nkey not in self._keys:
+            self._keys[nkey] = key
+            self._sorted_keys = None
         return nkey
 
     def set(self, key, value):
@@ -119,6 +162,7 @@ class NormalizedDict(UserDict):
     def pop(self, key, *default):
         nkey = self._normalize(key)
         self._keys.pop(nkey, *default)
+        self._sorted_keys = None
         return self.data.pop(nkey, *default)
 
     __delitem__ = pop
@@ -126,6 +170,7 @@ class NormalizedDict(UserDict):
     def clear(self):
         UserDict.clear(self)
         self._keys.clear()
+        self._sorted_keys = None
 
     def has_key(self, key):
         return self.data.has_key(self._normalize(key))
@@ -133,7 +178,9 @@ class NormalizedDict(UserDict):
     __contains__ = has_key
 
     def __iter__(self):
-        return (self._keys[norm_key] for norm_key in sorted(self._keys))
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._keys)
+        return (self._keys[norm_key] for norm_key in self._sorted_keys)
 
     def keys(self):
         return list(self)
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import datetime
+import threading
 import time
 import re
 
@@ -307,9 +308,38 @@ def get_timestamp(daysep='', daytimesep=' ', timesep=':', millissep='.'):
     return TIMESTAMP_CACHE.get_timestamp(daysep, daytimesep, timesep, millissep)
 
 
+def get_epoch_millis():
+    """Returns the current time as integer milliseconds after the epoch.
+
+    Returned times never decrease. If the system clock is turned back, the
+    difference is added to all subsequent times so that they continue to
+    increase normally but are ahead of the system clock by that amount.
+    """
+    return TIMESTAMP_CACHE.get_epoch_millis()
+
+
+def millis_to_timestamp(millis, daysep='', daytimesep=' ', timesep=':',
+                        millissep='.'):
+    """Formats milliseconds after the epoch to a timestamp in local time."""
+    return TIMESTAMP_CACHE.millis_to_timestamp(millis, daysep, daytimesep,
+                                               timesep, millissep)
+
+
+def timestamp_to_millis(timestamp, seps=None):
+    """Parses a timestamp in local time to milliseconds after the epoch.
+
+    Timestamp must be in format ``%Y%m%d %H:%M:%S.%f`` unless `seps` are
+    given in which case it is first normalized like in `timestamp_to_secs`.
+    """
+    try:
+        return TIMESTAMP_CACHE.timestamp_to_millis(timestamp, seps)
+    except (ValueError, OverflowError, TypeError):
+        raise ValueError("Invalid timestamp '%s'" % timestamp)
+
+
 def timestamp_to_secs(timestamp, seps=None):
     try:
-        secs = _timestamp_to_millis(timestamp, seps) / 1000.0
+        secs = TIMESTAMP_CACHE.timestamp_to_millis(timestamp, seps) / 1000.0
     except (ValueError, OverflowError):
         raise ValueError("Invalid timestamp '%s'" % timestamp)
     else:
@@ -331,13 +361,24 @@ def get_start_timestamp(daysep='', daytimesep=' ', timesep=':', millissep=None):
 
 
 def get_elapsed_time(start_time, end_time):
-    """Returns the time between given timestamps in milliseconds."""
+    """Returns the time between given timestamps in milliseconds.
+
+    Timestamps can be given either as strings or as milliseconds after
+    the epoch.
+    """
     if start_time == end_time or not (start_time and end_time):
         return 0
+    if isinstance(start_time, (int, long)) and \
+            isinstance(end_time, (int, long)):
+        return int(end_time - start_time)
+    if not isinstance(start_time, basestring):
+        start_time = millis_to_timestamp(start_time)
+    if not isinstance(end_time, basestring):
+        end_time = millis_to_timestamp(end_time)
     if start_time[:-4] == end_time[:-4]:
         return int(end_time[-3:]) - int(start_time[-3:])
-    start_millis = _timestamp_to_millis(start_time)
-    end_millis = _timestamp_to_millis(end_time)
+    start_millis = TIMESTAMP_CACHE.timestamp_to_millis(start_time)
+    end_millis = TIMESTAMP_CACHE.timestamp_to_millis(end_time)
     # start/end_millis can be long but we want to return int when possible
     return int(end_millis - start_millis)
 
@@ -368,9 +409,7 @@ def _elapsed_time_to_string_without_millis(elapsed):
     return '%02d:%02d:%02d' % (hours, mins, secs)
 
 
-def _timestamp_to_millis(timestamp, seps=None):
-    if seps:
-        timestamp = _normalize_timestamp(timestamp, seps)
+def _timestamp_to_millis(timestamp):
     Y, M, D, h, m, s, millis = _split_timestamp(timestamp)
     secs = time.mktime(datetime.datetime(Y, M, D, h, m, s).timetuple())
     return int(round(1000*secs + millis))
@@ -395,39 +434,110 @@ def _split_timestamp(timestamp):
 
 
 class TimestampCache(object):
+    """Formats and parses timestamps reusing results within one second.
+
+    Only the milliseconds differ between timestamps within a second, which
+    is the common case when timestamps are created and read in a sequence.
+    The previous results are stored as tuples so that concurrent threads
+    always see consistent values.
+
+    Both timestamps and epoch milliseconds come from the same clock that
+    never goes backwards. If the system clock is turned back, the clock
+    continues from the latest returned time and stays behind the system
+    clock by the amount it was turned back.
+    """
 
     def __init__(self):
-        self._previous_secs = None
-        self._previous_separators = None
-        self._previous_timestamp = None
+        self._previous = (None, None, None)
+        self._previous_parsed = (None, None)
+        self._latest_millis = 0
+        self._clock_offset = 0
+        self._clock_lock = threading.Lock()
 
     def get_timestamp(self, daysep='', daytimesep=' ', timesep=':', millissep='.'):
-        epoch = self._get_epoch()
-        secs, millis = _float_secs_to_secs_and_millis(epoch)
-        if self._use_cache(secs, daysep, daytimesep, timesep):
-            return self._cached_timestamp(millis, millissep)
-        timestamp = format_time(epoch, daysep, daytimesep, timesep, millissep)
-        self._cache_timestamp(secs, timestamp, daysep, daytimesep, timesep, millissep)
-        return timestamp
+        return self.millis_to_timestamp(self.get_epoch_millis(), daysep,
+                                        daytimesep, timesep, millissep)
+
+    def get_epoch_millis(self):
+        epoch_millis = int(round(self._get_epoch() * 1000))
+        self._clock_lock.acquire()
+        try:
+            millis = epoch_millis + self._clock_offset
+            if millis < self._latest_millis:
+                # Clock has been turned back. Continue from the latest
+                # returned time instead of freezing until it catches up.
+                self._clock_offset += self._latest_millis - millis
+                millis = self._latest_millis
+            self._latest_millis = millis
+        finally:
+            self._clock_lock.release()
+        return millis
+
+    def millis_to_timestamp(self, millis, daysep='', daytimesep=' ',
+                            timesep=':', millissep='.'):
+        secs, millis = divmod(millis, 1000)
+        return self._format(int(secs), int(millis), daysep, daytimesep,
+                            timesep, millissep)
 
     # Seam for mocking
     def _get_epoch(self):
         return time.time()
 
-    def _use_cache(self, secs, *separators):
-        return self._previous_timestamp \
-            and self._previous_secs == secs \
-            and self._previous_separators == separators
-
-    def _cached_timestamp(self, millis, millissep):
+    def _format(self, secs, millis, daysep, daytimesep, timesep, millissep):
+        separators = (daysep, daytimesep, timesep)
+        previous_secs, previous_separators, timestamp = self._previous
+        if previous_secs != secs or previous_separators != separators:
+            timestamp = format_time(time.localtime(secs)[:6], daysep,
+                                    daytimesep, timesep)
+            self._previous = (secs, separators, timestamp)
         if millissep:
-            return '%s%s%03d' % (self._previous_timestamp, millissep, millis)
-        return self._previous_timestamp
+            return '%s%s%03d' % (timestamp, millissep, millis)
+        return timestamp
+
+    def timestamp_to_millis(self, timestamp, seps=None):
+        if seps:
+            timestamp = _normalize_timestamp(timestamp, seps)
+        if len(timestamp) != 21 or timestamp[17] != '.':
+            return _timestamp_to_millis(timestamp)
+        prefix = timestamp[:17]
+        previous_prefix, base = self._previous_parsed
+        if prefix != previous_prefix:
+            base = _timestamp_to_millis(prefix + '.000')
+            self._previous_parsed = (prefix, base)
+        return base + int(timestamp[18:])
+
+
+class Timestamp(object):
+    """Descriptor for timestamps stored either as strings or as milliseconds.
+
+    Strings in format ``%Y%m%d %H:%M:%S.%f``, e.g. ones read from output XML,
+    are stored as-is so that they are written back unchanged. Milliseconds
+    after the epoch, e.g. ones got during execution, are formatted to strings
+    in local time only when needed. Getting the value returns a string or,
+    if `millis` is true, milliseconds parsed when needed. Milliseconds of
+    strings that cannot be parsed are `None`.
+    """
+
+    def __init__(self, attr_name, millis=False):
+        self._attr_name = attr_name
+        self._millis = millis
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance, self._attr_name, None)
+        is_millis = isinstance(value, (int, long))
+        if not self._millis:
+            return millis_to_timestamp(value) if is_millis else value
+        if is_millis or not value:
+            return value if is_millis else None
+        try:
+            return timestamp_to_millis(value)
+        except ValueError:
+            return None
 
-    def _cache_timestamp(self, secs, timestamp, daysep, daytimesep, timesep, millissep):
-        self._previous_secs = secs
-        self._previous_separators = (daysep, daytimesep, timesep)
-        self._previous_timestamp = timestamp[:-4] if millissep else timestamp
+    def __set__(self, instance, value):
+        setattr(instance, self._attr_name, value)
 
 
 TIMESTAMP_CACHE = TimestampCache()
@@ -13,9 +13,10 @@
 #  limitations under the License.
 
 import re
+import copy
 import inspect
 from functools import partial
-from UserDict import UserDict
+from UserDict import UserDict, DictMixin
 try:
     from java.lang.System import getProperty as getJavaSystemProperty
     from java.util import Map
@@ -56,6 +57,9 @@ class Variables(utils.NormalizedDict):
         self._validate_var_name(name)
         utils.NormalizedDict.__setitem__(self, name, value)
 
+    def __nonzero__(self):
+        return bool(self.data)
+
     def update(self, dict=None, **kwargs):
         if dict:
             self._validate_var_dict(dict)
@@ -65,6 +69,25 @@ class Variables(utils.NormalizedDict):
         if kwargs:
             self.update(kwargs)
 
+    def new_scope(self):
+        """Returns new variables using these variables as the parent scope.
+
+        Variables set to the new scope are not visible in this scope, but
+        the new scope sees all variables in this scope that it has not
+        overridden itself. Creating the scope does not copy variables, so
+        it is fast regardless how many variables there are.
+        """
+        scope = copy.copy(self)
+        scope.data = _ScopeDict(self.data)
+        scope._keys = _ScopeDict(self._keys)
+        return scope
+
+    def __iter__(self):
+        if isinstance(self._keys, _ScopeDict):
+            # Sorted keys cannot be cached because parent scopes may change.
+            return (self._keys[nkey] for nkey in sorted(self._keys))
+        return utils.NormalizedDict.__iter__(self)
+
     def __getitem__(self, name):
         self._validate_var_name(name)
         try:
@@ -414,6 +437,78 @@ class Variables(utils.NormalizedDict):
         return utils.NormalizedDict.has_key(self, variable)
 
 
+class _ScopeDict(DictMixin):
+    """Dictionary storing changes locally and reading other items from parent.
+
+    Parent is either a normal dictionary or another `_ScopeDict`, and items
+    are looked up from the chain of dictionaries starting from the local one.
+    Removing an item that exists in the parent only hides it in this scope.
+    """
+    _removed = object()
+
+    def __init__(self, parent):
+        self._local = {}
+        if isinstance(parent, _ScopeDict):
+            self._chain = (self._local,) + parent._chain
+        else:
+            self._chain = (self._local, parent)
+
+    def __getitem__(self, key):
+        for items in self._chain:
+            if key in items:
+                value = items[key]
+                if value is self._removed:
+                    break
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._local[key] = value
+
+    def __delitem__(self, key):
+        self[key]
+        self._local[key] = self._removed
+
+    def has_key(self, key):
+        for items in self._chain:
+            if key in items:
+                return items[key] is not self._removed
+        return False
+
+    __contains__ = has_key
+
+    def keys(self):
+        keys = set()
+        for items in reversed(self._chain):
+            for key, value in items.iteritems():
+                if value is not self._removed:
+                    keys.add(key)
+                else:
+                    keys.discard(key)
+        return list(keys)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    iterkeys = __iter__
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __nonzero__(self):
+        for items in self._chain:
+            for key in items:
+                if self.has_key(key):
+                    return True
+        return False
+
+    def copy(self):
+        return dict(self.iteritems())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
 class DelayedVariable(object):
 
     def __init__(self, value, error_reporter):
@@ -0,0 +1,224 @@
+import errno
+import os
+import select
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import unittest
+
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
+
+from robot.libraries import OperatingSystem
+from robot.libraries.OperatingSystem import (_create_path_watcher,
+                                             _InotifyWatcher, _PollingWatcher)
+
+
+class TestPollingWatcher(unittest.TestCase):
+
+    def test_wait_uses_interval_by_default(self):
+        watcher = _PollingWatcher()
+        watcher.interval = 0.05
+        assert_waits(watcher.wait, 0.05)
+
+    def test_wait_is_limited_by_timeout(self):
+        assert_waits(lambda: _PollingWatcher().wait(0.01), 0.01)
+
+    def test_close_does_nothing(self):
+        _PollingWatcher().close()
+
+
+class TestCreatePathWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_polling_when_inotify_is_not_available(self):
+        libc = _InotifyWatcher._libc
+        _InotifyWatcher._libc = False
+        try:
+            self._assert_polling(os.path.join(self.directory, 'file'))
+        finally:
+            _InotifyWatcher._libc = libc
+
+    def test_polling_when_parent_is_pattern(self):
+        self._assert_polling(os.path.join(self.directory, '*', 'file'))
+
+    def test_polling_when_parent_does_not_exist(self):
+        self._assert_polling(os.path.join(self.directory, 'nonex', 'file'))
+
+    def test_polling_when_there_is_no_name(self):
+        self._assert_polling(self.directory + os.sep)
+
+    def test_inotify_when_available(self):
+        watcher = _create_path_watcher(os.path.join(self.directory, '*'))
+        try:
+            expected = _InotifyWatcher if _InotifyWatcher.available() \
+                    else _PollingWatcher
+            assert_equals(type(watcher), expected)
+        finally:
+            watcher.close()
+
+    def _assert_polling(self, path):
+        watcher = _create_path_watcher(path)
+        try:
+            assert_equals(type(watcher), _PollingWatcher)
+        finally:
+            watcher.close()
+
+
+class TestInotifyWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.watchers = []
+
+    def tearDown(self):
+        for watcher in self.watchers:
+            watcher.close()
+        _InotifyWatcher.close_instance()
+        shutil.rmtree(self.directory)
+
+    def _watcher(self, name):
+        watcher = _InotifyWatcher(os.path.join(self.directory, name))
+        self.watchers.append(watcher)
+        return watcher
+
+    def _create_later(self, name, delay=0.05):
+        path = os.path.join(self.directory, name)
+        timer = threading.Timer(delay, lambda: open(path, 'w').close())
+        timer.start()
+        return timer
+
+    def test_wait_returns_when_matching_path_is_created(self):
+        watcher = self._watcher('f*.txt')
+        self._create_later('file.txt')
+        start = time.time()
+        watcher.wait(5)
+        assert_true(time.time() - start < 1)
+
+    def test_wait_returns_when_matching_path_is_removed(self):
+        open(os.path.join(self.directory, 'file.txt'), 'w').close()
+        watcher = self._watcher('file.txt')
+        timer = threading.Timer(0.05, os.remove,
+                                [os.path.join(self.directory, 'file.txt')])
+        timer.start()
+        start = time.time()
+        watcher.wait(5)
+        assert_true(time.time() - start < 1)
+
+    def test_other_paths_are_ignored(self):
+        watcher = self._watcher('file.txt')
+        self._create_later('other.txt', delay=0)
+        assert_waits(lambda: watcher.wait(0.2), 0.2)
+
+    def test_wait_is_limited_by_interval(self):
+        watcher = self._watcher('file.txt')
+        watcher.interval = 0.05
+        assert_waits(watcher.wait, 0.05)
+
+    def test_wait_is_retried_when_interrupted(self):
+        watcher = self._watcher('file.txt')
+        calls = []
+        def interrupted_select(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise select.error(errno.EINTR, 'Interrupted system call')
+            return original(*args)
+        original = OperatingSystem.select.select
+        OperatingSystem.select.select = interrupted_select
+        try:
+            assert_waits(lambda: watcher.wait(0.1), 0.1)
+        finally:
+            OperatingSystem.select.select = original
+        assert_true(len(calls) > 1)
+
+    def test_other_select_errors_are_raised(self):
+        watcher = self._watcher('file.txt')
+        def failing_select(*args):
+            raise select.error(errno.EBADF, 'Bad file descriptor')
+        original = OperatingSystem.select.select
+        OperatingSystem.select.select = failing_select
+        try:
+            assert_raises(select.error, watcher.wait, 0.1)
+        finally:
+            OperatingSystem.select.select = original
+
+    def test_watching_nonexisting_directory_fails(self):
+        assert_raises(OSError, _InotifyWatcher,
+                      os.path.join(self.directory, 'nonex', 'file'))
+
+    def test_instance_is_shared_within_thread(self):
+        first = self._watcher('first')
+        second = self._watcher('second')
+        assert_equals(first._fd, second._fd)
+
+    def test_close_instance(self):
+        fd = self._watcher('file')._fd
+        self.watchers.pop().close()
+        _InotifyWatcher.close_instance()
+        assert_raises(OSError, os.fstat, fd)
+        assert_true(self._watcher('file')._fd >= 0)
+
+    def test_instance_is_closed_when_thread_ends(self):
+        fds = []
+        def run():
+            watcher = _InotifyWatcher(os.path.join(self.directory, 'file'))
+            fds.append(watcher._fd)
+            watcher.close()
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        for _ in range(100):
+            try:
+                os.fstat(fds[0])
+            except OSError:
+                break
+            time.sleep(0.01)
+        else:
+            raise AssertionError('Inotify instance was not closed.')
+
+    def test_events(self):
+        watcher = self._watcher('f*.txt')
+        wd = watcher._wd
+        for events, expected in [([(wd, 'other.txt')], False),
+                                 ([(wd + 1, 'file.txt')], False),
+                                 ([(wd, 'other'), (wd, 'file.txt')], True),
+                                 ([(wd, '')], True),
+                                 ([(-1, '')], True)]:
+            assert_equals(self._has_matching_event(watcher, events), expected)
+
+    def _has_matching_event(self, watcher, events):
+        read, write = os.pipe()
+        fd = watcher._fd
+        try:
+            for wd, name in events:
+                name = name + '\0' * (-len(name) % 16)
+                os.write(write, struct.pack('iIII', wd, 0x100, 0, len(name))
+                                + name)
+            watcher._fd = read
+            return watcher._has_matching_event()
+        finally:
+            watcher._fd = fd
+            os.close(read)
+            os.close(write)
+
+
+if not _InotifyWatcher.available():
+    del TestInotifyWatcher
+
+
+def assert_waits(wait, expected):
+    start = time.time()
+    wait()
+    elapsed = time.time() - start
+    assert_true(expected - 0.01 <= elapsed < expected + 0.5,
+                'Waited %.3f seconds, expected %.3f.' % (elapsed, expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
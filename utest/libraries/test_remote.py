@@ -0,0 +1,286 @@
+import httplib
+import socket
+import unittest
+import xmlrpclib
+from StringIO import StringIO
+
+from robot.utils.asserts import (assert_equals, assert_false, assert_raises,
+                                 assert_true)
+
+from robot.libraries import Remote
+from robot.libraries.Remote import (ConnectionPool, KeepAliveTransport,
+                                    XmlRpcRemoteClient)
+
+
+class FakeConnection(object):
+
+    def __init__(self, host, fail_send=0, fail_response=False, status=200):
+        self.host = host
+        self.sock = None
+        self.peer = None
+        self.closed = False
+        self.requests = []
+        self.connects = 0
+        self.fail_send = fail_send
+        self.fail_response = fail_response
+        self.status = status
+        self._body = None
+
+    def connect(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        self.sock = socket.create_connection(server.getsockname())
+        self.peer = server.accept()[0]
+        server.close()
+        self.connects += 1
+
+    def close(self):
+        for sock in self.sock, self.peer:
+            if sock:
+                sock.close()
+        self.sock = self.peer = None
+        self.closed = True
+
+    def putrequest(self, method, handler, skip_accept_encoding=False):
+        if self.fail_send:
+            self.fail_send -= 1
+            raise socket.error(32, 'Broken pipe')
+        self._body = None
+
+    def putheader(self, name, value):
+        pass
+
+    def endheaders(self, body=None):
+        self._body = body
+
+    def send(self, body):
+        self._body = body
+
+    def getresponse(self, buffering=False):
+        self.requests.append(self._body)
+        if self.fail_response:
+            raise httplib.BadStatusLine('')
+        params, method = xmlrpclib.loads(self._body)
+        data = xmlrpclib.dumps(params, methodresponse=True)
+        return FakeResponse(self.status, data)
+
+
+class FakeResponse(StringIO):
+    reason = 'Reason'
+    msg = {}
+
+    def __init__(self, status, data):
+        StringIO.__init__(self, data)
+        self.status = status
+
+    def getheader(self, name, default=None):
+        return default
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ConnectionPool(max_idle=2)
+        self.key = (FakeConnection, 'host:8270')
+
+    def test_new_connection_is_created_when_none_is_idle(self):
+        first = self.pool.get(self.key)
+        second = self.pool.get(self.key)
+        assert_equals(first.host, 'host:8270')
+        assert_true(first is not second)
+
+    def test_released_connection_is_reused(self):
+        connection = self.pool.get(self.key)
+        self.pool.release(self.key, connection)
+        assert_true(self.pool.get(self.key) is connection)
+
+    def test_connections_are_grouped_by_key(self):
+        connection = self.pool.get(self.key)
+        self.pool.release(self.key, connection)
+        other = self.pool.get((FakeConnection, 'other:8270'))
+        assert_true(other is not connection)
+        assert_equals(other.host, 'other:8270')
+
+    def test_connections_exceeding_max_idle_are_closed(self):
+        connections = [self.pool.get(self.key) for _ in range(3)]
+        for connection in connections:
+            self.pool.release(self.key, connection)
+        assert_equals([c.closed for c in connections], [False, False, True])
+
+    def test_close(self):
+        connection = self.pool.get(self.key)
+        self.pool.release(self.key, connection)
+        self.pool.close()
+        assert_true(connection.closed)
+        assert_true(self.pool.get(self.key) is not connection)
+
+
+class TestKeepAliveTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = Remote.CONNECTIONS = ConnectionPool()
+        self.transport = KeepAliveTransport('http://host:8270')
+        self.transport._connection_class = FakeConnection
+
+    def tearDown(self):
+        self.pool.close()
+        Remote.CONNECTIONS = ConnectionPool()
+
+    def _request(self, method='run_keyword'):
+        body = xmlrpclib.dumps(('arg',), method)
+        return self.transport.request('host:8270', '/RPC2', body)
+
+    def _connection(self, **config):
+        connection = FakeConnection('host:8270', **config)
+        self.pool.release((FakeConnection, 'host:8270'), connection)
+        return connection
+
+    def test_request(self):
+        assert_equals(self._request(), ('arg',))
+
+    def test_connection_is_kept_open_and_reused(self):
+        connection = self._connection()
+        self._request()
+        self._request()
+        assert_equals(len(connection.requests), 2)
+        assert_equals(connection.connects, 1)
+        assert_false(connection.closed)
+
+    def test_connection_closed_by_server_is_reconnected_before_sending(self):
+        connection = self._connection()
+        self._request()
+        connection.peer.close()
+        self._request()
+        assert_equals(len(connection.requests), 2)
+        assert_equals(connection.connects, 2)
+
+    def test_send_failure_with_reused_connection_is_retried(self):
+        connection = self._connection()
+        self._request()
+        connection.fail_send = 1
+        assert_equals(self._request(), ('arg',))
+        assert_equals(len(connection.requests), 2)
+        assert_equals(connection.connects, 2)
+
+    def test_send_failure_with_new_connection_is_not_retried(self):
+        connection = self._connection(fail_send=1)
+        assert_raises(socket.error, self._request)
+        assert_equals(connection.requests, [])
+        assert_true(connection.closed)
+
+    def test_response_failure_is_not_retried(self):
+        connection = self._connection()
+        self._request()
+        connection.fail_response = True
+        assert_raises(httplib.BadStatusLine, self._request)
+        assert_equals(len(connection.requests), 2)
+        assert_equals(connection.connects, 1)
+        assert_true(connection.closed)
+
+    def test_failed_connection_is_not_reused(self):
+        connection = self._connection(fail_send=1)
+        assert_raises(socket.error, self._request)
+        self._request()
+        assert_equals(connection.requests, [])
+
+    def test_non_200_status(self):
+        connection = self._connection(status=500)
+        assert_raises(xmlrpclib.ProtocolError, self._request)
+        assert_true(connection.closed)
+
+    def test_python_26_and_older(self):
+        connection = self._connection()
+        sys = Remote.sys
+        Remote.sys = FakeSys((2, 6, 9, 'final', 0))
+        try:
+            assert_equals(self._request(), ('arg',))
+        finally:
+            Remote.sys = sys
+        assert_equals(len(connection.requests), 1)
+
+
+class FakeSys(object):
+
+    def __init__(self, version_info):
+        self.version_info = version_info
+
+
+class FakeServer(object):
+
+    def __init__(self, multicall=None):
+        self.calls = []
+        self.system = self
+        self._multicall = multicall
+
+    def get_keyword_names(self):
+        return ['kw']
+
+    def get_keyword_arguments(self, name):
+        self.calls.append(('get_keyword_arguments', name))
+        return ['arg']
+
+    def get_keyword_documentation(self, name):
+        self.calls.append(('get_keyword_documentation', name))
+        return 'Doc for %s.' % name
+
+    def multicall(self, calls):
+        self.calls.append('multicall')
+        if self._multicall is None:
+            raise xmlrpclib.Fault(1, 'No multicall')
+        return self._multicall(calls)
+
+
+class TestGetAllMetadata(unittest.TestCase):
+
+    def _client(self, multicall=None):
+        client = XmlRpcRemoteClient('http://host:8270')
+        client._server = self.server = FakeServer(multicall)
+        client.get_keyword_names()
+        return client
+
+    def test_metadata_is_got_with_one_multicall(self):
+        def multicall(calls):
+            return [[getattr(self.server, call['methodName'])(*call['params'])]
+                    for call in calls]
+        client = self._client(multicall)
+        assert_equals(client.get_keyword_arguments('kw'), ['arg'])
+        assert_equals(client.get_keyword_documentation('kw'), 'Doc for kw.')
+        assert_equals(client.get_keyword_documentation('__intro__'),
+                      'Doc for __intro__.')
+        assert_equals(self.server.calls[0], 'multicall')
+        assert_equals(len(self.server.calls), 7)
+
+    def test_faults_in_multicall_results(self):
+        def multicall(calls):
+            return [{'faultCode': 1, 'faultString': 'Error'} for _ in calls]
+        client = self._client(multicall)
+        assert_raises(TypeError, client.get_keyword_arguments, 'kw')
+        assert_raises(TypeError, client.get_keyword_documentation, 'kw')
+        assert_equals(self.server.calls, ['multicall'])
+
+    def test_metadata_is_got_one_by_one_without_multicall_support(self):
+        client = self._client()
+        assert_equals(client.get_keyword_arguments('kw'), ['arg'])
+        assert_equals(client.get_keyword_arguments('kw'), ['arg'])
+        assert_equals(client.get_keyword_documentation('kw'), 'Doc for kw.')
+        assert_equals(self.server.calls,
+                      ['multicall', ('get_keyword_arguments', 'kw'),
+                       ('get_keyword_documentation', 'kw')])
+
+    def test_metadata_is_got_one_by_one_if_multicall_returns_invalid_data(self):
+        for result in [], [['arg']], ['invalid'] * 6:
+            client = self._client(lambda calls: result)
+            assert_equals(client.get_keyword_arguments('kw'), ['arg'])
+            assert_equals(self.server.calls[-1],
+                          ('get_keyword_arguments', 'kw'))
+
+    def test_metadata_is_got_one_by_one_if_multicall_fails(self):
+        def multicall(calls):
+            raise socket.error(104, 'Connection reset by peer')
+        client = self._client(multicall)
+        assert_equals(client.get_keyword_arguments('kw'), ['arg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
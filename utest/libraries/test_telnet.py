@@ -0,0 +1,141 @@
+import os
+import re
+import time
+import unittest
+from telnetlib import IAC, DO, DONT, WILL, WONT, SB, SE, ECHO, TTYPE
+
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
+
+from robot.libraries.Telnet import TelnetConnection
+
+
+class StubSocket(object):
+    """Returns given chunks from `recv` one by one.
+
+    Selecting the socket succeeds while there are chunks left, or always
+    after the last chunk if the socket is closed.
+    """
+
+    def __init__(self, chunks, closed=False):
+        self._chunks = list(chunks)
+        self._closed = closed
+        self._read, self._write = os.pipe()
+        self._readable = False
+        self.sent = []
+        self._update()
+
+    def _update(self):
+        readable = bool(self._chunks) or self._closed
+        if readable and not self._readable:
+            os.write(self._write, 'x')
+        if self._readable and not readable:
+            os.read(self._read, 1)
+        self._readable = readable
+
+    def fileno(self):
+        return self._read
+
+    def recv(self, size):
+        chunk = self._chunks.pop(0) if self._chunks else ''
+        assert_true(len(chunk) <= size)
+        self._update()
+        return chunk
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+    def close(self):
+        os.close(self._read)
+        os.close(self._write)
+
+
+class TestReading(unittest.TestCase):
+
+    def tearDown(self):
+        self.connection.close()
+
+    def _connect(self, chunks, closed=False, timeout=0.5):
+        self.connection = TelnetConnection(timeout=timeout,
+                                           encoding='ISO-8859-1')
+        self.sock = self.connection.sock = StubSocket(chunks, closed)
+        return self.connection
+
+    def _read_until(self, chunks, expected, **config):
+        return self._connect(chunks, **config)._read_until(expected)
+
+    def _read_until_regexp(self, chunks, *expected, **config):
+        return self._connect(chunks, **config)._read_until_regexp(*expected)
+
+    def test_read_until(self):
+        assert_equals(self._read_until(['foo', ' b', 'ar', ' rest'], 'bar'),
+                      (True, 'foo bar'))
+        assert_equals(self.connection.read_very_eager(), ' rest')
+
+    def test_null_and_dc1_are_removed(self):
+        assert_equals(self._read_until(['a\0b\021c', '\0d\021'], 'cd'),
+                      (True, 'abcd'))
+
+    def test_commands(self):
+        output = self._read_until(['a' + IAC + WILL + ECHO + 'b' +
+                                   IAC + DO + TTYPE + 'c' + IAC + IAC + 'd'],
+                                  'd')
+        assert_equals(output, (True, u'abc\xffd'))
+        assert_equals(self.sock.sent, [IAC + DO + ECHO, IAC + WONT + TTYPE])
+
+    def test_commands_split_across_receives(self):
+        output = self._read_until(['a' + IAC, WILL, ECHO + 'b' + IAC,
+                                   IAC + 'c' + IAC, DONT + TTYPE, 'd'], 'd')
+        assert_equals(output, (True, u'ab\xffcd'))
+        assert_equals(self.sock.sent, [IAC + DO + ECHO, IAC + WONT + TTYPE])
+
+    def test_subnegotiation_split_across_receives(self):
+        connection = self._connect(['a' + IAC + SB + TTYPE, 'data\0\021',
+                                    IAC, SE + 'b', 'c'])
+        assert_equals(connection._read_until('bc'), (True, 'abc'))
+        assert_equals(connection.read_sb_data(), TTYPE + 'data')
+
+    def test_read_until_regexp(self):
+        assert_equals(self._read_until_regexp(['foo 1', '2 bar'], 'o \d+'),
+                      (True, 'foo 12'))
+
+    def test_read_until_regexp_earliest_match_wins(self):
+        assert_equals(self._read_until_regexp(['first second'],
+                                              'second', 'first', 'f\w+d'),
+                      (True, 'first'))
+
+    def test_read_until_regexp_earlier_regexp_wins_tie(self):
+        assert_equals(self._read_until_regexp(['first second'],
+                                              'f\w+t', 'first'),
+                      (True, 'first'))
+
+    def test_read_until_regexp_with_compiled_regexps(self):
+        assert_equals(self._read_until_regexp(['a1b2'], re.compile('\d'),
+                                              re.compile('[a-z]\d')),
+                      (True, 'a1'))
+
+    def test_timeout_with_partial_data(self):
+        start = time.time()
+        assert_equals(self._read_until(['par', 'tial'], 'prompt',
+                                       timeout=0.1),
+                      (False, 'partial'))
+        assert_true(0.09 < time.time() - start < 1)
+        assert_equals(self._read_until_regexp(['par', 'tial'], 'prompt',
+                                              timeout=0.1),
+                      (False, 'partial'))
+
+    def test_eof_with_data_in_cooked_queue(self):
+        connection = self._connect(['partial'], closed=True)
+        start = time.time()
+        assert_equals(connection._read_until('prompt'), (False, 'partial'))
+        assert_true(time.time() - start < 0.5)
+        assert_raises(EOFError, connection._read_until, 'prompt')
+
+    def test_eof_after_match_keeps_rest_of_data(self):
+        connection = self._connect(['foo bar'], closed=True)
+        assert_equals(connection._read_until('foo'), (True, 'foo'))
+        assert_equals(connection._read_until('prompt'), (False, ' bar'))
+        assert_raises(EOFError, connection._read_until, 'prompt')
+
+
+if __name__ == '__main__':
+    unittest.main()
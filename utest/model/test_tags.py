@@ -305,6 +305,59 @@ class TestTagPatterns(unittest.TestCase):
         patterns = TagPatterns([u'is\xe4', u'\xe4iti'])
         assert_equal(utils.seq2str(patterns), u"'is\xe4' and '\xe4iti'")
 
+    def test_exact_and_wildcard_patterns_together(self):
+        patterns = TagPatterns(['x', 'y?', 'z*', 'a.b', '[c]', 'd_e'])
+        assert_false(patterns.match(['xx', 'y', 'a-b', 'c', 'd']))
+        for tag in ['X', 'y1', 'Y_2', 'z', 'Z z z', 'A.B', '[c]', 'D E']:
+            assert_true(patterns.match(['foo', tag]), tag)
+
+    def test_special_characters_in_wildcard_patterns(self):
+        patterns = TagPatterns(['a.*', '(b)?', 'c|d*'])
+        assert_false(patterns.match(['ab', 'b', 'bb', 'c', 'd']))
+        assert_true(patterns.match(['a.']))
+        assert_true(patterns.match(['(B)1']))
+        assert_true(patterns.match(['C|D and more']))
+
+    def test_match_with_tags_object(self):
+        patterns = TagPatterns(['x*', 'yANDz'])
+        tags = Tags(['Y', 'z'])
+        assert_true(patterns.match(tags))
+        tags.remove('y')
+        assert_false(patterns.match(tags))
+        tags.add('X X')
+        assert_true(patterns.match(tags))
+
+
+class TestMultiTagPatterns(unittest.TestCase):
+
+    def test_match(self):
+        patterns = MultiTagPatterns(['x', 'x*', 'xANDy', 'xNOTy', 'zORq*'])
+        assert_equal(patterns.match([]), ())
+        assert_equal(patterns.match(['x']), (0, 1, 3))
+        assert_equal(patterns.match(['X', 'Y']), (0, 1, 2))
+        assert_equal(patterns.match(['xx', 'q']), (1, 4))
+        assert_equal(patterns.match(Tags(['z', 'other'])), (4,))
+
+    def test_results_are_same_regardless_irrelevant_tags(self):
+        patterns = MultiTagPatterns(['aNOTb', 'c*', 'dORe'])
+        for tags in [['a'], ['a', 'x'], ['a', 'y', 'z']]:
+            assert_equal(patterns.match(tags), (0,))
+        for tags in [['a', 'b'], ['a', 'b', 'x'], ['b', 'c1', 'y']]:
+            assert_equal(patterns.match(tags), () if 'c1' not in tags else (1,))
+
+    def test_cache_size_is_limited(self):
+        patterns = MultiTagPatterns(['a*', 'bNOTc'])
+        patterns._max_cache_size = 3
+        for index in range(10):
+            assert_equal(patterns.match(['a%d' % index, 'b']), (0, 1))
+            assert_true(len(patterns._match_cache) <= 3)
+            assert_true(len(patterns._relevant_cache) <= 3)
+
+    def test_patterns_can_be_tag_patterns(self):
+        patterns = MultiTagPatterns([TagPatterns(['a', 'b']), 'c'])
+        assert_equal(len(patterns), 2)
+        assert_equal(patterns.match(['b', 'c']), (0, 1))
+
 
 class AndOrPatternGenerator(object):
     tags = ['0', '1']
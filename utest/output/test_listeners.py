@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from robot.output.listeners import Listeners
@@ -116,6 +117,64 @@ class InvalidListenerOldStyle:
     log_file = close = lambda self, *args: 1/0
 
 
+class AsyncListener(object):
+    ROBOT_LISTENER_API_VERSION = 2
+    ROBOT_LISTENER_ASYNC = True
+
+    def __init__(self):
+        self.events = []
+        self.threads = set()
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+
+    def start_test(self, name, attrs):
+        self._record('start_test', name, attrs['tags'])
+
+    def end_test(self, name, attrs):
+        self._record('end_test', name, attrs['status'])
+        if name == 'fail':
+            raise AssertionError('Expected failure')
+
+    def log_message(self, msg):
+        self.unblocked.wait()
+        self._record('log_message', msg['message'])
+
+    def close(self):
+        self._record('close')
+
+    def _record(self, *event):
+        self.events.append(event)
+        self.threads.add(threading.currentThread().getName())
+
+
+class DroppingAsyncListener(AsyncListener):
+    ROBOT_LISTENER_ASYNC = 'drop'
+    ROBOT_LISTENER_QUEUE_SIZE = '1'
+
+
+class NotAsyncListener(AsyncListener):
+    ROBOT_LISTENER_ASYNC = 'False'
+
+
+class MessageMock(object):
+    timestamp = '20140101 12:00:00.000'
+    level = 'INFO'
+    html = False
+
+    def __init__(self, message):
+        self.message = message
+
+
+class _MessageCollector(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        if msg.level in ('WARN', 'ERROR'):
+            self.messages.append((msg.level, msg.message))
+
+
 class _BaseListenerTest:
     stat_message = ''
 
@@ -211,6 +270,87 @@ class TestInvalidOldStyleListener(unittest.TestCase):
             getattr(listenres, name)(*args)
 
 
+class TestAsyncListener(unittest.TestCase):
+
+    def _create(self, name='AsyncListener'):
+        listeners = Listeners([('test_listeners.' + name, [])])
+        return listeners, listeners._listeners[0].logger
+
+    def test_importing(self):
+        listeners, _ = self._create()
+        assert_true(listeners._listeners[0].is_async)
+        assert_equals(listeners._listeners[0].version, 2)
+        listeners.close()
+        listeners, _ = self._create('NotAsyncListener')
+        assert_false(listeners._listeners[0].is_async)
+
+    def test_events_are_delivered_in_order_in_background_thread(self):
+        listeners, listener = self._create()
+        test = TestMock()
+        listeners.start_test(test)
+        listeners.log_message(MessageMock('Hello'))
+        listeners.end_test(test)
+        listeners.close()
+        assert_equals(listener.events,
+                      [('start_test', 'testmock', ['foo', 'bar']),
+                       ('log_message', 'Hello'),
+                       ('end_test', 'testmock', 'FAIL'),
+                       ('close',)])
+        assert_equals(listener.threads, set(['RobotListenerThread']))
+
+    def test_attributes_are_not_affected_by_later_changes(self):
+        listeners, listener = self._create()
+        listener.unblocked.clear()
+        test = TestMock()
+        listeners.log_message(MessageMock('Blocking'))
+        listeners.start_test(test)
+        test.tags.append('new')
+        listener.unblocked.set()
+        listeners.close()
+        assert_equals(listener.events[1], ('start_test', 'testmock',
+                                           ['foo', 'bar']))
+
+    def test_failures_are_reported(self):
+        collector = _MessageCollector()
+        LOGGER.register_logger(collector)
+        try:
+            listeners, listener = self._create()
+            test = TestMock()
+            test.name = 'fail'
+            listeners.end_test(test)
+            listeners.close()
+        finally:
+            LOGGER.unregister_logger(collector)
+        assert_equals(listener.events[-1], ('close',))
+        assert_equals(collector.messages[-1],
+                      ('ERROR', "Calling listener method 'end_test' of "
+                                "listener 'test_listeners.AsyncListener' "
+                                "failed: Expected failure"))
+
+    def test_messages_are_dropped_when_queue_is_full(self):
+        collector = _MessageCollector()
+        LOGGER.register_logger(collector)
+        try:
+            listeners, listener = self._create('DroppingAsyncListener')
+            listener.unblocked.clear()
+            for index in range(5):
+                listeners.log_message(MessageMock('Message %d' % index))
+            dropped = listeners._listeners[0].dropped
+            listener.unblocked.set()
+            listeners.start_test(TestMock())
+            listeners.close()
+        finally:
+            LOGGER.unregister_logger(collector)
+        assert_true(dropped >= 3)
+        assert_equals(len(listener.events), 5 - dropped + 2)
+        assert_equals(listener.events[-2:], [('start_test', 'testmock',
+                                              ['foo', 'bar']), ('close',)])
+        assert_equals(collector.messages[-1:],
+                      [('WARN', "Listener 'test_listeners.DroppingAsyncListener'"
+                                " dropped %d messages because its queue was "
+                                "full." % dropped)])
+
+
 if utils.is_jython:
 
     class TestJavaListener(_BaseListenerTest, unittest.TestCase):
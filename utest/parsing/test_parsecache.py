@@ -0,0 +1,140 @@
+from __future__ import with_statement
+
+import os
+import shutil
+import tempfile
+import unittest
+from os.path import join
+
+from robot.output import LOGGER
+from robot.parsing.model import ResourceFile, TestCaseFile, TestDataDirectory
+from robot.parsing.parsecache import ParseCache
+from robot.utils.asserts import assert_equals, assert_true
+
+LOGGER.disable_automatic_console_logger()
+
+
+DATA = '''\
+*** Settings ***
+Documentation    Example
+Invalid          Setting
+
+*** Test Cases ***
+Example
+    Log    ${CURDIR}
+
+*** Keywords ***
+Keyword
+    No Operation
+'''
+
+
+class _MockLogger(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.message, msg.level))
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.cachedir = join(self.tempdir, 'cache')
+        self.cache = ParseCache(self.cachedir)
+        self.source = join(self.tempdir, 'example.txt')
+        self._write(DATA)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_disabled_by_default(self):
+        cache = ParseCache()
+        orig = os.environ.pop('ROBOT_PARSE_CACHE', None)
+        try:
+            assert_equals(cache.directory, None)
+            os.environ['ROBOT_PARSE_CACHE'] = 'None'
+            assert_equals(cache.directory, None)
+            os.environ['ROBOT_PARSE_CACHE'] = self.cachedir
+            assert_equals(cache.directory, self.cachedir)
+        finally:
+            os.environ.pop('ROBOT_PARSE_CACHE', None)
+            if orig is not None:
+                os.environ['ROBOT_PARSE_CACHE'] = orig
+
+    def test_cached_file_is_used(self):
+        original = self._populate()
+        assert_equals(len(os.listdir(self.cachedir)), 1)
+        cached = self._populate(fail=True)
+        self._verify(cached, original)
+
+    def test_parent_is_preserved(self):
+        self._populate()
+        parent = TestDataDirectory(source=self.tempdir)
+        cached = self._populate(parent, fail=True)
+        assert_true(cached.parent is parent)
+        assert_true(cached.testcase_table.parent is cached)
+        assert_true(cached.testcase_table.tests[0].parent.parent is cached)
+
+    def test_errors_are_reported_again(self):
+        logger = _MockLogger()
+        LOGGER.disable_message_cache()
+        LOGGER.register_logger(logger)
+        try:
+            self._populate()
+            self._populate(fail=True)
+        finally:
+            LOGGER.unregister_logger(logger)
+        error = ("Error in file '%s': Non-existing setting 'Invalid'."
+                 % self.source, 'ERROR')
+        assert_equals([m for m in logger.messages if m[1] == 'ERROR'],
+                      [error, error])
+
+    def test_cache_is_invalidated_when_file_changes(self):
+        self._populate()
+        self._write(DATA.replace('Example', 'Changed'))
+        changed = self._populate()
+        assert_equals(changed.testcase_table.tests[0].name, 'Changed')
+
+    def test_different_types_are_cached_separately(self):
+        self._write(DATA.split('*** Test Cases ***')[0])
+        self._populate(datafile_type=ResourceFile)
+        assert_equals(len(os.listdir(self.cachedir)), 1)
+        self._populate(datafile_type=ResourceFile, fail=True)
+        assert_equals(len(os.listdir(self.cachedir)), 1)
+
+    def _write(self, content):
+        with open(self.source, 'w') as source:
+            source.write(content)
+        stat = os.stat(self.source)
+        # Make sure modification time changes even on coarse file systems.
+        os.utime(self.source, (stat.st_atime, stat.st_mtime + 1))
+
+    def _populate(self, parent=None, fail=False, datafile_type=TestCaseFile):
+        if datafile_type is TestCaseFile:
+            datafile = TestCaseFile(parent, self.source)
+        else:
+            datafile = datafile_type(self.source)
+        populate = self._fail if fail else datafile._populate
+        self.cache.populate(datafile, populate)
+        return datafile
+
+    def _fail(self):
+        raise AssertionError('Cache should have been used')
+
+    def _verify(self, cached, original):
+        assert_equals(cached.source, original.source)
+        assert_equals(cached.setting_table.doc.value,
+                      original.setting_table.doc.value)
+        assert_equals([t.name for t in cached.testcase_table],
+                      [t.name for t in original.testcase_table])
+        assert_equals([s.as_list() for s in cached.testcase_table.tests[0]],
+                      [s.as_list() for s in original.testcase_table.tests[0]])
+        assert_equals([k.name for k in cached.keyword_table],
+                      [k.name for k in original.keyword_table])
+
+
+if __name__ == '__main__':
+    unittest.main()
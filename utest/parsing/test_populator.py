@@ -1,7 +1,10 @@
+import os
+import tempfile
 import unittest
 from StringIO import StringIO
 
-from robot.parsing.populators import FromFilePopulator, DataRow, FromDirectoryPopulator
+from robot.parsing.populators import (FromFilePopulator, DataRow,
+                                      FromDirectoryPopulator, FilePrefetcher)
 from robot.parsing.model import TestCaseFile
 from robot.utils.asserts import assert_equals, assert_true, assert_false
 
@@ -33,6 +36,46 @@ class FromDirectoryPopulatorTest(unittest.TestCase):
             assert_equals(list(create_included_suites(inp)), exp)
 
 
+class FilePrefetcherTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.write(fd, 'content')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_disabled_by_default(self):
+        prefetcher = FilePrefetcher()
+        if 'ROBOT_PARSING_THREADS' not in os.environ:
+            assert_equals(prefetcher.threads, 1)
+        prefetcher = FilePrefetcher(threads=1)
+        prefetcher.prefetch([self.path])
+        assert_equals(prefetcher.open(self.path), None)
+
+    def test_prefetch(self):
+        prefetcher = FilePrefetcher(threads=2)
+        prefetcher.prefetch([self.path])
+        source = prefetcher.open(self.path)
+        assert_equals(source.read(), 'content')
+        assert_equals(source.name, self.path)
+        assert_equals(prefetcher.open(self.path), None)
+
+    def test_non_existing_and_directories_are_not_prefetched(self):
+        prefetcher = FilePrefetcher(threads=2)
+        paths = [self.path + 'xxx', os.path.dirname(self.path)]
+        prefetcher.prefetch(paths)
+        for path in paths:
+            assert_equals(prefetcher.open(path), None)
+
+    def test_discard(self):
+        prefetcher = FilePrefetcher(threads=2)
+        prefetcher.prefetch([self.path])
+        prefetcher.discard(self.path)
+        assert_equals(prefetcher.open(self.path), None)
+
+
 class _PopulatorTest(unittest.TestCase):
 
     def setUp(self):
@@ -3,6 +3,8 @@ import unittest
 from robot.output.loggerhelper import LEVELS
 
 from robot.reporting.jsmodelbuilders import JsBuildingContext
+from robot.result.message import Message
+from robot.result.testcase import TestCase
 from robot.utils.asserts import assert_equals
 
 
@@ -78,5 +80,26 @@ class TestMinLogLevel(unittest.TestCase):
             self._context.message_level(level)
 
 
+class TestMerge(unittest.TestCase):
+
+    def test_merge(self):
+        context = JsBuildingContext()
+        context.string('Foo')
+        context.message_level('INFO')
+        other = JsBuildingContext()
+        other.string('Bar')
+        other.message_level('DEBUG')
+        msg = Message('Linked', 'WARN', timestamp='20111204 22:04:03.210',
+                      parent=TestCase().keywords.create())
+        other.create_link_target(msg)
+        indices, split_offset = context.merge(other)
+        assert_equals(split_offset, 0)
+        assert_equals(context.min_level, 'DEBUG')
+        assert_equals(context.strings, ('*', '*Foo', '*Bar', '*t1-k1'))
+        assert_equals(context.link(msg), 3)
+        assert_equals(context.message_links.keys(),
+                      other.message_links.keys())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from os.path import abspath, dirname, join
+
+from robot.errors import DataError
+from robot.reporting.jsmodelbuilders import JsModelBuilder
+from robot.reporting.parallel import (ForkedWriter, ParallelJsModelBuilder,
+                                      can_use_processes)
+from robot.result import ExecutionResult
+from robot.utils.asserts import assert_equals, assert_raises
+
+
+CURDIR = dirname(abspath(__file__))
+GOLDEN = join(CURDIR, '..', 'result', 'golden.xml')
+GOLDEN_SUITE = join(CURDIR, '..', 'resources', 'golden_suite', 'output.xml')
+TEARDOWN_FAILED = join(CURDIR, '..', 'result', 'suite_teardown_failed.xml')
+
+
+class TestParallelJsModelBuilder(unittest.TestCase):
+
+    def test_same_model_as_normally(self):
+        self._verify(GOLDEN_SUITE)
+        self._verify(GOLDEN, GOLDEN_SUITE, TEARDOWN_FAILED)
+
+    def test_split_log(self):
+        self._verify(GOLDEN_SUITE, split_log=True)
+        self._verify(GOLDEN, GOLDEN_SUITE, TEARDOWN_FAILED, split_log=True)
+
+    def test_less_than_two_child_suites(self):
+        self._verify(GOLDEN)
+
+    def _verify(self, *paths, **config):
+        expected = JsModelBuilder(**config).build_from(ExecutionResult(*paths))
+        actual = ParallelJsModelBuilder(processes=2, **config)\
+            .build_from(ExecutionResult(*paths))
+        assert_equals(actual.suite, expected.suite)
+        assert_equals(actual.strings, expected.strings)
+        assert_equals(actual.split_results, expected.split_results)
+        assert_equals(actual.min_level, expected.min_level)
+        assert_equals(actual.data['errors'], expected.data['errors'])
+        assert_equals(actual.data['stats'], expected.data['stats'])
+        assert_equals(actual.data['baseMillis'], expected.data['baseMillis'])
+
+
+class TestForkedWriter(unittest.TestCase):
+
+    def test_errors_are_reraised(self):
+        def writer(path):
+            raise DataError('Writing %s failed.' % path)
+        forked = ForkedWriter(writer)
+        forked.start('out.xml')
+        assert_raises(DataError, forked.write, 'out.xml')
+
+
+if not can_use_processes(2):
+    del TestParallelJsModelBuilder, TestForkedWriter
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -134,6 +134,8 @@ class StubSettings(object):
     suite_config = {}
     statistics_config = {}
     xunit_skip_noncritical = False
+    streaming = False
+    processes = 1
 
     def __init__(self, **settings):
         self.__dict__.update(settings)
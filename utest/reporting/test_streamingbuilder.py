@@ -0,0 +1,65 @@
+import unittest
+from os.path import abspath, dirname, join
+
+from robot.reporting.jsmodelbuilders import JsModelBuilder
+from robot.reporting.streamingbuilder import StreamingJsModelBuilder
+from robot.result import ExecutionResult
+from robot.utils.asserts import assert_equals
+
+
+CURDIR = dirname(abspath(__file__))
+GOLDEN = join(CURDIR, '..', 'result', 'golden.xml')
+GOLDEN_SUITE = join(CURDIR, '..', 'resources', 'golden_suite', 'output.xml')
+TEARDOWN_FAILED = join(CURDIR, '..', 'result', 'suite_teardown_failed.xml')
+
+
+class TestStreamingJsModelBuilder(unittest.TestCase):
+
+    def test_same_model_as_normally(self):
+        for path in GOLDEN, GOLDEN_SUITE, TEARDOWN_FAILED:
+            self._verify(path)
+
+    def test_split_log(self):
+        for path in GOLDEN, GOLDEN_SUITE, TEARDOWN_FAILED:
+            self._verify(path, split_log=True)
+
+    def test_remove_keywords_and_filter_messages(self):
+        self._verify(GOLDEN_SUITE, remove_keywords=['FOR', 'WUKS'],
+                     log_level='INFO')
+        self._verify(GOLDEN_SUITE, remove_keywords=['ALL'])
+
+    def test_configure(self):
+        self._verify(GOLDEN_SUITE, suite_config={'exclude_tags': 't1',
+                                                 'name': 'New'})
+
+    def test_returned_result_contains_tests_without_keyword_content(self):
+        result, _ = StreamingJsModelBuilder().build(GOLDEN)
+        assert_equals(result.suite.test_count, 1)
+        test = result.suite.tests[0]
+        assert_equals(len(test.keywords), 2)
+        assert_equals(list(test.keywords[0].keywords), [])
+        assert_equals(list(test.keywords[0].messages), [])
+
+    def _verify(self, path, split_log=False, remove_keywords=(),
+                log_level=None, suite_config=None):
+        expected = ExecutionResult(path)
+        expected.configure(suite_config=dict(suite_config or {},
+                                             remove_keywords=remove_keywords,
+                                             log_level=log_level))
+        expected = JsModelBuilder(split_log=split_log).build_from(expected)
+        builder = StreamingJsModelBuilder(split_log=split_log,
+                                          remove_keywords=remove_keywords,
+                                          log_level=log_level)
+        configure = lambda result: result.configure(suite_config=suite_config)
+        _, actual = builder.build(path, configure)
+        assert_equals(actual.suite, expected.suite)
+        assert_equals(actual.strings, expected.strings)
+        assert_equals(actual.split_results, expected.split_results)
+        assert_equals(actual.min_level, expected.min_level)
+        assert_equals(actual.data['errors'], expected.data['errors'])
+        assert_equals(actual.data['stats'], expected.data['stats'])
+        assert_equals(actual.data['baseMillis'], expected.data['baseMillis'])
+
+
+if __name__ == '__main__':
+    unittest.main()
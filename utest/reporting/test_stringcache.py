@@ -5,6 +5,7 @@ import unittest
 import sys
 
 from robot.reporting.stringcache import StringCache, StringIndex
+from robot.utils.compress import compress_text
 from robot.utils.asserts import assert_equals, assert_true, assert_false
 
 
@@ -21,7 +22,7 @@ class TestStringCache(unittest.TestCase):
         assert_equals(('*', expected), self.cache.dump())
 
     def _compress(self, text):
-        return self.cache._encode(text)
+        return StringCache()._encode(text)
 
     def test_short_test_is_not_compressed(self):
         self._verify_text('short', '*short')
@@ -54,6 +55,30 @@ class TestStringCache(unittest.TestCase):
         for i1, i2 in zip(indices1, indices2):
             assert_true(i1 is i2, 'not same: %s and %s' % (i1, i2))
 
+    def test_texts_are_compressed_once_in_batch_when_dumping(self):
+        batches = []
+        def compressor(texts):
+            batches.append(texts)
+            return [compress_text(t) for t in texts]
+        cache = StringCache(compressor)
+        strings = ['long'*100, 'short', 'long'*100, 'other'*100]
+        indices = [cache.add(s) for s in strings]
+        assert_equals(batches, [])
+        dumped = cache.dump()
+        assert_equals(batches, [['long'*100, 'other'*100]])
+        assert_equals([dumped[i] for i in indices],
+                      [self._compress(s) for s in strings])
+
+    def test_merge(self):
+        other = StringCache()
+        strings = ['', 'short', 'long'*1000, 'new']
+        other_indices = [other.add(s) for s in strings]
+        self.cache.add('new')
+        indices = self.cache.merge(other)
+        assert_equals(indices, [0, 2, 3, 1])
+        assert_equals([self.cache.dump()[indices[i]] for i in other_indices],
+                      [self._compress(s) if s else '*' for s in strings])
+
 
 class TestStringIndex(unittest.TestCase):
 
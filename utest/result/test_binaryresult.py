@@ -0,0 +1,178 @@
+from __future__ import with_statement
+
+import os
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.result import binaryformat as fmt
+from robot.result.binaryformat import is_binary_output
+from robot.result.executionresult import Result
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
+
+
+CURDIR = dirname(abspath(__file__))
+GOLDEN = join(CURDIR, 'golden.xml')
+GOLDEN_SUITE = join(CURDIR, '..', 'resources', 'golden_suite', 'output.xml')
+TEARDOWN_FAILED = join(CURDIR, 'suite_teardown_failed.xml')
+
+
+class TestBinaryResult(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mktemp(suffix='.rbin')
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_is_binary_output(self):
+        assert_true(is_binary_output(self.path))
+        assert_true(not is_binary_output(GOLDEN))
+        ExecutionResult(GOLDEN).save(self.path)
+        renamed = self.path + '.out'
+        os.rename(self.path, renamed)
+        try:
+            assert_true(is_binary_output(renamed))
+        finally:
+            os.remove(renamed)
+
+    def test_roundtrip(self):
+        for path in GOLDEN, GOLDEN_SUITE, TEARDOWN_FAILED:
+            ExecutionResult(path).save(self.path)
+            self._verify(ExecutionResult(path), ExecutionResult(self.path))
+
+    def test_without_keywords(self):
+        ExecutionResult(GOLDEN).save(self.path)
+        result = ExecutionResult(self.path, include_keywords=False)
+        self._verify(ExecutionResult(GOLDEN, include_keywords=False), result)
+        assert_equals(list(result.suite.tests[0].keywords), [])
+
+    def test_flattened_keywords(self):
+        ExecutionResult(GOLDEN_SUITE).save(self.path)
+        for flattened in ['NAME:*'], ['FOR']:
+            self._verify(ExecutionResult(GOLDEN_SUITE,
+                                         flattened_keywords=flattened),
+                         ExecutionResult(self.path,
+                                         flattened_keywords=flattened))
+
+    def test_generator(self):
+        ExecutionResult(GOLDEN).save(self.path)
+        assert_equals(ExecutionResult(self.path).generated_by_robot, False)
+
+    def test_timestamps_are_preserved_as_is(self):
+        result = Result()
+        result.suite.name = 'Suite'
+        test = result.suite.tests.create(name='Test')
+        test.starttime = '20140330 03:30:00.000'
+        test.endtime = '20140330 04:10:00.000'
+        test.keywords.create(name='Keyword').messages.create(
+            'Message', timestamp='2014-03-30 03:30')
+        result.save(self.path)
+        test = ExecutionResult(self.path).suite.tests[0]
+        assert_equals(test.starttime, '20140330 03:30:00.000')
+        assert_equals(test.endtime, '20140330 04:10:00.000')
+        assert_equals(test.keywords[0].starttime, None)
+        assert_equals(test.keywords[0].messages[0].timestamp,
+                      '2014-03-30 03:30')
+
+    def test_all_keyword_attributes_are_set(self):
+        ExecutionResult(GOLDEN).save(self.path)
+        kw = ExecutionResult(self.path).suite.tests[0].keywords[0]
+        for cls in type(kw).__mro__:
+            for name in getattr(cls, '__slots__', []):
+                getattr(kw, name)
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as output:
+            output.write('RBIN\x00invalid')
+        assert_raises(DataError, ExecutionResult, self.path)
+
+    def test_unsupported_version(self):
+        self._save_and_modify(len(fmt.MAGIC), '\x01\x00')
+        self._verify_error('Unsupported binary output version 1.')
+
+    def test_different_record_layout(self):
+        self._save_and_modify(-1, None, fmt.describe_records(),
+                              fmt.describe_records().replace('=II ', '=IH '))
+        self._verify_error('Invalid binary output header.')
+
+    def test_corrupted_data(self):
+        self._save_and_modify(-100, 'XX')
+        self._verify_error('Checksum mismatch.')
+
+    def test_truncated_file(self):
+        ExecutionResult(GOLDEN).save(self.path)
+        with open(self.path, 'rb') as source:
+            data = source.read()
+        with open(self.path, 'wb') as output:
+            output.write(data[:-10])
+        self._verify_error('File is incomplete.')
+
+    def _save_and_modify(self, index, replacement, old=None, new=None):
+        ExecutionResult(GOLDEN).save(self.path)
+        with open(self.path, 'rb') as source:
+            data = source.read()
+        if old:
+            data = data.replace(old, new)
+        else:
+            data = data[:index] + replacement + data[index+len(replacement):]
+        with open(self.path, 'wb') as output:
+            output.write(data)
+
+    def _verify_error(self, message):
+        try:
+            ExecutionResult(self.path)
+        except DataError, err:
+            assert_equals(unicode(err), "Reading binary source '%s' failed: %s"
+                                        % (self.path, message))
+        else:
+            raise AssertionError('DataError not raised')
+
+    def _verify(self, expected, actual):
+        self._verify_suite(expected.suite, actual.suite)
+        assert_equals(len(actual.errors), len(expected.errors))
+        for exp, act in zip(expected.errors, actual.errors):
+            self._verify_message(exp, act)
+
+    def _verify_suite(self, expected, actual):
+        self._verify_attrs(expected, actual, 'name', 'source', 'doc',
+                           'status', 'message', 'starttime', 'endtime')
+        assert_equals(actual.metadata.items(), expected.metadata.items())
+        self._verify_keywords(expected, actual)
+        assert_equals(len(actual.tests), len(expected.tests))
+        for exp, act in zip(expected.tests, actual.tests):
+            self._verify_attrs(exp, act, 'name', 'doc', 'status',
+                               'message', 'starttime', 'endtime')
+            assert_equals(list(act.tags), list(exp.tags))
+            assert_equals(act.timeout or None, exp.timeout or None)
+            self._verify_keywords(exp, act)
+        assert_equals(len(actual.suites), len(expected.suites))
+        for exp, act in zip(expected.suites, actual.suites):
+            self._verify_suite(exp, act)
+
+    def _verify_keywords(self, expected, actual):
+        assert_equals(len(actual.keywords), len(expected.keywords))
+        for exp, act in zip(expected.keywords, actual.keywords):
+            self._verify_attrs(exp, act, 'name', 'type', 'doc', 'args',
+                               'status', 'message', 'starttime', 'endtime')
+            assert_equals(act.timeout or None, exp.timeout or None)
+            assert_equals(len(act.messages), len(exp.messages))
+            for exp_msg, act_msg in zip(exp.messages, act.messages):
+                self._verify_message(exp_msg, act_msg)
+            self._verify_keywords(exp, act)
+
+    def _verify_message(self, expected, actual):
+        self._verify_attrs(expected, actual, 'message', 'level', 'html',
+                           'timestamp')
+
+    def _verify_attrs(self, expected, actual, *attrs):
+        for attr in attrs:
+            assert_equals(getattr(actual, attr), getattr(expected, attr),
+                          attr)
+
+
+if __name__ == '__main__':
+    unittest.main()
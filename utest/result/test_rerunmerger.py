@@ -0,0 +1,125 @@
+import unittest
+
+from robot.output import LOGGER
+from robot.result import Result, TestSuite
+from robot.result.rerunmerger import ReRunMerger
+from robot.utils.asserts import assert_equal, assert_true
+
+LOGGER.disable_automatic_console_logger()
+
+
+class _MockLogger(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append(msg.message)
+
+
+class TestReRunMerger(unittest.TestCase):
+
+    def setUp(self):
+        self.original = self._create_result(['T1', 'T2', 'T3'], 'FAIL')
+
+    def _create_result(self, tests, status, sub_tests=()):
+        suite = TestSuite(name='Root')
+        for name in tests:
+            suite.tests.create(name=name, status=status, message=status)
+        if sub_tests:
+            sub = suite.suites.create(name='Sub')
+            for name in sub_tests:
+                sub.tests.create(name=name, status=status, message=status)
+        return Result(root_suite=suite)
+
+    def test_tests_are_replaced(self):
+        ReRunMerger(self.original).merge(self._create_result(['T2'], 'PASS'))
+        tests = self.original.suite.tests
+        assert_equal([t.name for t in tests], ['T1', 'T2', 'T3'])
+        assert_equal([t.status for t in tests], ['FAIL', 'PASS', 'FAIL'])
+        assert_true(tests[1].parent is self.original.suite)
+        assert_equal(tests[1].message.splitlines()[-2:],
+                     ['Old status:  FAIL', 'Old message:  FAIL'])
+
+    def test_tests_in_child_suites_are_replaced(self):
+        self.original.suite.suites.create(name='Sub').tests.create(name='S1')
+        self.original.suite.suites.create(name='Sub2').tests.create(name='S1')
+        ReRunMerger(self.original).merge(self._create_result([], 'PASS',
+                                                             ['S1']))
+        sub, sub2 = self.original.suite.suites
+        assert_equal(sub.tests[0].status, 'PASS')
+        assert_equal(sub2.tests[0].status, 'FAIL')
+
+    def test_merge_multiple_results(self):
+        first = self._create_result(['T1', 'T2'], 'PASS')
+        second = self._create_result(['T2'], 'FAIL')
+        ReRunMerger(self.original).merge([first, second])
+        t1, t2, t3 = self.original.suite.tests
+        assert_equal([t1.status, t2.status, t3.status],
+                     ['PASS', 'FAIL', 'FAIL'])
+        assert_true(t2 is second.suite.tests[0])
+        self._verify_merged_twice(t2)
+
+    def test_results_are_consumed_one_by_one(self):
+        merged = []
+        def results():
+            for tests, status in [(['T1', 'T2'], 'PASS'), (['T2'], 'FAIL')]:
+                if merged:
+                    # Previous result is merged and not referenced anymore.
+                    assert_true(merged[-1].parent is self.original.suite)
+                result = self._create_result(tests, status)
+                merged.append(result.suite.tests[-1])
+                yield result
+        ReRunMerger(self.original).merge(results())
+        assert_equal([t.status for t in self.original.suite.tests],
+                     ['PASS', 'FAIL', 'FAIL'])
+
+    def test_merging_one_by_one_gives_same_result(self):
+        merger = ReRunMerger(self.original)
+        merger.merge(self._create_result(['T1', 'T2'], 'PASS'))
+        merger.merge(self._create_result(['T2'], 'FAIL'))
+        assert_equal([t.status for t in self.original.suite.tests],
+                     ['PASS', 'FAIL', 'FAIL'])
+        self._verify_merged_twice(self.original.suite.tests[1])
+
+    def _verify_merged_twice(self, test):
+        lines = test.message.splitlines()
+        assert_equal(lines[2:8], ['New status:  FAIL',
+                                  'New message:  FAIL',
+                                  '-  -  -',
+                                  'Old status:  PASS',
+                                  'Old message:  Test has been re-run and '
+                                  'results replaced.',
+                                  '-  -  -'])
+        assert_equal(lines[-2:], ['Old status:  FAIL', 'Old message:  FAIL'])
+
+    def test_first_test_with_same_name_is_replaced(self):
+        self.original.suite.tests.create(name='T1', status='FAIL')
+        ReRunMerger(self.original).merge(self._create_result(['T1'], 'PASS'))
+        assert_equal([t.status for t in self.original.suite.tests],
+                     ['PASS', 'FAIL', 'FAIL', 'FAIL'])
+
+    def test_non_matching_suites_and_tests_are_ignored(self):
+        logger = _MockLogger()
+        LOGGER.register_logger(logger)
+        try:
+            merged = self._create_result(['T1', 'Nonex'], 'PASS')
+            merged.suite.suites.create(name='Nonex').tests.create(name='T1')
+            ReRunMerger(self.original).merge(merged)
+            other = ReRunMerger(self.original)
+            other.merge(Result(root_suite=TestSuite(name='Other')))
+        finally:
+            LOGGER.unregister_logger(logger)
+        assert_equal([t.status for t in self.original.suite.tests],
+                     ['PASS', 'FAIL', 'FAIL'])
+        assert_equal(logger.messages,
+                     ["Merged suite 'Root.Nonex' is ignored because it is not "
+                      "found from original result.",
+                      "Merged test 'Root.Nonex' is ignored because it is not "
+                      "found from original result.",
+                      "Merged suite 'Other' is ignored because it is not "
+                      "found from original result."])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@ import unittest
 import os
 from os.path import abspath, join
 
-from robot.running.importer import ImportCache
+from robot.running.importer import ImportCache, Importer
+from robot.parsing.model import ResourceFile
 from robot.errors import FrameworkError
 from robot.utils.asserts import assert_equals, assert_true, assert_raises
 from robot.utils import normpath
@@ -69,5 +70,25 @@ class TestImportCache(unittest.TestCase):
         assert_equals(cache._keys[0], path)
 
 
+class TestImportResourceKeywords(unittest.TestCase):
+
+    def test_keywords_are_shared(self):
+        importer = Importer()
+        resource = ResourceFile(source='/path/to/resource.txt')
+        resource.keyword_table.add('Keyword')
+        first = importer.import_resource_keywords(resource)
+        second = importer.import_resource_keywords(resource)
+        assert_true(first is second)
+        assert_equals(first.name, 'resource')
+        assert_equals(first.handlers.keys(), ['Keyword'])
+
+    def test_reset(self):
+        importer = Importer()
+        resource = ResourceFile(source='/path/to/resource.txt')
+        first = importer.import_resource_keywords(resource)
+        importer.reset()
+        assert_true(importer.import_resource_keywords(resource) is not first)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,9 +3,12 @@ import os
 import pkgutil
 
 from robot.running import namespace
-from robot.running.namespace import _VariableScopes, GLOBAL_VARIABLES
+from robot.running.model import TestSuite
+from robot.running.namespace import (_VariableScopes, GLOBAL_VARIABLES,
+                                     KeywordCache, Namespace)
 from robot import libraries
-from robot.utils.asserts import assert_equals
+from robot.variables import Variables
+from robot.utils.asserts import assert_equals, assert_true
 
 
 class TestNamespace(unittest.TestCase):
@@ -16,6 +19,18 @@ class TestNamespace(unittest.TestCase):
                     if name[0].isupper() and not name.startswith('Deprecated'))
         assert_equals(set(exp_libs), namespace.STDLIB_NAMES)
 
+    def test_set_library_search_order_clears_keyword_cache(self):
+        suite = TestSuite(name='Suite')
+        ns = Namespace(suite, Variables(), None, suite.user_keywords,
+                       suite.imports)
+        ns.keyword_cache.set('Keyword', 'handler')
+        assert_equals(ns.set_library_search_order(['Lib']), [])
+        assert_equals(ns.library_search_order, ['Lib'])
+        assert_equals(ns.keyword_cache.get('Keyword'), None)
+        ns.keyword_cache.set('Keyword', 'handler')
+        ns.library_search_order = ['Other']
+        assert_equals(ns.keyword_cache.get('Keyword'), None)
+
 
 class TestVariableScopes(unittest.TestCase):
 
@@ -24,3 +39,57 @@ class TestVariableScopes(unittest.TestCase):
         assert_equals(len(_VariableScopes(None, None)), 0)
         assert_equals(len(_VariableScopes(variables, None)), 2 + len(GLOBAL_VARIABLES))
         assert_equals(len(_VariableScopes(None, _VariableScopes(variables, None))), 0)
+
+    def test_test_and_keyword_scopes(self):
+        scopes = _VariableScopes(Variables(), None)
+        scopes['${suite}'] = 'suite'
+        scopes.start_test()
+        scopes['${test}'] = 'test'
+        scopes.start_uk()
+        scopes['${kw}'] = 'kw'
+        scopes.set_test('${suite}', 'set in kw')
+        assert_equals(scopes['${test}'], 'test')
+        scopes.end_uk()
+        assert_equals(scopes['${suite}'], 'set in kw')
+        assert_true(not scopes.contains('${kw}'))
+        scopes.end_test()
+        assert_equals(scopes['${suite}'], 'suite')
+        assert_true(not scopes.contains('${test}'))
+
+
+class TestKeywordCache(unittest.TestCase):
+
+    def test_get_and_set(self):
+        cache = KeywordCache()
+        assert_equals(cache.get('Keyword'), None)
+        cache.set('Keyword', 'handler')
+        assert_equals(cache.get('Keyword'), 'handler')
+        assert_equals(cache.get('keyword'), None)
+        assert_equals((cache.hits, cache.misses), (1, 2))
+        assert_equals(cache.hit_rate, 1/3.0)
+
+    def test_clear(self):
+        cache = KeywordCache()
+        cache.set('Keyword', 'handler')
+        cache.clear()
+        assert_equals(cache.get('Keyword'), None)
+        assert_equals(len(cache), 0)
+
+    def test_disable_current_lookup(self):
+        cache = KeywordCache()
+        cache.start_lookup()
+        cache.disable_current_lookup()
+        cache.set('Keyword', 'handler')
+        assert_equals(len(cache), 0)
+        cache.start_lookup()
+        cache.set('Keyword', 'handler')
+        assert_equals(len(cache), 1)
+
+    def test_unicode(self):
+        cache = KeywordCache()
+        assert_equals(unicode(cache), '0 hits, 0 misses, hit rate 0.0%')
+        cache.set('Keyword', 'handler')
+        for _ in range(3):
+            cache.get('Keyword')
+        cache.get('Other')
+        assert_equals(unicode(cache), '3 hits, 1 misses, hit rate 75.0%')
@@ -0,0 +1,65 @@
+import sys
+import unittest
+
+from robot.utils.asserts import assert_equals, assert_raises, assert_true
+
+from robot.running.outputcapture import OutputCapturer
+
+
+class TestOutputCapturer(unittest.TestCase):
+
+    def setUp(self):
+        self.stdout = sys.stdout
+        self.stderr = sys.stderr
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        sys.stderr = self.stderr
+
+    def test_capture(self):
+        capturer = OutputCapturer()
+        print 'Hello, world!'
+        sys.stderr.write('Error!')
+        assert_equals(capturer._release(), ('Hello, world!\n', 'Error!'))
+
+    def test_original_streams_are_restored(self):
+        OutputCapturer()._release()
+        assert_true(sys.stdout is self.stdout)
+        assert_true(sys.stderr is self.stderr)
+
+    def test_nothing_written(self):
+        assert_equals(OutputCapturer()._release(), (u'', u''))
+
+    def test_nested_captures(self):
+        outer = OutputCapturer()
+        print 'outer 1'
+        inner = OutputCapturer()
+        print 'inner'
+        assert_equals(inner._release(), ('inner\n', ''))
+        print 'outer 2'
+        assert_equals(outer._release(), ('outer 1\nouter 2\n', ''))
+        assert_true(sys.stdout is self.stdout)
+
+    def test_print_without_newline_does_not_affect_next_capture(self):
+        capturer = OutputCapturer()
+        print 'first',
+        assert_equals(capturer._release(), ('first', ''))
+        capturer = OutputCapturer()
+        print 'second'
+        assert_equals(capturer._release(), ('second\n', ''))
+
+    def test_non_string_and_non_ascii_output(self):
+        capturer = OutputCapturer()
+        sys.stdout.write(42)
+        sys.stdout.writelines([u'\xe4', ' ok'])
+        assert_equals(capturer._release(), (u'42\xe4 ok', ''))
+
+    def test_writing_after_release_fails(self):
+        capturer = OutputCapturer()
+        stream = sys.stdout
+        capturer._release()
+        assert_raises(ValueError, stream.write, 'too late')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import shutil
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+from StringIO import StringIO
+
+from robot import run
+from robot.result import ExecutionResult, Result, TestSuite as ResultSuite
+from robot.running import TestSuite
+from robot.running.parallel import (WorkUnits, WorkUnitSelector,
+                                    ParallelResultMerger,
+                                    OriginalOrderRestorer)
+from robot.utils.asserts import assert_equals
+
+
+CURDIR = dirname(abspath(__file__))
+DATADIR = join(CURDIR, '..', '..', 'atest', 'testdata', 'misc')
+
+
+def create_suite():
+    root = TestSuite(name='Root')
+    first = root.suites.create(name='First')
+    first.tests.create(name='T1')
+    first.tests.create(name='T2')
+    second = root.suites.create(name='Second')
+    second.tests.create(name='T3')
+    sub = second.suites.create(name='Sub')
+    for name in 'T4', 'T5', 'T6':
+        sub.tests.create(name=name)
+    return root
+
+
+class TestWorkUnits(unittest.TestCase):
+
+    def test_suite_level(self):
+        units = WorkUnits(create_suite())
+        assert_equals([u.id for u in units], ['s1-s1', 's1-s2', 's1-s2-s1'])
+        assert_equals([u.weight for u in units], [2, 1, 3])
+
+    def test_test_level(self):
+        units = WorkUnits(create_suite(), 'test')
+        assert_equals(len(units), 6)
+        assert_equals(units._units[0].id, 's1-s1-t1')
+        assert_equals(units._units[-1].id, 's1-s2-s1-t3')
+
+    def test_partition_balances_weights(self):
+        units = WorkUnits(create_suite())
+        assert_equals(units.partition(2), [['s1-s2-s1'], ['s1-s1', 's1-s2']])
+
+    def test_partition_preserves_original_order_in_partitions(self):
+        units = WorkUnits(create_suite(), 'test')
+        assert_equals(units.partition(1), [[u.id for u in units]])
+
+    def test_partition_with_more_processes_than_units(self):
+        assert_equals(len(WorkUnits(create_suite()).partition(10)), 3)
+
+    def test_durations(self):
+        durations = {'Root.First.T1': 1000, 'Root.First.T2': 2000,
+                     'Root.Second.T3': 9000}
+        units = WorkUnits(create_suite(), durations=durations)
+        assert_equals([u.weight for u in units], [3000, 9000, 12000])
+        assert_equals(units.partition(2), [['s1-s2-s1'], ['s1-s1', 's1-s2']])
+
+
+class TestWorkUnitSelector(unittest.TestCase):
+
+    def test_select_suites_and_tests(self):
+        suite = create_suite()
+        suite.visit(WorkUnitSelector(['s1-s1', 's1-s2-s1-t2']))
+        suite.remove_empty_suites()
+        assert_equals([t.name for t in suite.suites[0].tests], ['T1', 'T2'])
+        assert_equals([t.name for t in suite.suites[1].tests], [])
+        assert_equals([t.name for t in suite.suites[1].suites[0].tests], ['T5'])
+
+
+class TestResultCombining(unittest.TestCase):
+
+    def _result(self, *paths):
+        suite = ResultSuite(name='Root', starttime='20140101 12:00:00.000',
+                            endtime='20140101 12:00:01.000')
+        for path in paths:
+            parent = suite
+            for name in path[:-1]:
+                existing = [s for s in parent.suites if s.name == name]
+                parent = existing[0] if existing else \
+                    parent.suites.create(name=name)
+            parent.tests.create(name=path[-1], status='PASS')
+        return Result(root_suite=suite)
+
+    def test_combine_and_restore_order(self):
+        result = self._result(('Second', 'Sub', 'T6'), ('First', 'T2'))
+        other = self._result(('Second', 'T3'), ('Second', 'Sub', 'T4'),
+                             ('First', 'T1'))
+        other.suite.endtime = '20140101 12:00:05.000'
+        ParallelResultMerger(result).merge(other)
+        create_suite().visit(OriginalOrderRestorer(result.suite))
+        root = result.suite
+        assert_equals([s.name for s in root.suites], ['First', 'Second'])
+        assert_equals([t.name for t in root.suites[0].tests], ['T1', 'T2'])
+        assert_equals([t.name for t in root.suites[1].tests], ['T3'])
+        assert_equals([t.name for t in root.suites[1].suites[0].tests],
+                      ['T4', 'T6'])
+        assert_equals(root.endtime, '20140101 12:00:05.000')
+        assert_equals(root.test_count, 5)
+
+
+class TestParallelRun(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_run_in_multiple_processes(self):
+        output = join(self.tempdir, 'output.xml')
+        rc = run(join(DATADIR, 'suites'), join(DATADIR, 'pass_and_fail.txt'),
+                 processes=2, splitlevel='test', output=output,
+                 log='NONE', report='NONE', stdout=StringIO())
+        assert_equals(rc, 2)
+        suite = ExecutionResult(output).suite
+        assert_equals(suite.name, 'Suites & Pass And Fail')
+        assert_equals([s.name for s in suite.suites],
+                      ['Suites', 'Pass And Fail'])
+        assert_equals(suite.test_count, 13)
+        assert_equals([t.name for t in suite.suites[1].tests],
+                      ['Pass', 'Fail'])
+
+
+if __name__ == '__main__':
+    unittest.main()
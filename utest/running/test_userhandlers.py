@@ -1,7 +1,7 @@
 import unittest
 
 from robot.running.userkeyword import UserKeywordHandler, \
-    EmbeddedArgsTemplate, EmbeddedArgs
+    EmbeddedArgsTemplate, EmbeddedArgs, EmbeddedArgsTemplates
 from robot.running.arguments import UserKeywordArgumentParser
 from robot.utils.asserts import *
 from robot.errors import DataError
@@ -122,6 +122,45 @@ class TestEmbeddedArgs(unittest.TestCase):
             assert_true(hasattr(embedded, attr), "'%s' missing" % attr)
 
 
+class TestEmbeddedArgsTemplates(unittest.TestCase):
+
+    def setUp(self):
+        self.names = ['User selects ${item} from list',
+                      '${x} * ${y} from "${z}"',
+                      'User ${action} ${item} from list',
+                      'User selects ${item}',
+                      'Other ${thing}']
+        self.templates = EmbeddedArgsTemplates()
+        for name in self.names:
+            self.templates.add(EAT(name))
+
+    def test_prefix_and_suffix(self):
+        template = EAT('User selects ${item} from ${list}.')
+        assert_equals(template.name_prefix, 'User selects ')
+        assert_equals(template.name_suffix, '.')
+
+    def test_match_returns_templates_in_original_order(self):
+        self._verify('User selects book from list', 0, 2, 3)
+        self._verify('User * book from "list"', 1)
+        self._verify('Other item', 4)
+
+    def test_match_is_case_insensitive(self):
+        self._verify('USER SELECTS book FROM LIST', 0, 2, 3)
+
+    def test_no_match(self):
+        self._verify('Nothing matches')
+        self._verify('')
+
+    def test_sequence_interface(self):
+        assert_equals(len(self.templates), 5)
+        assert_equals([t.name for t in self.templates], self.names)
+        assert_equals(self.templates[1].name, self.names[1])
+
+    def _verify(self, name, *expected):
+        assert_equals([t.name for t in self.templates.match(name)],
+                      [self.names[index] for index in expected])
+
+
 class TestGetArgSpec(unittest.TestCase):
 
     def test_no_args(self):
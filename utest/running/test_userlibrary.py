@@ -21,6 +21,7 @@ class EmbeddedArgsTemplateStub:
         self.name = kwdata.name
         if kwdata.name != 'Embedded ${arg}':
             raise TypeError
+        self.name_prefix, self.name_suffix = 'Embedded ', ''
 
 
 class TestUserLibrary(unittest.TestCase):
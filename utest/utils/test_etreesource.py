@@ -1,6 +1,8 @@
 from __future__ import with_statement
+import gzip
 import os
 import sys
+import tempfile
 import unittest
 
 from robot.utils.asserts import assert_equals, assert_raises, assert_true
@@ -34,6 +36,22 @@ class TestETSource(unittest.TestCase):
         self._verify_string_representation(source, PATH)
         assert_true(source._opened is None)
 
+    if not IRONPYTHON:
+
+        def test_gzip_compressed_file(self):
+            path = os.path.join(tempfile.gettempdir(), 'test_etreesource.xml.gz')
+            output = gzip.open(path, 'wb')
+            output.write('<tag>content</tag>')
+            output.close()
+            try:
+                source = ETSource(path)
+                with source as src:
+                    assert_equals(ET.parse(src).getroot().text, 'content')
+                self._verify_string_representation(source, path)
+                assert_true(source._opened.closed)
+            finally:
+                os.remove(path)
+
     def test_byte_string(self):
         self._test_string('\n<tag>content</tag>\n')
 
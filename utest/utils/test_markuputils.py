@@ -2,7 +2,8 @@ import unittest
 
 from robot.utils.asserts import assert_equals
 
-from robot.utils.markuputils import html_escape, html_format, attribute_escape
+from robot.utils.markuputils import (html_escape, html_format, attribute_escape,
+                                     xml_escape)
 from robot.utils.htmlformatters import TableFormatter
 
 _format_table = TableFormatter()._format_table
@@ -754,6 +755,22 @@ class TestAttributeEscape(unittest.TestCase):
         for c in u'\x00\x08\x0B\x0C\x0E\x1F\uFFFE\uFFFF':
             assert_equals(attribute_escape(c), '')
 
+    def test_carriage_return(self):
+        assert_equals(attribute_escape('a\r\nb'), 'a&#13;&#10;b')
+
+
+class TestXmlEscape(unittest.TestCase):
+
+    def test_nothing_to_escape(self):
+        for inp in ['', 'whatever', u'hyv\xe4', '"quotes"\n\tand\rmore']:
+            assert_equals(xml_escape(inp), inp)
+
+    def test_entities(self):
+        assert_equals(xml_escape('<a> & "b"'), '&lt;a&gt; &amp; "b"')
+
+    def test_illegal_chars_in_xml(self):
+        assert_equals(xml_escape(u'a\x00b\x1Fc\uFFFE'), 'abc')
+
 
 if __name__ == '__main__':
     unittest.main()
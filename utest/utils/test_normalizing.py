@@ -1,7 +1,8 @@
+import pickle
 import unittest
 from UserDict import UserDict
 
-from robot.utils import normalize, NormalizedDict
+from robot.utils import get_normalizer, normalize, NormalizedDict
 from robot.utils.asserts import (assert_equals, assert_true, assert_false,
                                  assert_raises)
 
@@ -43,6 +44,18 @@ class TestNormalizing(unittest.TestCase):
         assert_equals(normalize('Foo_\n bar\n', ignore=['\n'],
                                 spaceless=False), 'foo_ bar')
 
+    def test_get_normalizer(self):
+        normalizer = get_normalizer(ignore=['_'])
+        assert_equals(normalizer('Foo_ Bar'), 'foobar')
+        assert_equals(normalizer('Foo_ Bar'), 'foobar')
+        assert_true(get_normalizer(ignore=['_']) is normalizer)
+        assert_true(get_normalizer() is not normalizer)
+        assert_equals(get_normalizer(caseless=False)('Foo_ Bar'), 'Foo_Bar')
+
+    def test_normalizer_can_be_pickled(self):
+        normalizer = get_normalizer(ignore=['_'])
+        assert_true(pickle.loads(pickle.dumps(normalizer)) is normalizer)
+
 
 class TestNormalizedDict(unittest.TestCase):
 
@@ -278,6 +291,36 @@ class TestNormalizedDict(unittest.TestCase):
         nd.clear()
         assert_equals(nd.data, {})
         assert_equals(nd._keys, {})
+        assert_equals(nd.keys(), [])
+
+    def test_keys_are_updated_after_modifications(self):
+        nd = NormalizedDict({'b': 1})
+        assert_equals(nd.keys(), ['b'])
+        nd['A'] = 2
+        assert_equals(nd.keys(), ['A', 'b'])
+        nd.update({'c': 3})
+        assert_equals(nd.keys(), ['A', 'b', 'c'])
+        del nd['B']
+        assert_equals(nd.keys(), ['A', 'c'])
+        nd['a'] = 4
+        assert_equals(nd.keys(), ['A', 'c'])
+
+    def test_normalization_cache_is_bounded(self):
+        nd = NormalizedDict()
+        normalizer = nd._normalize
+        for index in range(normalizer._max_cache_size + 1):
+            nd['Key %d' % index] = index
+        assert_true(len(normalizer._cache) <= normalizer._max_cache_size)
+        assert_equals(nd['key0'], 0)
+        assert_equals(nd['KEY %d' % normalizer._max_cache_size],
+                      normalizer._max_cache_size)
+
+    def test_pickle(self):
+        nd = NormalizedDict({'A': 1, 'b': 2}, ignore=['_'])
+        unpickled = pickle.loads(pickle.dumps(nd))
+        assert_equals(unpickled.items(), [('A', 1), ('b', 2)])
+        assert_equals(unpickled['_a_'], 1)
+        assert_true(unpickled._normalize is nd._normalize)
 
 
 if __name__ == '__main__':
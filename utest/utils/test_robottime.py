@@ -10,6 +10,8 @@ from robot.utils.robottime import (timestr_to_secs, secs_to_timestr, get_time,
                                    parse_time, format_time, get_elapsed_time,
                                    get_timestamp, get_start_timestamp,
                                    timestamp_to_secs, elapsed_time_to_string,
+                                   get_epoch_millis, millis_to_timestamp,
+                                   timestamp_to_millis, Timestamp,
                                    _get_timetuple)
 
 
@@ -351,6 +353,82 @@ class TestTime(unittest.TestCase):
         assert_true(re.match('\d{8} \d\d:\d\d:\d\d', get_timestamp(millissep=None)))
         assert_true(re.match('\d{8} \d\d:\d\d:\d\d', get_timestamp(millissep=None)))
 
+    def test_get_epoch_millis(self):
+        before = int(time.time() * 1000)
+        millis = get_epoch_millis()
+        assert_true(isinstance(millis, (int, long)))
+        assert_true(before - 1 <= millis <= int(time.time() * 1000) + 1)
+        assert_true(get_epoch_millis() >= millis)
+
+    def test_millis_to_timestamp(self):
+        millis = int(EXAMPLE_TIME * 1000) + 42
+        assert_equal(millis_to_timestamp(millis), '20070920 16:15:14.042')
+        assert_equal(millis_to_timestamp(millis + 1000, '-', 'T', '', None),
+                     '2007-09-20T161515')
+
+    def test_timestamp_to_millis(self):
+        millis = int(EXAMPLE_TIME * 1000)
+        for timestamp, seps, expected in [
+                ('20070920 16:15:14.000', None, millis),
+                ('20070920 16:15:14.042', None, millis + 42),
+                ('20070920 16:15:14.999', None, millis + 999),
+                ('20070920 16:15:15.001', None, millis + 1001),
+                ('2007-09-20#16x15x14M042', ('-', '#', 'x', 'M'), millis + 42)]:
+            assert_equal(timestamp_to_millis(timestamp, seps), expected)
+
+    def test_timestamp_to_millis_with_invalid(self):
+        for timestamp in ['', 'N/A', '20070920 16:15:1x.000']:
+            assert_raises_with_msg(ValueError,
+                                   "Invalid timestamp '%s'" % timestamp,
+                                   timestamp_to_millis, timestamp)
+
+    def test_millis_to_timestamp_and_back(self):
+        millis = get_epoch_millis()
+        assert_equal(timestamp_to_millis(millis_to_timestamp(millis)), millis)
+
+    def test_get_elapsed_time_with_millis(self):
+        millis = int(EXAMPLE_TIME * 1000)
+        assert_equal(get_elapsed_time(millis, millis + 1234), 1234)
+        assert_equal(get_elapsed_time(millis, '20070920 16:15:15.234'), 1234)
+        assert_equal(get_elapsed_time(None, millis), 0)
+
+
+class TestTimestampDescriptor(unittest.TestCase):
+
+    class Item(object):
+        timestamp = Timestamp('_timestamp')
+        timestamp_millis = Timestamp('_timestamp', millis=True)
+
+    def setUp(self):
+        self.item = self.Item()
+        self.millis = int(EXAMPLE_TIME * 1000) + 42
+
+    def test_set_string(self):
+        self.item.timestamp = '20070920 16:15:14.042'
+        assert_equal(self.item._timestamp, '20070920 16:15:14.042')
+        assert_equal(self.item.timestamp, '20070920 16:15:14.042')
+        assert_equal(self.item.timestamp_millis, self.millis)
+
+    def test_set_millis(self):
+        self.item.timestamp_millis = self.millis
+        assert_equal(self.item.timestamp, '20070920 16:15:14.042')
+        assert_equal(self.item.timestamp_millis, self.millis)
+
+    def test_set_invalid_or_empty(self):
+        for value in ['N/A', '', None]:
+            self.item.timestamp = value
+            assert_equal(self.item.timestamp, value)
+            assert_equal(self.item.timestamp_millis, None)
+
+    def test_strings_are_not_normalized(self):
+        # Day does not exist but the string must be written back as-is.
+        self.item.timestamp = '20070230 16:15:14.042'
+        assert_equal(self.item.timestamp, '20070230 16:15:14.042')
+
+    def test_not_set(self):
+        assert_equal(self.item.timestamp, None)
+        assert_equal(self.item.timestamp_millis, None)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import time
 import unittest
 
@@ -51,6 +52,54 @@ class TestTimestamp(unittest.TestCase):
         assert_equals(cache.get_timestamp(timesep='', millissep='X'),
                       '20120604 163026X001')
 
+    def test_epoch_millis(self):
+        cache = FakeTimestampCache(1338816626.0)
+        millis = cache.get_epoch_millis()
+        cache.epoch += 0.5
+        assert_equals(cache.get_epoch_millis(), millis + 500)
+
+    def test_epoch_millis_when_clock_is_turned_back(self):
+        cache = FakeTimestampCache(1338816626.0)
+        millis = cache.get_epoch_millis()
+        cache.epoch -= 3600
+        assert_equals(cache.get_epoch_millis(), millis)
+        cache.epoch += 0.5
+        assert_equals(cache.get_epoch_millis(), millis + 500)
+        cache.epoch -= 0.1
+        assert_equals(cache.get_epoch_millis(), millis + 500)
+        cache.epoch += 0.2
+        assert_equals(cache.get_epoch_millis(), millis + 700)
+
+    def test_timestamp_when_clock_is_turned_back(self):
+        cache = FakeTimestampCache(1338816626.5)
+        assert_equals(cache.get_timestamp(), '20120604 16:30:26.500')
+        cache.epoch -= 3600
+        assert_equals(cache.get_timestamp(), '20120604 16:30:26.500')
+        cache.epoch += 0.25
+        assert_equals(cache.get_timestamp(), '20120604 16:30:26.750')
+        assert_equals(cache.millis_to_timestamp(cache.get_epoch_millis()),
+                      '20120604 16:30:26.750')
+
+    def test_clock_is_shared_by_threads(self):
+        cache = FakeTimestampCache(1338816626.0)
+        results = []
+        def get_millis():
+            values = []
+            for index in range(1000):
+                if index % 100 == 0:
+                    cache.epoch -= 1
+                else:
+                    cache.epoch += 0.001
+                values.append(cache.get_epoch_millis())
+            results.append(values)
+        threads = [threading.Thread(target=get_millis) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for values in results:
+            assert_equals(values, sorted(values))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 from __future__ import with_statement
+import gzip
 import os
 import unittest
 import tempfile
+from StringIO import StringIO
 
 from robot.utils import XmlWriter, ET, ETSource
 from robot.utils.asserts import *
@@ -108,6 +110,55 @@ class TestXmlWriter(unittest.TestCase):
         self._verify_content('encoding="ISO-8859-1"')
         self._verify_node(None, 'test', u'hyv\xe4')
 
+    def test_output_is_buffered(self):
+        self.writer.element('root', 'content')
+        assert_equals(self._get_written_size(), 0)
+        self.writer.flush()
+        assert_true(self._get_written_size() > 0)
+        self._verify_content('<root>content</root>')
+
+    def test_buffer_is_written_when_it_is_full(self):
+        self.writer.close()
+        self.writer = XmlWriter(PATH, buffer_size=100)
+        self.writer.start('root')
+        assert_equals(self._get_written_size(), 0)
+        self.writer.element('e', 'x' * 100)
+        assert_true(self._get_written_size() > 100)
+        self.writer.end('root')
+        self._verify_node(self._get_root().find('e'), 'e', 'x' * 100)
+
+    def test_opened_file_is_not_buffered_by_default(self):
+        output = StringIO()
+        XmlWriter(output).element('root', 'content')
+        assert_true('<root>content</root>' in output.getvalue())
+        output = StringIO()
+        writer = XmlWriter(output, buffer_size=1024)
+        writer.element('root', 'content')
+        assert_true('<root>' not in output.getvalue())
+        writer.flush()
+        assert_true('<root>content</root>' in output.getvalue())
+
+    def test_gzip(self):
+        path = PATH + '.gz'
+        writer = XmlWriter(path)
+        writer.start('root')
+        writer.element(u'e', u'Hyv\xE4\xE4 \xFC\xF6t\xE4', {'a': 'b'})
+        writer.end('root')
+        writer.close()
+        try:
+            with open(path, 'rb') as f:
+                assert_equals(f.read(2), '\x1f\x8b')
+            with ETSource(path) as source:
+                root = ET.parse(source).getroot()
+        finally:
+            os.remove(path)
+        self._verify_node(root.find('e'), 'e', u'Hyv\xE4\xE4 \xFC\xF6t\xE4',
+                          {'a': 'b'})
+
+    def _get_written_size(self):
+        self.writer.output.flush()
+        return os.path.getsize(PATH)
+
     def _verify_node(self, node, name, text=None, attrs={}):
         if node is None:
             node = self._get_root()
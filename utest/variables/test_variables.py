@@ -295,6 +295,46 @@ class TestVariables(unittest.TestCase):
         assert_equals(copy['${foo}'], 'bar')
         assert_equals(copy._identifiers, ['$'])
 
+    def test_new_scope(self):
+        self.varz['${foo}'] = 'bar'
+        self.varz['${Old}'] = 'value'
+        scope = self.varz.new_scope()
+        scope['${new}'] = 'new'
+        scope['${foo}'] = 'overridden'
+        assert_equals(scope['${foo}'], 'overridden')
+        assert_equals(scope['${o_l_d}'], 'value')
+        assert_equals(self.varz['${foo}'], 'bar')
+        assert_false(self.varz.has_key('${new}'))
+        assert_equals(sorted(scope.keys()), ['${Old}', '${foo}', '${new}'])
+        assert_equals(len(scope), 3)
+        assert_equals(scope.copy().items(), scope.items())
+
+    def test_new_scope_sees_non_overridden_changes_in_parent(self):
+        scope = self.varz.new_scope()
+        nested = scope.new_scope()
+        self.varz['${foo}'] = 'bar'
+        assert_equals(nested['${foo}'], 'bar')
+        scope['${foo}'] = 'scope'
+        assert_equals(nested['${foo}'], 'scope')
+        nested['${foo}'] = 'nested'
+        self.varz['${foo}'] = 'changed'
+        assert_equals(nested['${foo}'], 'nested')
+        assert_equals(nested.keys(), ['${foo}'])
+        self.varz['${bar}'] = 'new'
+        assert_equals(nested.keys(), ['${bar}', '${foo}'])
+
+    def test_removing_from_new_scope(self):
+        self.varz['${foo}'] = 'bar'
+        scope = self.varz.new_scope()
+        scope.pop('${foo}')
+        assert_false(scope.has_key('${foo}'))
+        assert_equals(scope.keys(), [])
+        assert_false(scope)
+        assert_equals(self.varz['${foo}'], 'bar')
+        scope['${foo}'] = 'new'
+        assert_equals(scope['${foo}'], 'new')
+        assert_true(scope)
+
     if utils.is_jython:
 
         def test_variable_as_object_in_java(self):